@@ -0,0 +1,144 @@
+"""
+Benchmark fetch detail video: sinkron vs async.
+
+Script ini menjalankan server lokal pengganti YouTube Data API (dengan
+latency buatan) lalu membandingkan wall-clock get_video_details (batch
+berurutan) dengan get_video_details_async (batch concurrent).
+
+Tidak butuh API key maupun koneksi internet. Database dan response cache
+produksi tidak disentuh (database sementara, cache dimatikan).
+
+Contoh:
+    python benchmark_api.py --videos 300 --latency 0.3
+"""
+
+import argparse
+import asyncio
+import json
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlparse, parse_qs
+
+
+class FakeYouTubeHandler(BaseHTTPRequestHandler):
+    """Handler yang meniru response videos.list dan channels.list."""
+
+    latency = 0.3
+
+    def do_GET(self):
+        """Balas request dengan item palsu untuk setiap ID."""
+        time.sleep(self.latency)
+
+        url = urlparse(self.path)
+        params = parse_qs(url.query)
+        ids = params.get("id", [""])[0].split(",")
+        endpoint = url.path.rstrip("/").rsplit("/", 1)[-1]
+
+        if endpoint == "videos":
+            items = [fake_video_item(item_id) for item_id in ids if item_id]
+        elif endpoint == "channels":
+            items = [fake_channel_item(item_id) for item_id in ids if item_id]
+        else:
+            items = []
+
+        body = json.dumps({"items": items}).encode("utf-8")
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        """Matikan access log supaya output benchmark bersih."""
+        pass
+
+
+def fake_video_item(video_id: str) -> dict:
+    """Buat item videos.list palsu."""
+    return {
+        "id": video_id,
+        "snippet": {
+            "title": f"Video {video_id}",
+            "channelId": f"UC{video_id}",
+            "channelTitle": f"Channel {video_id}",
+            "publishedAt": "2026-01-01T00:00:00Z",
+            "description": "Benchmark video",
+            "thumbnails": {"high": {"url": f"https://i.ytimg.com/vi/{video_id}/hq.jpg"}},
+        },
+        "statistics": {"viewCount": "100000", "likeCount": "1000"},
+    }
+
+
+def fake_channel_item(channel_id: str) -> dict:
+    """Buat item channels.list palsu."""
+    return {
+        "id": channel_id,
+        "snippet": {"country": "US"},
+        "statistics": {"subscriberCount": "10000"},
+    }
+
+
+def start_server(latency: float) -> ThreadingHTTPServer:
+    """Jalankan server lokal di background thread."""
+    FakeYouTubeHandler.latency = latency
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeYouTubeHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+def main():
+    """Jalankan benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark fetch detail YouTube API")
+    parser.add_argument("--videos", type=int, default=300, help="Jumlah video ID")
+    parser.add_argument("--latency", type=float, default=0.3, help="Latency server (detik)")
+    args = parser.parse_args()
+
+    from hunterbot.config import Config
+
+    # Database sementara: ledger quota benchmark tidak masuk hunterbot.db
+    workdir = tempfile.mkdtemp(prefix="hunterbot_benchmark_")
+    Config.DATABASE_PATH = str(Path(workdir) / "hunterbot.db")
+    # Tanpa response cache supaya pass async tidak dilayani dari hasil pass sync
+    Config.YOUTUBE_CACHE_ENABLED = False
+
+    from hunterbot.api.youtube_api import YouTubeAPI
+    from hunterbot.database.schema import init_database
+
+    init_database().close()
+
+    server = start_server(args.latency)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    api = YouTubeAPI(api_key="benchmark", base_url=base_url)
+
+    video_ids = [f"vid{i:08d}" for i in range(args.videos)]
+
+    print("=" * 50)
+    print("BENCHMARK FETCH DETAIL VIDEO")
+    print("=" * 50)
+    print(f"Video: {args.videos}, latency server: {args.latency}s")
+    print()
+
+    start = time.perf_counter()
+    sync_result = api.get_video_details(video_ids)
+    sync_elapsed = time.perf_counter() - start
+    print(f"[SYNC]  {len(sync_result)} videos dalam {sync_elapsed:.2f}s")
+
+    start = time.perf_counter()
+    async_result = asyncio.run(api.get_video_details_async(video_ids))
+    async_elapsed = time.perf_counter() - start
+    print(f"[ASYNC] {len(async_result)} videos dalam {async_elapsed:.2f}s")
+
+    if async_elapsed > 0:
+        print()
+        print(f"Speedup: {sync_elapsed / async_elapsed:.1f}x")
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
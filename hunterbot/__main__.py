@@ -0,0 +1,9 @@
+"""
+Entry point `python -m hunterbot` (lihat hunterbot.cli).
+"""
+
+import sys
+
+from hunterbot.cli import main
+
+sys.exit(main())
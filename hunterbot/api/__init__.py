@@ -2,6 +2,63 @@
 Package API untuk integrasi eksternal.
 """
 
+from hunterbot.api.channel_cache import ChannelCache, get_channel_cache
+from hunterbot.api.exceptions import (
+    YouTubeAPIError,
+    QuotaExceededException,
+    RateLimitedError,
+    CircuitOpenError,
+)
+from hunterbot.api.http_pool import HTTPPool, PooledHTTPAdapter, get_http_pool
+from hunterbot.api.key_pool import KeyPool
+from hunterbot.api.records import VideoRecord, VideoStats, ChannelRecord, SearchPage, VideoSnippet
+from hunterbot.api.rate_limiter import QuotaRateLimiter, get_rate_limiter
+from hunterbot.api.resilience import (
+    RetryPolicy,
+    CircuitBreaker,
+    VideoBatchResult,
+    ChannelBatchResult,
+    get_circuit_breaker,
+)
+from hunterbot.api.response_cache import ResponseCache, get_response_cache
+from hunterbot.api.transport import (
+    Cassette,
+    RecordingAdapter,
+    ReplayAdapter,
+    build_transport,
+    get_transport,
+)
 from hunterbot.api.youtube_api import YouTubeAPI
 
-__all__ = ["YouTubeAPI"]
+__all__ = [
+    "YouTubeAPI",
+    "YouTubeAPIError",
+    "QuotaExceededException",
+    "RateLimitedError",
+    "CircuitOpenError",
+    "KeyPool",
+    "QuotaRateLimiter",
+    "get_rate_limiter",
+    "ResponseCache",
+    "get_response_cache",
+    "ChannelCache",
+    "get_channel_cache",
+    "HTTPPool",
+    "PooledHTTPAdapter",
+    "get_http_pool",
+    "RetryPolicy",
+    "CircuitBreaker",
+    "VideoBatchResult",
+    "ChannelBatchResult",
+    "get_circuit_breaker",
+    "Cassette",
+    "RecordingAdapter",
+    "ReplayAdapter",
+    "build_transport",
+    "get_transport",
+    "VideoRecord",
+    "VideoStats",
+    "ChannelRecord",
+    "SearchPage",
+    "VideoSnippet",
+]
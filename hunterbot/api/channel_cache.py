@@ -0,0 +1,206 @@
+"""
+Cache metadata channel YouTube.
+
+Subscriber count dan lokasi channel berubah lambat, jadi disimpan di:
+1. LRU in-process (paling cepat, shared antar YouTubeAPI instance)
+2. Tabel channels di SQLite (persisten antar run, dengan fetched_at)
+
+Lookup paralel untuk channel ID yang sama digabung (coalesced) menjadi
+satu request channels.list.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Dict, Any, List, Optional, Tuple
+
+from hunterbot.config import Config
+from hunterbot.database.models import Channel
+from hunterbot.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class ChannelCache:
+    """
+    Cache channel dua lapis (LRU + tabel channels) dengan TTL.
+
+    Alur pemakaian oleh YouTubeAPI:
+    1. lookup() -> channel yang masih fresh + ID yang perlu difetch
+    2. claim() -> ID yang harus difetch sendiri + Future untuk ID yang
+       sedang difetch thread/task lain
+    3. complete() / fail() setelah request selesai
+    """
+
+    def __init__(self, ttl: int = None, max_size: int = None):
+        """
+        Inisialisasi channel cache.
+
+        Args:
+            ttl: Umur maksimal data channel (detik). Default dari Config.
+            max_size: Kapasitas LRU in-process. Default dari Config.
+        """
+        self.ttl = ttl if ttl is not None else Config.CHANNEL_CACHE_TTL
+        self.max_size = max_size if max_size is not None else Config.CHANNEL_LRU_SIZE
+
+        self._lock = threading.Lock()
+        self._lru: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._inflight: Dict[str, Future] = {}
+
+        self.memory_hits = 0
+        self.db_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def lookup(self, channel_ids: List[str]) -> Tuple[Dict[str, dict], List[str]]:
+        """
+        Ambil channel yang masih fresh dari LRU lalu dari database.
+
+        Args:
+            channel_ids: List channel ID.
+
+        Returns:
+            Tuple (found, missing): found = channel_id -> {subscriber_count,
+            location}; missing = ID yang belum ada atau sudah kadaluarsa.
+        """
+        min_fetched_at = time.time() - self.ttl
+        found: Dict[str, dict] = {}
+        remaining: List[str] = []
+
+        with self._lock:
+            for channel_id in dict.fromkeys(channel_ids):
+                entry = self._lru.get(channel_id)
+                if entry is not None and entry["fetched_at"] >= min_fetched_at:
+                    self._lru.move_to_end(channel_id)
+                    found[channel_id] = self._public(entry)
+                    self.memory_hits += 1
+                else:
+                    remaining.append(channel_id)
+
+        if not remaining:
+            return found, []
+
+        from_db = Channel.get_many(remaining, min_fetched_at)
+        missing = []
+
+        with self._lock:
+            for channel_id in remaining:
+                entry = from_db.get(channel_id)
+                if entry is not None:
+                    self._remember(channel_id, entry)
+                    found[channel_id] = self._public(entry)
+                    self.db_hits += 1
+                else:
+                    missing.append(channel_id)
+                    self.misses += 1
+
+        return found, missing
+
+    def claim(self, channel_ids: List[str]) -> Tuple[List[str], Dict[str, Future]]:
+        """
+        Bagi ID menjadi yang harus difetch sendiri dan yang sedang difetch pihak lain.
+
+        Args:
+            channel_ids: List channel ID yang missing.
+
+        Returns:
+            Tuple (to_fetch, pending): pending = channel_id -> Future
+            yang akan berisi data channel (atau None jika tidak ditemukan).
+        """
+        to_fetch: List[str] = []
+        pending: Dict[str, Future] = {}
+
+        with self._lock:
+            for channel_id in channel_ids:
+                future = self._inflight.get(channel_id)
+                if future is not None:
+                    pending[channel_id] = future
+                    self.coalesced += 1
+                else:
+                    self._inflight[channel_id] = Future()
+                    to_fetch.append(channel_id)
+
+        return to_fetch, pending
+
+    def complete(self, channel_ids: List[str], fetched: Dict[str, dict]) -> None:
+        """
+        Simpan hasil fetch dan bangunkan lookup lain yang menunggu ID ini.
+
+        Args:
+            channel_ids: ID yang sebelumnya di-claim.
+            fetched: Hasil channels.list (channel_id -> data).
+        """
+        now = time.time()
+        Channel.save_many(fetched, now)
+        logger.debug(f"Channel cache: {len(fetched)} channel disimpan")
+
+        with self._lock:
+            for channel_id, data in fetched.items():
+                self._remember(channel_id, {**data, "fetched_at": now})
+
+            futures = [(channel_id, self._inflight.pop(channel_id, None)) for channel_id in channel_ids]
+
+        for channel_id, future in futures:
+            if future is not None:
+                future.set_result(fetched.get(channel_id))
+
+    def fail(self, channel_ids: List[str], error: BaseException) -> None:
+        """
+        Lepas claim yang gagal supaya lookup yang menunggu ikut menerima error.
+
+        Args:
+            channel_ids: ID yang sebelumnya di-claim.
+            error: Exception dari fetch.
+        """
+        with self._lock:
+            futures = [self._inflight.pop(channel_id, None) for channel_id in channel_ids]
+
+        for future in futures:
+            if future is not None:
+                future.set_exception(error)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Counter cache sejak proses dimulai.
+
+        Returns:
+            Dict memory_hits, db_hits, misses, coalesced, size.
+        """
+        with self._lock:
+            return {
+                "memory_hits": self.memory_hits,
+                "db_hits": self.db_hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "size": len(self._lru),
+            }
+
+    def _remember(self, channel_id: str, entry: Dict[str, Any]) -> None:
+        """Masukkan entry ke LRU (harus dipanggil di bawah lock)."""
+        self._lru[channel_id] = entry
+        self._lru.move_to_end(channel_id)
+        while len(self._lru) > self.max_size:
+            self._lru.popitem(last=False)
+
+    @staticmethod
+    def _public(entry: Dict[str, Any]) -> Dict[str, Any]:
+        """Bentuk data channel yang dikembalikan ke pemanggil."""
+        return {
+            "subscriber_count": entry["subscriber_count"],
+            "location": entry["location"],
+        }
+
+
+# Singleton instance
+_channel_cache_instance: Optional[ChannelCache] = None
+_channel_cache_lock = threading.Lock()
+
+
+def get_channel_cache() -> ChannelCache:
+    """Get or create ChannelCache singleton instance."""
+    global _channel_cache_instance
+    with _channel_cache_lock:
+        if _channel_cache_instance is None:
+            _channel_cache_instance = ChannelCache()
+        return _channel_cache_instance
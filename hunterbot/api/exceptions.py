@@ -0,0 +1,26 @@
+"""
+Exception untuk integrasi YouTube Data API.
+
+Dipisah dari youtube_api.py supaya bisa dipakai komponen lain di package
+api (rate limiter, dll) tanpa circular import.
+"""
+
+
+class YouTubeAPIError(Exception):
+    """Exception untuk error YouTube API."""
+    pass
+
+
+class QuotaExceededException(YouTubeAPIError):
+    """Exception ketika quota YouTube API habis."""
+    pass
+
+
+class RateLimitedError(YouTubeAPIError):
+    """Exception ketika YouTube menolak request karena rate limit (bisa di-retry)."""
+    pass
+
+
+class CircuitOpenError(YouTubeAPIError):
+    """Exception ketika circuit breaker terbuka (YouTube API dianggap sedang down)."""
+    pass
@@ -0,0 +1,182 @@
+"""
+Connection pool HTTP shared untuk semua YouTubeAPI instance.
+
+Sebelumnya setiap YouTubeAPI (dan setiap HunterModule) membuat
+requests.Session sendiri dengan adapter default (10 koneksi), jadi hunt
+paralel tidak pernah memakai ulang koneksi TLS yang sudah hangat dan
+request ke-11 dst. membuka koneksi baru yang langsung dibuang.
+
+HTTPPool menyimpan satu requests.Session per proses dengan:
+- PooledHTTPAdapter: ukuran pool sesuai jumlah worker paralel
+- keep-alive (HTTP dan TCP) supaya koneksi tetap hidup antar request
+- negosiasi gzip (Google API hanya mengompres jika User-Agent memuat "gzip")
+- statistik pemakaian ulang koneksi
+"""
+
+import socket
+import threading
+from typing import Dict, Any, Optional
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+from hunterbot.config import Config
+from hunterbot.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Header default semua request YouTube
+DEFAULT_HEADERS = {
+    "Accept-Encoding": "gzip",
+    "Connection": "keep-alive",
+    "User-Agent": "hunterbot/1.0 (gzip)",
+}
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter dengan ukuran pool dari Config, TCP keep-alive, dan statistik.
+
+    Statistik diambil dari connection pool urllib3 (jumlah request dan
+    koneksi yang dibuka per host), jadi tidak menambah kerja per request.
+    """
+
+    def __init__(
+        self,
+        pool_maxsize: int = None,
+        pool_block: bool = None,
+        tcp_keepalive: bool = None,
+        **kwargs
+    ):
+        """
+        Inisialisasi adapter.
+
+        Args:
+            pool_maxsize: Koneksi yang disimpan per host. Default dari Config.
+            pool_block: Tunggu koneksi bebas saat pool penuh (bukan membuka
+                koneksi sementara). Default dari Config.
+            tcp_keepalive: Aktifkan SO_KEEPALIVE. Default dari Config.
+            **kwargs: Diteruskan ke HTTPAdapter.
+        """
+        self.tcp_keepalive = tcp_keepalive if tcp_keepalive is not None else Config.YOUTUBE_HTTP_TCP_KEEPALIVE
+        super().__init__(
+            pool_maxsize=pool_maxsize or Config.YOUTUBE_HTTP_POOL_SIZE,
+            pool_block=pool_block if pool_block is not None else Config.YOUTUBE_HTTP_POOL_BLOCK,
+            **kwargs
+        )
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        """Buat PoolManager (ditambah socket option keep-alive jika aktif)."""
+        if self.tcp_keepalive:
+            pool_kwargs.setdefault(
+                "socket_options",
+                HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+            )
+        super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Statistik pemakaian koneksi.
+
+        Pool host yang sudah dikeluarkan PoolManager (lebih dari
+        pool_connections host berbeda) tidak lagi ikut dihitung.
+
+        Returns:
+            Dict hosts, requests, connections_opened, reused, reuse_ratio,
+            idle, pool_maxsize.
+        """
+        pools = self.poolmanager.pools
+        with pools.lock:
+            host_pools = [pools[key] for key in pools.keys()]
+
+        requests_sent = sum(pool.num_requests for pool in host_pools)
+        opened = sum(pool.num_connections for pool in host_pools)
+        idle = 0
+        for pool in host_pools:
+            if pool.pool is None:
+                continue
+            # Queue urllib3 diisi None untuk slot yang belum punya koneksi
+            with pool.pool.mutex:
+                idle += sum(1 for conn in pool.pool.queue if conn is not None)
+        reused = max(0, requests_sent - opened)
+
+        return {
+            "hosts": len(host_pools),
+            "requests": requests_sent,
+            "connections_opened": opened,
+            "reused": reused,
+            "reuse_ratio": round(reused / requests_sent, 3) if requests_sent else 0.0,
+            "idle": idle,
+            "pool_maxsize": self._pool_maxsize,
+        }
+
+
+class HTTPPool:
+    """
+    Session HTTP shared (thread-safe) untuk semua client YouTube di proses.
+
+    PoolManager urllib3 aman dipakai dari banyak thread, jadi satu session
+    bisa dipakai bersama oleh request paralel (asyncio.to_thread) dan
+    oleh hunt yang berjalan di background.
+    """
+
+    def __init__(self, adapter: PooledHTTPAdapter = None):
+        """
+        Inisialisasi pool.
+
+        Args:
+            adapter: Adapter HTTP. Default PooledHTTPAdapter dari Config.
+        """
+        self.adapter = adapter or PooledHTTPAdapter()
+        self.session = self.new_session()
+        logger.info(f"HTTP pool diinisialisasi ({self.adapter._pool_maxsize} koneksi per host)")
+
+    def new_session(self, transport: Optional[BaseAdapter] = None, prefix: str = None) -> requests.Session:
+        """
+        Buat session baru yang memakai adapter shared pool ini.
+
+        Dipakai untuk client dengan transport sendiri (record/replay) supaya
+        transport itu tidak ikut ter-mount di session shared.
+
+        Args:
+            transport: Adapter tambahan (opsional).
+            prefix: URL prefix untuk transport (wajib jika transport diisi).
+
+        Returns:
+            requests.Session. Jangan di-close (adapter dipakai bersama).
+        """
+        session = requests.Session()
+        session.headers.update(DEFAULT_HEADERS)
+        session.mount("https://", self.adapter)
+        session.mount("http://", self.adapter)
+        if transport is not None:
+            session.mount(prefix, transport)
+        return session
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Statistik pemakaian ulang koneksi.
+
+        Returns:
+            Dict dari PooledHTTPAdapter.stats().
+        """
+        return self.adapter.stats()
+
+    def close(self) -> None:
+        """Tutup semua koneksi di pool."""
+        self.adapter.close()
+
+
+# Singleton instance
+_pool_instance: Optional[HTTPPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_http_pool() -> HTTPPool:
+    """Get or create HTTPPool singleton instance."""
+    global _pool_instance
+    with _pool_lock:
+        if _pool_instance is None:
+            _pool_instance = HTTPPool()
+        return _pool_instance
@@ -0,0 +1,222 @@
+"""
+Pool API key YouTube (Guardian di PRD).
+
+Module ini mengelola beberapa API key sekaligus:
+- Sisa quota harian per key (lewat rate limiter masing-masing key)
+- Routing request ke key dengan headroom terbesar
+- Failover transparan kalau satu key kena quotaExceeded
+- Request tersebar ke beberapa key, jadi throughput naik sesuai jumlah key
+- Jatah unit proses (rate_limiter.UnitBudget) kalau diatur
+"""
+
+import asyncio
+import hashlib
+import threading
+import time
+from typing import List, NamedTuple, Optional, Tuple
+
+from hunterbot.api.exceptions import QuotaExceededException
+from hunterbot.api.rate_limiter import QuotaRateLimiter, get_rate_limiter, get_unit_budget
+from hunterbot.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def key_fingerprint(api_key: str) -> str:
+    """
+    Identitas pendek API key (tanpa membocorkan key-nya).
+
+    Args:
+        api_key: YouTube Data API key.
+
+    Returns:
+        8 karakter hex dari SHA-1 key.
+    """
+    return hashlib.sha1(api_key.encode("utf-8")).hexdigest()[:8]
+
+
+class KeySlot(NamedTuple):
+    """Satu API key beserta limiter-nya."""
+
+    api_key: str
+    key_id: str
+    rate_limiter: QuotaRateLimiter
+
+
+class KeyPool:
+    """
+    Pool API key dengan quota tracking per key.
+
+    Setiap key punya QuotaRateLimiter sendiri (request per detik + unit
+    harian). acquire() memilih key dengan sisa unit terbanyak yang bisa
+    dipakai sekarang; kalau key itu sedang penuh (request per detik),
+    key berikutnya dicoba, sehingga request paralel tersebar ke semua key.
+    """
+
+    def __init__(self, api_keys: List[str], rate_limiter: QuotaRateLimiter = None):
+        """
+        Inisialisasi key pool.
+
+        Args:
+            api_keys: List YouTube Data API key (duplikat diabaikan).
+            rate_limiter: Limiter custom untuk semua key (opsional, untuk testing).
+
+        Raises:
+            ValueError: Jika tidak ada API key.
+        """
+        unique_keys = list(dict.fromkeys(key for key in api_keys if key))
+        if not unique_keys:
+            raise ValueError("YouTube API key tidak boleh kosong")
+
+        self.slots: List[KeySlot] = []
+        for api_key in unique_keys:
+            key_id = key_fingerprint(api_key)
+            self.slots.append(KeySlot(
+                api_key=api_key,
+                key_id=key_id,
+                rate_limiter=rate_limiter or get_rate_limiter(key_id)
+            ))
+
+        self._lock = threading.Lock()
+
+        logger.info(f"Key pool diinisialisasi dengan {len(self.slots)} API key")
+
+    def __len__(self) -> int:
+        """Jumlah key dalam pool."""
+        return len(self.slots)
+
+    def get_slot(self, key_id: str) -> Optional[KeySlot]:
+        """
+        Cari slot berdasarkan fingerprint key.
+
+        Args:
+            key_id: Fingerprint API key.
+
+        Returns:
+            KeySlot atau None.
+        """
+        for slot in self.slots:
+            if slot.key_id == key_id:
+                return slot
+        return None
+
+    def active_slots(self) -> List[KeySlot]:
+        """
+        Key yang masih punya sisa quota, urut dari headroom terbesar.
+
+        Returns:
+            List KeySlot.
+        """
+        ranked = [(slot.rate_limiter.remaining_units(), slot) for slot in self.slots]
+        return [slot for remaining, slot in sorted(ranked, key=lambda r: -r[0]) if remaining > 0]
+
+    def _try_acquire(self, endpoint: str) -> Tuple[Optional[KeySlot], float]:
+        """
+        Coba ambil izin request dari key dengan headroom terbesar.
+
+        Args:
+            endpoint: Nama endpoint.
+
+        Returns:
+            Tuple (slot, 0.0) jika berhasil, atau (None, detik tunggu minimum).
+
+        Raises:
+            QuotaExceededException: Jika tidak ada key dengan quota cukup
+                atau jatah unit proses ini habis.
+        """
+        min_wait = None
+        budget = get_unit_budget()
+        units = QuotaRateLimiter.cost(endpoint)
+        if budget is not None and not budget.try_spend(units):
+            logger.error(f"Jatah quota proses ini habis ({budget.units} unit, butuh {units} untuk {endpoint})")
+            raise QuotaExceededException("YouTube API quota habis (jatah unit proses ini)")
+
+        with self._lock:
+            for slot in self.active_slots():
+                try:
+                    wait = slot.rate_limiter.try_acquire(endpoint)
+                except QuotaExceededException:
+                    # Key ini tidak cukup untuk endpoint ini, coba key lain
+                    continue
+
+                if wait == 0.0:
+                    return slot, 0.0
+
+                min_wait = wait if min_wait is None else min(min_wait, wait)
+
+        # Belum dapat key: unit dikembalikan ke jatah sampai request berikutnya
+        if budget is not None:
+            budget.refund(units)
+
+        if min_wait is None:
+            logger.error(f"Semua API key kehabisan quota untuk {endpoint}")
+            raise QuotaExceededException("YouTube API quota habis di semua API key")
+
+        return None, min_wait
+
+    def acquire(self, endpoint: str) -> KeySlot:
+        """
+        Ambil key untuk satu request (blocking, thread-safe).
+
+        Args:
+            endpoint: Nama endpoint.
+
+        Returns:
+            KeySlot yang izinnya sudah diambil.
+
+        Raises:
+            QuotaExceededException: Jika semua key kehabisan quota.
+        """
+        while True:
+            slot, wait = self._try_acquire(endpoint)
+            if slot is not None:
+                return slot
+            time.sleep(wait)
+
+    async def acquire_async(self, endpoint: str) -> KeySlot:
+        """
+        Ambil key untuk satu request tanpa memblok event loop.
+
+        Args:
+            endpoint: Nama endpoint.
+
+        Returns:
+            KeySlot yang izinnya sudah diambil.
+
+        Raises:
+            QuotaExceededException: Jika semua key kehabisan quota.
+        """
+        while True:
+            slot, wait = self._try_acquire(endpoint)
+            if slot is not None:
+                return slot
+            await asyncio.sleep(wait)
+
+    def mark_exhausted(self, key_id: str) -> None:
+        """
+        Tandai key habis quota untuk sisa hari ini.
+
+        Args:
+            key_id: Fingerprint API key.
+        """
+        slot = self.get_slot(key_id)
+        if slot is None:
+            return
+
+        slot.rate_limiter.sync_units_used(slot.rate_limiter.daily_quota)
+        logger.warning(
+            f"API key {key_id} kehabisan quota, {len(self.active_slots())} key tersisa"
+        )
+
+    def remaining_units(self) -> int:
+        """
+        Total sisa quota unit hari ini di semua key.
+
+        Returns:
+            Jumlah unit, dibatasi sisa jatah unit proses (kalau diatur).
+        """
+        remaining = sum(slot.rate_limiter.remaining_units() for slot in self.slots)
+        budget = get_unit_budget()
+        if budget is not None:
+            remaining = min(remaining, budget.remaining_units())
+        return remaining
@@ -0,0 +1,383 @@
+"""
+Rate limiter untuk YouTube Data API.
+
+Module ini berisi token bucket yang membatasi:
+- Jumlah request per detik
+- Quota unit harian per endpoint (search=100, videos/channels=1)
+- Jatah unit per proses (UnitBudget), kalau beberapa proses berbagi quota
+
+Limiter thread-safe dan asyncio-safe, dan hanya menunggu kalau budget
+request per detik benar-benar habis (bukan sleep tetap antar request).
+"""
+
+import asyncio
+import threading
+import time
+from datetime import datetime, timezone, timedelta, date
+from typing import Dict, Any, Optional
+
+from hunterbot.api.exceptions import QuotaExceededException
+from hunterbot.config import Config
+from hunterbot.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Quota YouTube di-reset tengah malam Pacific Time (pakai offset PST tetap)
+QUOTA_RESET_UTC_OFFSET = timedelta(hours=-8)
+
+
+def quota_day(now: datetime = None) -> date:
+    """
+    Hitung "hari quota" YouTube untuk waktu tertentu.
+
+    Args:
+        now: Waktu UTC. Default sekarang.
+
+    Returns:
+        Tanggal quota (Pacific Time).
+    """
+    if now is None:
+        now = datetime.now(timezone.utc)
+    return (now + QUOTA_RESET_UTC_OFFSET).date()
+
+
+def next_quota_reset(now: datetime = None) -> datetime:
+    """
+    Waktu reset quota YouTube berikutnya.
+
+    Args:
+        now: Waktu UTC. Default sekarang.
+
+    Returns:
+        Awal hari quota berikutnya (datetime UTC).
+    """
+    next_day = quota_day(now) + timedelta(days=1)
+    return datetime(next_day.year, next_day.month, next_day.day, tzinfo=timezone.utc) - QUOTA_RESET_UTC_OFFSET
+
+
+class TokenBucket:
+    """
+    Token bucket sederhana.
+
+    Tidak thread-safe sendiri; selalu dipakai di bawah lock pemiliknya.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        Inisialisasi token bucket.
+
+        Args:
+            rate: Token yang diisi ulang per detik.
+            capacity: Maksimal token (ukuran burst).
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        """Isi ulang token sesuai waktu yang berlalu."""
+        elapsed = now - self.updated_at
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.updated_at = now
+
+    def try_take(self, amount: float = 1.0) -> float:
+        """
+        Ambil token kalau tersedia.
+
+        Args:
+            amount: Jumlah token.
+
+        Returns:
+            0.0 jika token berhasil diambil, atau detik yang harus ditunggu.
+        """
+        self._refill(time.monotonic())
+
+        if self.tokens >= amount:
+            self.tokens -= amount
+            return 0.0
+
+        return (amount - self.tokens) / self.rate
+
+
+class QuotaRateLimiter:
+    """
+    Limiter gabungan request per detik + quota unit harian.
+
+    Satu instance mewakili satu API key (quota YouTube dihitung per key),
+    dan dipakai bersama oleh semua YouTubeAPI client dengan key yang sama.
+    """
+
+    def __init__(
+        self,
+        requests_per_second: float = None,
+        daily_quota: int = None,
+        burst: float = None
+    ):
+        """
+        Inisialisasi limiter.
+
+        Args:
+            requests_per_second: Maksimal request per detik. Default dari Config.
+            daily_quota: Quota unit per hari. Default dari Config.
+            burst: Maksimal request beruntun tanpa jeda. Default = requests_per_second.
+        """
+        if requests_per_second is None:
+            requests_per_second = Config.YOUTUBE_REQUESTS_PER_SECOND
+        if daily_quota is None:
+            daily_quota = Config.YOUTUBE_DAILY_QUOTA
+        if burst is None:
+            burst = max(1.0, requests_per_second)
+
+        self.daily_quota = daily_quota
+        self._lock = threading.Lock()
+        self._requests = TokenBucket(requests_per_second, burst)
+        self._quota_day = quota_day()
+        self._units_used = 0
+
+        # Statistik
+        self.request_count = 0
+        self.total_wait = 0.0
+
+    @staticmethod
+    def cost(endpoint: str) -> int:
+        """
+        Quota unit untuk satu request ke endpoint.
+
+        Args:
+            endpoint: Nama endpoint (search, videos, channels).
+
+        Returns:
+            Jumlah quota unit.
+        """
+        return Config.YOUTUBE_QUOTA_COSTS.get(endpoint, 1)
+
+    def _roll_day(self) -> None:
+        """Reset pemakaian unit kalau sudah ganti hari quota."""
+        today = quota_day()
+        if today != self._quota_day:
+            self._quota_day = today
+            self._units_used = 0
+
+    def try_acquire(self, endpoint: str) -> float:
+        """
+        Coba reservasi satu request.
+
+        Args:
+            endpoint: Nama endpoint.
+
+        Returns:
+            0.0 jika berhasil, atau detik yang harus ditunggu.
+
+        Raises:
+            QuotaExceededException: Jika quota unit harian tidak cukup.
+        """
+        units = self.cost(endpoint)
+
+        with self._lock:
+            self._roll_day()
+
+            if self._units_used + units > self.daily_quota:
+                logger.error(
+                    f"Budget quota harian habis: {self._units_used}/{self.daily_quota} unit "
+                    f"(butuh {units} untuk {endpoint})"
+                )
+                raise QuotaExceededException("YouTube API quota habis (budget harian limiter)")
+
+            wait = self._requests.try_take()
+            if wait == 0.0:
+                self._units_used += units
+                self.request_count += 1
+
+            return wait
+
+    def acquire(self, endpoint: str) -> float:
+        """
+        Ambil izin request (blocking, thread-safe).
+
+        Args:
+            endpoint: Nama endpoint.
+
+        Returns:
+            Total detik menunggu.
+
+        Raises:
+            QuotaExceededException: Jika quota unit harian tidak cukup.
+        """
+        waited = 0.0
+        while True:
+            wait = self.try_acquire(endpoint)
+            if wait == 0.0:
+                break
+            time.sleep(wait)
+            waited += wait
+
+        if waited:
+            self._record_wait(endpoint, waited)
+
+        return waited
+
+    async def acquire_async(self, endpoint: str) -> float:
+        """
+        Ambil izin request tanpa memblok event loop.
+
+        Args:
+            endpoint: Nama endpoint.
+
+        Returns:
+            Total detik menunggu.
+
+        Raises:
+            QuotaExceededException: Jika quota unit harian tidak cukup.
+        """
+        waited = 0.0
+        while True:
+            wait = self.try_acquire(endpoint)
+            if wait == 0.0:
+                break
+            await asyncio.sleep(wait)
+            waited += wait
+
+        if waited:
+            self._record_wait(endpoint, waited)
+
+        return waited
+
+    def _record_wait(self, endpoint: str, waited: float) -> None:
+        """Catat waktu tunggu untuk statistik."""
+        with self._lock:
+            self.total_wait += waited
+        logger.debug(f"Rate limiter: tunggu {waited:.2f} detik untuk {endpoint}")
+
+    def sync_units_used(self, units_used: int) -> None:
+        """
+        Samakan pemakaian unit hari ini dengan sumber luar (ledger quota).
+
+        Hanya menaikkan angka, supaya request yang baru saja tercatat di
+        limiter tidak hilang.
+
+        Args:
+            units_used: Unit terpakai hari ini menurut ledger.
+        """
+        with self._lock:
+            self._roll_day()
+            self._units_used = max(self._units_used, units_used)
+
+    def remaining_units(self) -> int:
+        """
+        Sisa quota unit hari ini.
+
+        Returns:
+            Jumlah unit yang masih bisa dipakai.
+        """
+        with self._lock:
+            self._roll_day()
+            return self.daily_quota - self._units_used
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Statistik pemakaian limiter.
+
+        Returns:
+            Dict berisi request_count, units_used, remaining_units, total_wait.
+        """
+        with self._lock:
+            self._roll_day()
+            return {
+                "request_count": self.request_count,
+                "units_used": self._units_used,
+                "remaining_units": self.daily_quota - self._units_used,
+                "total_wait": round(self.total_wait, 3),
+            }
+
+
+# Registry limiter per API key (shared antar YouTubeAPI instance)
+_limiters: Dict[str, QuotaRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(name: str = "default") -> QuotaRateLimiter:
+    """
+    Get or create QuotaRateLimiter shared untuk nama/key tertentu.
+
+    Args:
+        name: Identitas limiter (biasanya fingerprint API key).
+
+    Returns:
+        QuotaRateLimiter instance.
+    """
+    with _limiters_lock:
+        limiter = _limiters.get(name)
+        if limiter is None:
+            limiter = QuotaRateLimiter()
+            _limiters[name] = limiter
+        return limiter
+
+
+class UnitBudget:
+    """
+    Jatah quota unit satu proses, untuk semua API key dan semua run.
+
+    Limiter per key hanya menghitung request proses sendiri (ledger baru
+    dibaca saat planning), jadi beberapa proses yang berbagi quota harian
+    masing-masing bisa menghabiskan seluruh sisa quota. Dengan jatah tetap
+    per proses (Config.YOUTUBE_UNIT_BUDGET), total pemakaian semua proses
+    tidak melebihi jumlah jatahnya.
+    """
+
+    def __init__(self, units: int):
+        """
+        Args:
+            units: Jumlah unit yang boleh dipakai proses ini.
+        """
+        self.units = units
+        self._used = 0
+        self._lock = threading.Lock()
+
+    def try_spend(self, units: int) -> bool:
+        """
+        Ambil unit dari jatah.
+
+        Args:
+            units: Unit yang dibutuhkan request.
+
+        Returns:
+            True jika jatah cukup (unit sudah dipotong).
+        """
+        with self._lock:
+            if self._used + units > self.units:
+                return False
+            self._used += units
+            return True
+
+    def refund(self, units: int) -> None:
+        """Kembalikan unit yang tidak jadi dipakai (request menunggu/gagal dapat key)."""
+        with self._lock:
+            self._used = max(0, self._used - units)
+
+    def remaining_units(self) -> int:
+        """Sisa jatah unit."""
+        with self._lock:
+            return self.units - self._used
+
+
+# Jatah unit proses (None jika Config.YOUTUBE_UNIT_BUDGET tidak diisi)
+_unit_budget: Optional[UnitBudget] = None
+_unit_budget_lock = threading.Lock()
+
+
+def get_unit_budget() -> Optional[UnitBudget]:
+    """
+    Get or create UnitBudget proses ini dari Config.YOUTUBE_UNIT_BUDGET.
+
+    Returns:
+        UnitBudget, atau None jika proses tidak dibatasi jatah.
+    """
+    global _unit_budget
+    with _unit_budget_lock:
+        if Config.YOUTUBE_UNIT_BUDGET is None:
+            return None
+        if _unit_budget is None:
+            _unit_budget = UnitBudget(Config.YOUTUBE_UNIT_BUDGET)
+        return _unit_budget
@@ -0,0 +1,65 @@
+"""
+Record ringkas untuk hasil videos.list dan channels.list.
+
+NamedTuple jauh lebih hemat memori daripada dict per video, jadi dipakai
+oleh API streaming (iter_video_details / iter_channel_details) supaya
+memori tetap datar walau hunt memproses puluhan ribu video.
+"""
+
+from typing import Dict, Any, List, NamedTuple, Optional
+
+
+class VideoRecord(NamedTuple):
+    """Metadata satu video dari videos.list."""
+
+    video_id: str
+    title: str
+    channel_id: str
+    channel_title: str
+    upload_date: str
+    views: int
+    likes: int
+    description: str
+    thumbnail_url: str
+
+
+class VideoStats(NamedTuple):
+    """Statistik satu video (poll videos.list part=statistics)."""
+
+    video_id: str
+    views: int
+    likes: int
+
+
+class ChannelRecord(NamedTuple):
+    """Data satu channel dari channels.list."""
+
+    channel_id: str
+    subscriber_count: int
+    location: str
+
+    def data(self) -> Dict[str, Any]:
+        """Bentuk dict {subscriber_count, location} (format get_channel_details)."""
+        return {
+            "subscriber_count": self.subscriber_count,
+            "location": self.location,
+        }
+
+
+class VideoSnippet(NamedTuple):
+    """Snippet video dari search.list (dipakai ulang saat videos.list)."""
+
+    title: str
+    channel_id: str
+    channel_title: str
+    upload_date: str
+    thumbnail_url: str
+
+
+class SearchPage(NamedTuple):
+    """Satu halaman hasil search.list."""
+
+    video_ids: List[str]
+    next_page_token: Optional[str]
+    total_results: int  # Estimasi YouTube (pageInfo.totalResults)
+    snippets: Dict[str, VideoSnippet] = {}  # video_id -> snippet hasil search
@@ -0,0 +1,305 @@
+"""
+Retry dan circuit breaker untuk YouTube Data API.
+
+Module ini berisi:
+- RetryPolicy: exponential backoff dengan jitter + dukungan Retry-After
+- CircuitBreaker: berhenti mengirim request saat API sedang down
+- VideoBatchResult / ChannelBatchResult: hasil batch parsial + ID yang gagal
+"""
+
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Any, Iterable, List, Optional
+
+import requests
+
+from hunterbot.api.exceptions import CircuitOpenError, RateLimitedError
+from hunterbot.config import Config
+from hunterbot.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Status HTTP yang dianggap error sementara
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+
+def describe_error(error: BaseException) -> str:
+    """
+    Deskripsi singkat error request untuk log.
+
+    Pesan HTTPError dari requests memuat URL lengkap (termasuk API key),
+    jadi untuk HTTP error hanya status code yang ditampilkan.
+
+    Args:
+        error: Exception dari request.
+
+    Returns:
+        Deskripsi error.
+    """
+    response = getattr(error, "response", None)
+    if isinstance(error, requests.exceptions.HTTPError) and response is not None:
+        return f"HTTP {response.status_code} {response.reason or ''}".strip()
+    if isinstance(error, requests.exceptions.RequestException):
+        return type(error).__name__
+    return str(error)
+
+
+class RetryPolicy:
+    """
+    Kebijakan retry untuk error sementara (5xx, 429, timeout, koneksi putus).
+
+    Delay memakai "full jitter": acak antara 0 dan base * 2^(attempt-1),
+    supaya request paralel yang gagal bersamaan tidak retry bersamaan juga.
+    Retry-After dari server selalu dihormati (dibatasi max_delay).
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = None,
+        base_delay: float = None,
+        max_delay: float = None
+    ):
+        """
+        Inisialisasi retry policy.
+
+        Args:
+            max_attempts: Maksimal percobaan per request. Default dari Config.
+            base_delay: Backoff awal (detik). Default dari Config.
+            max_delay: Batas backoff (detik). Default dari Config.
+        """
+        self.max_attempts = max_attempts if max_attempts is not None else Config.YOUTUBE_RETRY_ATTEMPTS
+        self.base_delay = base_delay if base_delay is not None else Config.YOUTUBE_RETRY_BASE_DELAY
+        self.max_delay = max_delay if max_delay is not None else Config.YOUTUBE_RETRY_MAX_DELAY
+
+    @staticmethod
+    def is_retryable(error: BaseException) -> bool:
+        """
+        Cek apakah error layak di-retry.
+
+        Args:
+            error: Exception dari request.
+
+        Returns:
+            True untuk error sementara.
+        """
+        if isinstance(error, RateLimitedError):
+            return True
+        if isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+            return True
+        if isinstance(error, requests.exceptions.HTTPError) and error.response is not None:
+            return error.response.status_code in RETRYABLE_STATUS
+        return False
+
+    @staticmethod
+    def retry_after(error: BaseException) -> Optional[float]:
+        """
+        Baca header Retry-After (detik atau HTTP-date) dari response error.
+
+        Args:
+            error: Exception dari request.
+
+        Returns:
+            Detik tunggu, atau None jika tidak ada header.
+        """
+        response = getattr(error, "response", None)
+        if response is None:
+            return None
+
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+    def backoff(self, attempt: int, error: BaseException = None) -> float:
+        """
+        Hitung delay sebelum percobaan berikutnya.
+
+        Args:
+            attempt: Nomor percobaan yang baru saja gagal (mulai 1).
+            error: Exception percobaan itu (untuk Retry-After).
+
+        Returns:
+            Detik tunggu.
+        """
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+        retry_after = self.retry_after(error) if error is not None else None
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+
+        return min(delay, self.max_delay)
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker sederhana (closed -> open -> half_open).
+
+    Setelah failure_threshold error sementara beruntun, circuit terbuka dan
+    semua request langsung gagal dengan CircuitOpenError selama
+    reset_timeout detik. Setelah itu satu request percobaan dibolehkan;
+    sukses menutup circuit, gagal membukanya lagi. Percobaan yang tidak
+    melapor dalam reset_timeout detik dianggap hilang dan diganti.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = None, reset_timeout: float = None):
+        """
+        Inisialisasi circuit breaker.
+
+        Args:
+            failure_threshold: Error beruntun sebelum circuit terbuka. Default dari Config.
+            reset_timeout: Detik circuit terbuka. Default dari Config.
+        """
+        self.failure_threshold = (
+            failure_threshold if failure_threshold is not None else Config.YOUTUBE_BREAKER_THRESHOLD
+        )
+        self.reset_timeout = reset_timeout if reset_timeout is not None else Config.YOUTUBE_BREAKER_RESET
+
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_started_at: Optional[float] = None
+
+        self.times_opened = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        """State circuit saat ini."""
+        with self._lock:
+            return self._state
+
+    def before_request(self) -> None:
+        """
+        Minta izin mengirim request.
+
+        Raises:
+            CircuitOpenError: Jika circuit terbuka.
+        """
+        with self._lock:
+            if self._state == self.CLOSED:
+                return
+
+            now = time.monotonic()
+            if self._state == self.OPEN and now - self._opened_at >= self.reset_timeout:
+                self._state = self.HALF_OPEN
+                self._probe_started_at = None
+
+            if self._state == self.HALF_OPEN and (
+                self._probe_started_at is None
+                or now - self._probe_started_at >= self.reset_timeout
+            ):
+                self._probe_started_at = now
+                logger.info("Circuit breaker half-open: kirim request percobaan")
+                return
+
+            self.rejected += 1
+
+        raise CircuitOpenError("YouTube API sedang bermasalah (circuit breaker terbuka)")
+
+    def record_success(self) -> None:
+        """Catat request sukses (menutup circuit)."""
+        with self._lock:
+            if self._state != self.CLOSED:
+                logger.info("Circuit breaker tertutup kembali")
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probe_started_at = None
+
+    def record_failure(self) -> None:
+        """Catat error sementara (bisa membuka circuit)."""
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    self.times_opened += 1
+                    logger.error(
+                        f"Circuit breaker terbuka setelah {self._failures} error beruntun, "
+                        f"jeda {self.reset_timeout:g} detik"
+                    )
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._probe_started_at = None
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Statistik circuit breaker.
+
+        Returns:
+            Dict state, consecutive_failures, times_opened, rejected.
+        """
+        with self._lock:
+            return {
+                "state": self._state,
+                "consecutive_failures": self._failures,
+                "times_opened": self.times_opened,
+                "rejected": self.rejected,
+            }
+
+
+class VideoBatchResult(list):
+    """List video hasil batch, plus ID yang gagal diambil."""
+
+    def __init__(self, items: Iterable = (), failed_ids: List[str] = None):
+        super().__init__(items)
+        self.failed_ids: List[str] = list(failed_ids or [])
+
+    @property
+    def complete(self) -> bool:
+        """True jika tidak ada ID yang gagal."""
+        return not self.failed_ids
+
+
+class ChannelBatchResult(dict):
+    """Dict channel_id -> data hasil batch, plus ID yang gagal diambil."""
+
+    def __init__(self, items: Any = (), failed_ids: List[str] = None):
+        super().__init__(items)
+        self.failed_ids: List[str] = list(failed_ids or [])
+
+    @property
+    def complete(self) -> bool:
+        """True jika tidak ada ID yang gagal."""
+        return not self.failed_ids
+
+
+# Registry circuit breaker per base URL (shared antar YouTubeAPI instance)
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(name: str = "default") -> CircuitBreaker:
+    """
+    Get or create CircuitBreaker shared untuk nama tertentu.
+
+    Args:
+        name: Identitas breaker (biasanya base URL API).
+
+    Returns:
+        CircuitBreaker instance.
+    """
+    with _breakers_lock:
+        breaker = _breakers.get(name)
+        if breaker is None:
+            breaker = CircuitBreaker()
+            _breakers[name] = breaker
+        return breaker
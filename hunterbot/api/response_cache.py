@@ -0,0 +1,261 @@
+"""
+Cache response HTTP YouTube API di SQLite.
+
+Module ini menyimpan response search/videos/channels supaya hunt berulang
+dengan keyword yang sama tidak membayar quota penuh lagi:
+- Key cache = endpoint + params yang dinormalisasi (tanpa API key)
+- TTL per endpoint
+- Body disimpan terkompresi (zlib)
+- Entry kadaluarsa direvalidasi dengan ETag / If-None-Match
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Dict, Any, NamedTuple, Optional
+
+from hunterbot.config import Config
+from hunterbot.database.models import _db_write_lock
+from hunterbot.database.schema import get_connection
+from hunterbot.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class CacheEntry(NamedTuple):
+    """Satu entry cache response."""
+
+    cache_key: str
+    endpoint: str
+    etag: Optional[str]
+    body: bytes
+    fresh: bool
+
+    def data(self) -> Dict[str, Any]:
+        """Decode body terkompresi menjadi response JSON."""
+        return json.loads(zlib.decompress(self.body))
+
+
+class ResponseCache:
+    """
+    Cache response YouTube API yang persisten (tabel http_cache).
+
+    Thread-safe; counter hit/miss bisa dibaca lewat stats() untuk melihat
+    berapa quota unit yang dihemat.
+    """
+
+    def __init__(self, ttl: Dict[str, int] = None, db_path: Optional[str] = None):
+        """
+        Inisialisasi response cache.
+
+        Args:
+            ttl: TTL detik per endpoint. Default dari Config.
+            db_path: Path database. Default dari Config.
+        """
+        self.ttl = ttl or Config.YOUTUBE_CACHE_TTL
+        self.db_path = db_path
+
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.not_modified = 0
+        self.units_saved = 0
+
+    @staticmethod
+    def make_key(endpoint: str, params: Dict[str, Any]) -> str:
+        """
+        Buat cache key dari endpoint dan params (API key diabaikan).
+
+        Urutan ID di param "id" tidak berpengaruh.
+
+        Args:
+            endpoint: Nama endpoint.
+            params: Query parameters.
+
+        Returns:
+            SHA-256 hex digest.
+        """
+        normalized = []
+        for name, value in params.items():
+            if name == "key" or value is None:
+                continue
+            value = str(value)
+            if name == "id":
+                value = ",".join(sorted(value.split(",")))
+            normalized.append((str(name), value))
+        normalized.sort()
+        raw = json.dumps([endpoint, normalized], separators=(",", ":"))
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def lookup(self, endpoint: str, params: Dict[str, Any]) -> Optional[CacheEntry]:
+        """
+        Cari response di cache.
+
+        Args:
+            endpoint: Nama endpoint.
+            params: Query parameters.
+
+        Returns:
+            CacheEntry (fresh atau stale) atau None jika belum ada.
+        """
+        cache_key = self.make_key(endpoint, params)
+
+        conn = None
+        try:
+            conn = get_connection(self.db_path)
+            row = conn.execute("""
+                SELECT etag, body, expires_at FROM http_cache WHERE cache_key = ?
+            """, (cache_key,)).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Gagal membaca cache {endpoint}: {e}")
+            row = None
+        finally:
+            if conn:
+                conn.close()
+
+        if row is None:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        fresh = row["expires_at"] > time.time()
+        with self._lock:
+            if fresh:
+                self.hits += 1
+                self.units_saved += Config.YOUTUBE_QUOTA_COSTS.get(endpoint, 1)
+            else:
+                self.stale += 1
+
+        return CacheEntry(
+            cache_key=cache_key,
+            endpoint=endpoint,
+            etag=row["etag"],
+            body=row["body"],
+            fresh=fresh
+        )
+
+    def store(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        raw_body: bytes,
+        etag: Optional[str] = None
+    ) -> None:
+        """
+        Simpan response ke cache.
+
+        Args:
+            endpoint: Nama endpoint.
+            params: Query parameters.
+            raw_body: Body response JSON mentah.
+            etag: ETag response (opsional).
+        """
+        now = time.time()
+        conn = None
+        try:
+            with _db_write_lock:
+                conn = get_connection(self.db_path)
+                conn.execute("""
+                    INSERT OR REPLACE INTO http_cache (
+                        cache_key, endpoint, etag, body, fetched_at, expires_at
+                    ) VALUES (?, ?, ?, ?, ?, ?)
+                """, (
+                    self.make_key(endpoint, params),
+                    endpoint,
+                    etag,
+                    zlib.compress(raw_body),
+                    now,
+                    now + self.ttl.get(endpoint, 0)
+                ))
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Gagal menyimpan cache {endpoint}: {e}")
+        finally:
+            if conn:
+                conn.close()
+
+    def refresh(self, entry: CacheEntry) -> None:
+        """
+        Perpanjang TTL entry setelah server membalas 304 Not Modified.
+
+        Args:
+            entry: Entry stale yang sudah direvalidasi.
+        """
+        now = time.time()
+        with self._lock:
+            self.not_modified += 1
+
+        conn = None
+        try:
+            with _db_write_lock:
+                conn = get_connection(self.db_path)
+                conn.execute("""
+                    UPDATE http_cache SET fetched_at = ?, expires_at = ? WHERE cache_key = ?
+                """, (now, now + self.ttl.get(entry.endpoint, 0), entry.cache_key))
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Gagal memperbarui cache {entry.endpoint}: {e}")
+        finally:
+            if conn:
+                conn.close()
+
+    def purge(self, older_than: float) -> int:
+        """
+        Hapus entry yang sudah kadaluarsa lebih dari older_than detik.
+
+        Args:
+            older_than: Umur (detik) setelah expires_at.
+
+        Returns:
+            Jumlah entry yang dihapus.
+        """
+        conn = None
+        try:
+            with _db_write_lock:
+                conn = get_connection(self.db_path)
+                cursor = conn.execute(
+                    "DELETE FROM http_cache WHERE expires_at < ?",
+                    (time.time() - older_than,)
+                )
+                conn.commit()
+                return cursor.rowcount
+        except sqlite3.Error as e:
+            logger.warning(f"Gagal membersihkan cache: {e}")
+            return 0
+        finally:
+            if conn:
+                conn.close()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Counter cache sejak proses dimulai.
+
+        Returns:
+            Dict hits, misses, stale, not_modified, units_saved.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "stale": self.stale,
+                "not_modified": self.not_modified,
+                "units_saved": self.units_saved,
+            }
+
+
+# Singleton instance
+_cache_instance = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """Get or create ResponseCache singleton instance."""
+    global _cache_instance
+    with _cache_lock:
+        if _cache_instance is None:
+            _cache_instance = ResponseCache()
+        return _cache_instance
@@ -0,0 +1,389 @@
+"""
+Transport HTTP pluggable untuk YouTubeAPI (record / replay).
+
+Transport dipasang sebagai requests adapter di YouTubeAPI.session:
+- RecordingAdapter: kirim request ke YouTube seperti biasa, lalu simpan
+  setiap pasangan request/response ke cassette (JSON lines + gzip)
+- ReplayAdapter: layani request dari cassette tanpa network, dengan
+  latency buatan dan injeksi error (opsional)
+
+Dengan replay, hunt lengkap bisa dijalankan ulang secara offline dan
+deterministik untuk profiling dan perbandingan performa sebelum/sesudah.
+API key tidak pernah ditulis ke cassette.
+"""
+
+import atexit
+import gzip
+import json
+import random
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+from urllib.parse import urlencode, urlsplit, urlunsplit, parse_qsl
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+from hunterbot.api.http_pool import PooledHTTPAdapter
+from hunterbot.api.response_cache import ResponseCache
+from hunterbot.config import Config
+from hunterbot.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Header response yang ikut direkam (sisanya tidak dipakai client)
+RECORDED_HEADERS = ("Content-Type", "ETag", "Retry-After")
+
+# Param yang berubah antar run (date range hunt ikut jam saat ini)
+VOLATILE_PARAMS = ("publishedAfter", "publishedBefore")
+
+
+def request_key(method: str, url: str, ignore: tuple = ()) -> str:
+    """
+    Identitas request untuk pencocokan replay.
+
+    Memakai normalisasi yang sama dengan response cache: API key
+    diabaikan dan urutan ID di param "id" tidak berpengaruh.
+
+    Args:
+        method: HTTP method.
+        url: URL lengkap request.
+        ignore: Nama param yang tidak ikut dihitung.
+
+    Returns:
+        Key string.
+    """
+    parts = urlsplit(url)
+    endpoint = parts.path.rstrip("/").rsplit("/", 1)[-1]
+    params = {
+        name: value
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if name not in ignore
+    }
+    return f"{method.upper()} {ResponseCache.make_key(endpoint, params)}"
+
+
+def strip_api_key(url: str) -> str:
+    """
+    Hapus param key dari URL (supaya API key tidak masuk cassette).
+
+    Args:
+        url: URL lengkap request.
+
+    Returns:
+        URL tanpa param key.
+    """
+    parts = urlsplit(url)
+    query = [(name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True) if name != "key"]
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+class Cassette:
+    """
+    File rekaman request/response (JSON lines, dikompres gzip).
+
+    Setiap baris: {key, method, url, status, reason, headers, body}.
+    Thread-safe untuk append dari banyak request paralel.
+    """
+
+    def __init__(self, path: str):
+        """
+        Inisialisasi cassette.
+
+        Args:
+            path: Path file cassette (.jsonl.gz).
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._file = None
+        self.recorded = 0
+
+    def load(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Baca semua interaksi dari file, dikelompokkan per request key.
+
+        Rekaman yang terpotong (proses berhenti saat merekam) tetap dibaca
+        sampai baris terakhir yang utuh.
+
+        Returns:
+            Dict key -> list interaksi sesuai urutan rekaman.
+
+        Raises:
+            FileNotFoundError: Jika file cassette tidak ada.
+        """
+        interactions = defaultdict(list)
+
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            try:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        logger.warning(f"Cassette {self.path}: baris rusak dilewati")
+                        continue
+                    interactions[entry["key"]].append(entry)
+            except EOFError:
+                logger.warning(f"Cassette {self.path} terpotong, memakai interaksi yang utuh")
+
+        return dict(interactions)
+
+    def append(self, entry: Dict[str, Any]) -> None:
+        """
+        Tambah satu interaksi ke file (langsung di-flush).
+
+        Args:
+            entry: Interaksi (lihat format di docstring class).
+        """
+        line = json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+        with self._lock:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = gzip.open(self.path, "at", encoding="utf-8")
+            self._file.write(line)
+            self._file.flush()
+            self.recorded += 1
+
+    def close(self) -> None:
+        """Tutup file (menulis trailer gzip)."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class RecordingAdapter(PooledHTTPAdapter):
+    """Adapter HTTP (pool seperti client live) yang merekam setiap response ke cassette."""
+
+    def __init__(self, cassette: Cassette, **kwargs):
+        """
+        Inisialisasi adapter rekam.
+
+        Args:
+            cassette: Cassette tujuan.
+            **kwargs: Diteruskan ke PooledHTTPAdapter.
+        """
+        super().__init__(**kwargs)
+        self.cassette = cassette
+        atexit.register(cassette.close)
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        """Kirim request lewat network lalu rekam response-nya."""
+        response = super().send(request, **kwargs)
+
+        self.cassette.append({
+            "key": request_key(request.method, request.url),
+            "method": request.method,
+            "url": strip_api_key(request.url),
+            "status": response.status_code,
+            "reason": response.reason,
+            "headers": {
+                name: response.headers[name]
+                for name in RECORDED_HEADERS if name in response.headers
+            },
+            "body": response.content.decode("utf-8", errors="replace"),
+        })
+
+        return response
+
+    def close(self) -> None:
+        """Tutup koneksi dan cassette."""
+        super().close()
+        self.cassette.close()
+
+
+class ReplayAdapter(BaseAdapter):
+    """
+    Adapter yang melayani request dari cassette tanpa network.
+
+    Request identik yang direkam beberapa kali diputar sesuai urutan;
+    setelah habis, rekaman terakhir dipakai ulang. Kalau tidak ada yang
+    cocok persis, dicari lagi tanpa VOLATILE_PARAMS (replay hunt di jam
+    lain). Request yang tetap tidak ada di cassette dibalas 404.
+    """
+
+    def __init__(
+        self,
+        cassette: Cassette,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        seed: Optional[int] = None
+    ):
+        """
+        Inisialisasi adapter replay.
+
+        Args:
+            cassette: Cassette sumber.
+            latency: Latency buatan per request (detik).
+            error_rate: Peluang (0-1) request dibalas 503 (injeksi error).
+            seed: Seed random untuk injeksi error (deterministik).
+
+        Raises:
+            FileNotFoundError: Jika file cassette tidak ada.
+        """
+        super().__init__()
+        self.latency = latency
+        self.error_rate = error_rate
+        self._random = random.Random(seed)
+        self._interactions = cassette.load()
+        self._loose: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for entries in self._interactions.values():
+            for entry in entries:
+                self._loose[request_key(entry["method"], entry["url"], VOLATILE_PARAMS)].append(entry)
+        self._positions: Dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+        self.served = 0
+        self.missing = 0
+        self.injected_errors = 0
+
+        total = sum(len(entries) for entries in self._interactions.values())
+        logger.info(f"Replay cassette {cassette.path}: {total} interaksi")
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        """Balas request dari cassette."""
+        if self.latency:
+            time.sleep(self.latency)
+
+        key = request_key(request.method, request.url)
+
+        with self._lock:
+            if self.error_rate and self._random.random() < self.error_rate:
+                self.injected_errors += 1
+                return self._build_response(request, 503, "Service Unavailable", {"Retry-After": "0"}, "")
+
+            entries = self._interactions.get(key)
+            if not entries:
+                key = request_key(request.method, request.url, VOLATILE_PARAMS)
+                entries = self._loose.get(key)
+            if not entries:
+                self.missing += 1
+                entry = None
+            else:
+                position = self._positions[key]
+                entry = entries[min(position, len(entries) - 1)]
+                self._positions[key] = position + 1
+                self.served += 1
+
+        if entry is None:
+            logger.warning(f"Replay: request tidak ada di cassette: {strip_api_key(request.url)}")
+            return self._build_response(request, 404, "Not Recorded", {}, "")
+
+        return self._build_response(
+            request, entry["status"], entry.get("reason", ""), entry.get("headers", {}), entry["body"]
+        )
+
+    def _build_response(
+        self,
+        request: requests.PreparedRequest,
+        status: int,
+        reason: str,
+        headers: Dict[str, str],
+        body: str
+    ) -> requests.Response:
+        """Susun requests.Response dari data rekaman."""
+        response = requests.Response()
+        response.status_code = status
+        response.reason = reason
+        response.headers = CaseInsensitiveDict(headers)
+        response._content = body.encode("utf-8")
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Statistik replay.
+
+        Returns:
+            Dict served, missing, injected_errors.
+        """
+        with self._lock:
+            return {
+                "served": self.served,
+                "missing": self.missing,
+                "injected_errors": self.injected_errors,
+            }
+
+    def close(self) -> None:
+        """Tidak ada koneksi untuk ditutup."""
+        pass
+
+
+def build_transport(
+    mode: str = None,
+    cassette_path: str = None
+) -> Optional[BaseAdapter]:
+    """
+    Buat transport sesuai mode.
+
+    Args:
+        mode: live, record, atau replay. Default dari Config.
+        cassette_path: Path cassette. Default dari Config.
+
+    Returns:
+        Adapter untuk di-mount di session, atau None untuk mode live.
+
+    Raises:
+        ValueError: Jika mode tidak dikenal.
+    """
+    mode = (mode or Config.YOUTUBE_TRANSPORT).lower()
+    cassette_path = cassette_path or Config.YOUTUBE_CASSETTE_PATH
+
+    if mode == "live":
+        return None
+
+    if mode == "record":
+        logger.info(f"Transport record: semua response direkam ke {cassette_path}")
+        return RecordingAdapter(Cassette(cassette_path))
+
+    if mode == "replay":
+        return ReplayAdapter(
+            Cassette(cassette_path),
+            latency=Config.YOUTUBE_REPLAY_LATENCY,
+            error_rate=Config.YOUTUBE_REPLAY_ERROR_RATE
+        )
+
+    raise ValueError(f"Mode transport tidak dikenal: {mode}")
+
+
+# Transport shared per (mode, path cassette): semua YouTubeAPI di proses
+# memakai satu adapter, jadi satu cassette (satu file handle dan lock) dan
+# replay cukup membaca file sekali
+_transports: Dict[Tuple[str, str], Optional[BaseAdapter]] = {}
+_transports_lock = threading.Lock()
+
+
+def get_transport(
+    mode: str = None,
+    cassette_path: str = None
+) -> Optional[BaseAdapter]:
+    """
+    Get or create transport shared untuk mode dan cassette tertentu.
+
+    Args:
+        mode: live, record, atau replay. Default dari Config.
+        cassette_path: Path cassette. Default dari Config.
+
+    Returns:
+        Adapter shared, atau None untuk mode live.
+
+    Raises:
+        ValueError: Jika mode tidak dikenal.
+    """
+    mode = (mode or Config.YOUTUBE_TRANSPORT).lower()
+    cassette_path = cassette_path or Config.YOUTUBE_CASSETTE_PATH
+    key = (mode, str(Path(cassette_path).resolve()))
+
+    with _transports_lock:
+        if key not in _transports:
+            _transports[key] = build_transport(mode, cassette_path)
+        return _transports[key]
@@ -4,27 +4,40 @@ YouTube Data API v3 Client.
 Module ini berisi fungsi untuk mengambil data dari YouTube Data API.
 """
 
+import asyncio
+import html
 import logging
 import time
 import requests
-from typing import List, Tuple, Optional, Dict, Any
-
+from typing import List, Tuple, Optional, Dict, Any, Callable, Iterator, AsyncIterator
+
+from hunterbot.api.channel_cache import ChannelCache, get_channel_cache
+from hunterbot.api.exceptions import (
+    YouTubeAPIError,
+    QuotaExceededException,
+    RateLimitedError,
+)
+from hunterbot.api.http_pool import HTTPPool, get_http_pool
+from hunterbot.api.key_pool import KeyPool, KeySlot
+from hunterbot.api.records import VideoRecord, VideoStats, ChannelRecord, SearchPage, VideoSnippet
+from hunterbot.api.rate_limiter import QuotaRateLimiter, quota_day
+from hunterbot.api.resilience import (
+    RetryPolicy,
+    CircuitBreaker,
+    VideoBatchResult,
+    ChannelBatchResult,
+    describe_error,
+    get_circuit_breaker,
+)
+from hunterbot.api.response_cache import CacheEntry, ResponseCache, get_response_cache
+from hunterbot.api.transport import get_transport
 from hunterbot.config import Config
+from hunterbot.database.models import QuotaLog
 from hunterbot.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
-class YouTubeAPIError(Exception):
-    """Exception untuk error YouTube API."""
-    pass
-
-
-class QuotaExceededException(YouTubeAPIError):
-    """Exception ketika quota YouTube API habis."""
-    pass
-
-
 class YouTubeAPI:
     """
     Client untuk YouTube Data API v3.
@@ -33,26 +46,108 @@ class YouTubeAPI:
     - Search video by query
     - Get video details
     - Get channel details
+
+    Detail video dan channel bisa diambil secara sinkron (batch berurutan)
+    atau async (semua batch dikirim bersamaan dengan concurrency terbatas).
+    Error sementara di-retry dengan backoff; batch yang tetap gagal tidak
+    membuang batch lain (hasil parsial + failed_ids).
     """
 
-    def __init__(self, api_key: str = None):
+    # Batas ID per request videos.list / channels.list
+    BATCH_SIZE = 50
+
+    # Partial response (param fields): hanya key yang di-parse yang dikirim
+    SEARCH_FIELDS = (
+        "etag,nextPageToken,pageInfo/totalResults,"
+        "items(id/videoId,snippet(title,channelId,channelTitle,publishedAt,thumbnails))"
+    )
+    VIDEO_FIELDS = (
+        "etag,items(id,snippet(title,channelId,channelTitle,publishedAt,description,thumbnails),"
+        "statistics(viewCount,likeCount))"
+    )
+    # Video yang snippet-nya sudah ada dari search: cukup statistik, description
+    # (search hanya memberi potongan), dan thumbnail yang tidak ada di search
+    VIDEO_STATS_FIELDS = (
+        "etag,items(id,snippet(description,thumbnails(maxres,standard)),"
+        "statistics(viewCount,likeCount))"
+    )
+    CHANNEL_FIELDS = "etag,items(id,snippet/country,statistics/subscriberCount)"
+    STATS_FIELDS = "etag,items(id,statistics(viewCount,likeCount))"
+
+    def __init__(
+        self,
+        api_key: str = None,
+        base_url: str = None,
+        rate_limiter: QuotaRateLimiter = None,
+        key_pool: KeyPool = None,
+        cache: ResponseCache = None,
+        channel_cache: ChannelCache = None,
+        retry_policy: RetryPolicy = None,
+        circuit_breaker: CircuitBreaker = None,
+        transport: requests.adapters.BaseAdapter = None,
+        http_pool: HTTPPool = None
+    ):
         """
         Inisialisasi YouTube API client.
 
         Args:
-            api_key: YouTube Data API key. Default dari Config.
+            api_key: YouTube Data API key. Default semua key dari Config.
+            base_url: Base URL API (untuk server lokal/testing). Default dari Config.
+            rate_limiter: Limiter request/quota. Default limiter shared per API key.
+            key_pool: Pool API key siap pakai (mengabaikan api_key).
+            cache: Response cache. Default cache shared jika YOUTUBE_CACHE_ENABLED.
+            channel_cache: Cache metadata channel. Default cache shared jika
+                YOUTUBE_CACHE_ENABLED.
+            retry_policy: Kebijakan retry. Default dari Config.
+            circuit_breaker: Circuit breaker. Default shared per base URL.
+            transport: Requests adapter untuk base URL (record/replay).
+                Default transport shared sesuai YOUTUBE_TRANSPORT.
+            http_pool: Connection pool HTTP. Default pool shared per proses.
+
+        Raises:
+            ValueError: Jika tidak ada API key.
         """
-        if api_key is None:
-            api_key = Config.YOUTUBE_API_KEY
+        if key_pool is None:
+            api_keys = [api_key] if api_key is not None else Config.YOUTUBE_API_KEYS
+            key_pool = KeyPool(api_keys, rate_limiter=rate_limiter)
+
+        self.key_pool = key_pool
+        self.base_url = (base_url or Config.YOUTUBE_API_BASE_URL).rstrip("/")
+        self.http_pool = http_pool or get_http_pool()
+
+        if transport is None:
+            transport = get_transport()
+        if transport is not None:
+            # Session sendiri supaya transport tidak bocor ke client lain
+            self.session = self.http_pool.new_session(transport, f"{self.base_url}/")
+        else:
+            self.session = self.http_pool.session
+        self.transport = transport
 
-        if not api_key:
-            raise ValueError("YouTube API key tidak boleh kosong")
+        if cache is None and Config.YOUTUBE_CACHE_ENABLED:
+            cache = get_response_cache()
+        self.cache: Optional[ResponseCache] = cache
 
-        self.api_key = api_key
-        self.base_url = "https://www.googleapis.com/youtube/v3"
-        self.session = requests.Session()
+        if channel_cache is None and Config.YOUTUBE_CACHE_ENABLED:
+            channel_cache = get_channel_cache()
+        self.channel_cache: Optional[ChannelCache] = channel_cache
 
-        logger.info("YouTube API client diinisialisasi")
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breaker = circuit_breaker or get_circuit_breaker(self.base_url)
+
+        # Key utama (kompatibilitas untuk client single-key)
+        primary = self.key_pool.slots[0]
+        self.api_key = primary.api_key
+        self.key_id = primary.key_id
+        self.rate_limiter = primary.rate_limiter
+
+        # ID run hunt aktif, dicatat di ledger quota untuk setiap request
+        self.run_id: Optional[str] = None
+
+        # Lanjutkan hitungan quota hari ini dari ledger (kalau app di-restart)
+        self._sync_quota_from_ledger()
+
+        logger.info(f"YouTube API client diinisialisasi ({len(self.key_pool)} API key)")
 
     def search_videos(
         self,
@@ -80,13 +175,134 @@ class YouTubeAPI:
         Raises:
             YouTubeAPIError: Jika request gagal.
         """
+        page = self.search_page(
+            query, max_results, region_code, page_token, published_after, published_before
+        )
+        return page.video_ids, page.next_page_token
+
+    def search_page(
+        self,
+        query: str,
+        max_results: int = 50,
+        region_code: str = None,
+        page_token: str = None,
+        published_after: str = None,
+        published_before: str = None
+    ) -> SearchPage:
+        """
+        Seperti search_videos, plus estimasi total hasil (pageInfo.totalResults).
+
+        Args:
+            query: Kata kunci pencarian.
+            max_results: Maksimal hasil per request (max 50).
+            region_code: Kode negara (default US).
+            page_token: Token untuk pagination (default None).
+            published_after: ISO 8601 format untuk tanggal awal.
+            published_before: ISO 8601 format untuk tanggal akhir.
+
+        Returns:
+            SearchPage (video_ids, next_page_token, total_results).
+
+        Raises:
+            YouTubeAPIError: Jika request gagal.
+        """
+        params = self._search_params(
+            query, max_results, region_code, page_token, published_after, published_before
+        )
+
+        try:
+            data = self._send("search", params)
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Request gagal: {describe_error(e)}")
+            raise YouTubeAPIError(f"Gagal menghubungi YouTube API: {describe_error(e)}")
+
+        return self._parse_search_response(data)
+
+    async def search_videos_async(
+        self,
+        query: str,
+        max_results: int = 50,
+        region_code: str = None,
+        page_token: str = None,
+        published_after: str = None,
+        published_before: str = None
+    ) -> Tuple[List[str], Optional[str]]:
+        """
+        Versi async dari search_videos.
+
+        Args:
+            query: Kata kunci pencarian.
+            max_results: Maksimal hasil per request (max 50).
+            region_code: Kode negara (default US).
+            page_token: Token untuk pagination (default None).
+            published_after: ISO 8601 format untuk tanggal awal.
+            published_before: ISO 8601 format untuk tanggal akhir.
+
+        Returns:
+            Tuple (list of video_ids, next_page_token).
+
+        Raises:
+            YouTubeAPIError: Jika request gagal.
+        """
+        page = await self.search_page_async(
+            query, max_results, region_code, page_token, published_after, published_before
+        )
+        return page.video_ids, page.next_page_token
+
+    async def search_page_async(
+        self,
+        query: str,
+        max_results: int = 50,
+        region_code: str = None,
+        page_token: str = None,
+        published_after: str = None,
+        published_before: str = None
+    ) -> SearchPage:
+        """
+        Versi async dari search_page.
+
+        Args:
+            query: Kata kunci pencarian.
+            max_results: Maksimal hasil per request (max 50).
+            region_code: Kode negara (default US).
+            page_token: Token untuk pagination (default None).
+            published_after: ISO 8601 format untuk tanggal awal.
+            published_before: ISO 8601 format untuk tanggal akhir.
+
+        Returns:
+            SearchPage (video_ids, next_page_token, total_results).
+
+        Raises:
+            YouTubeAPIError: Jika request gagal.
+        """
+        params = self._search_params(
+            query, max_results, region_code, page_token, published_after, published_before
+        )
+
+        try:
+            data = await self._send_async("search", params)
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Request gagal: {describe_error(e)}")
+            raise YouTubeAPIError(f"Gagal menghubungi YouTube API: {describe_error(e)}")
+
+        return self._parse_search_response(data)
+
+    def _search_params(
+        self,
+        query: str,
+        max_results: int,
+        region_code: Optional[str],
+        page_token: Optional[str],
+        published_after: Optional[str],
+        published_before: Optional[str]
+    ) -> Dict[str, Any]:
+        """Query params search.list (lihat search_videos untuk arti argumen)."""
         if region_code is None:
             region_code = Config.REGION_CODE
 
         logger.info(f"Mencari video: query='{query}', max_results={max_results}, page_token={page_token}")
 
         params = {
-            "key": self.api_key,
             "part": "snippet",
             "q": query,
             "type": "video",
@@ -94,7 +310,8 @@ class YouTubeAPI:
             "maxResults": min(max_results, 50),
             "regionCode": region_code,
             "relevanceLanguage": Config.RELEVANCE_LANGUAGE,
-            "videoEmbeddable": "true"
+            "videoEmbeddable": "true",
+            "fields": self.SEARCH_FIELDS
         }
 
         # Tambah page_token jika ada
@@ -110,173 +327,992 @@ class YouTubeAPI:
             params["publishedBefore"] = published_before
             logger.debug(f"Filter publishedBefore: {published_before}")
 
-        try:
-            response = self.session.get(
-                f"{self.base_url}/search",
-                params=params,
-                timeout=30
+        return params
+
+    def _parse_search_response(self, data: Dict[str, Any]) -> SearchPage:
+        """Parse response search.list ke SearchPage."""
+        # Ekstrak video IDs
+        video_ids = [
+            item["id"]["videoId"]
+            for item in data.get("items", [])
+        ]
+
+        # Snippet disimpan supaya videos.list cukup minta statistik.
+        # Judul di search.list di-escape HTML (videos.list tidak)
+        snippets = {}
+        for item in data.get("items", []):
+            snippet = item.get("snippet")
+            if not snippet:
+                continue
+            snippets[item["id"]["videoId"]] = VideoSnippet(
+                title=html.unescape(snippet["title"]),
+                channel_id=snippet["channelId"],
+                channel_title=html.unescape(snippet["channelTitle"]),
+                upload_date=snippet["publishedAt"],
+                thumbnail_url=self._extract_thumbnail(snippet.get("thumbnails", {}))
             )
-            response.raise_for_status()
 
-            data = response.json()
+        next_page_token = data.get("nextPageToken")
+        total_results = int(data.get("pageInfo", {}).get("totalResults", len(video_ids)))
 
-            # Cek error dari YouTube
-            if "error" in data:
-                self._handle_api_error(data["error"])
+        logger.info(f"Ditemukan {len(video_ids)} video IDs (estimasi total {total_results})")
 
-            # Ekstrak video IDs
-            video_ids = [
-                item["id"]["videoId"]
-                for item in data.get("items", [])
-            ]
+        return SearchPage(video_ids, next_page_token, total_results, snippets)
 
-            next_page_token = data.get("nextPageToken")
+    def get_video_details(
+        self,
+        video_ids: List[str],
+        snippets: Dict[str, VideoSnippet] = None
+    ) -> VideoBatchResult:
+        """
+        Ambil detail video secara batch dengan auto-batching.
 
-            logger.info(f"Ditemukan {len(video_ids)} video IDs")
+        Batch yang tetap gagal setelah retry tidak membatalkan batch lain;
+        ID-nya dicatat di failed_ids hasil.
 
-            return video_ids, next_page_token
+        Args:
+            video_ids: List video ID (lebih dari 50 akan di-batch otomatis).
+            snippets: Snippet dari search (SearchPage.snippets). Batch yang
+                semua snippet-nya ada hanya meminta statistik + description.
 
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Request gagal: {e}")
-            raise YouTubeAPIError(f"Gagal menghubungi YouTube API: {e}")
+        Returns:
+            VideoBatchResult (list of video metadata dictionaries + failed_ids).
 
-    def get_video_details(self, video_ids: List[str]) -> List[Dict[str, Any]]:
+        Raises:
+            QuotaExceededException: Jika semua API key kehabisan quota.
         """
-        Ambil detail video secara batch dengan auto-batching.
+        all_videos = VideoBatchResult()
+
+        for batch in self.iter_video_details(video_ids, snippets):
+            all_videos.extend(record._asdict() for record in batch)
+            all_videos.failed_ids.extend(batch.failed_ids)
+
+        logger.info(
+            f"Berhasil mengambil detail {len(all_videos)} videos (total), "
+            f"{len(all_videos.failed_ids)} ID gagal"
+        )
+
+        return all_videos
+
+    def iter_video_details(
+        self,
+        video_ids: List[str],
+        snippets: Dict[str, VideoSnippet] = None
+    ) -> Iterator[VideoBatchResult]:
+        """
+        Generator detail video: yield satu batch (maks 50) begitu tiba.
+
+        Setiap batch berisi VideoRecord (bukan dict), sehingga pemanggil
+        bisa memfilter/menyimpan per batch tanpa menampung semua hasil.
+        Batch yang gagal di-yield kosong dengan failed_ids berisi chunk-nya.
 
         Args:
-            video_ids: List video ID (lebih dari 50 akan di-batch otomatis).
+            video_ids: List video ID.
+            snippets: Snippet dari search (lihat get_video_details).
+
+        Yields:
+            VideoBatchResult berisi VideoRecord.
+
+        Raises:
+            QuotaExceededException: Jika semua API key kehabisan quota.
+        """
+        for batch_no, chunk in enumerate(self._chunk_ids(video_ids), 1):
+            logger.info(f"Mengambil detail {len(chunk)} videos (batch {batch_no})")
+
+            try:
+                data = self._send("videos", self._video_params(chunk, snippets))
+            except QuotaExceededException:
+                raise
+            except (YouTubeAPIError, requests.exceptions.RequestException) as e:
+                self._log_failed_batch("videos", batch_no, chunk, e)
+                yield VideoBatchResult(failed_ids=chunk)
+                continue
+
+            yield VideoBatchResult(self._parse_video_records(data, snippets))
+
+    def get_channel_details(self, channel_ids: List[str]) -> ChannelBatchResult:
+        """
+        Ambil channel details (subs + location), memakai channel cache.
+
+        Hanya channel yang belum ada atau sudah kadaluarsa di cache yang
+        diminta ke channels.list; channel yang sedang difetch request lain
+        ditunggu, bukan diminta ulang.
+
+        Args:
+            channel_ids: List channel ID (lebih dari 50 akan di-batch otomatis).
 
         Returns:
-            List of video metadata dictionaries.
+            ChannelBatchResult (dict channel_id -> {subscriber_count, location}
+            + failed_ids).
 
         Raises:
-            YouTubeAPIError: Jika request gagal.
+            QuotaExceededException: Jika semua API key kehabisan quota.
         """
-        all_videos = []
+        all_channel_data = ChannelBatchResult()
 
-        # Batch otomatis: pecah jadi chunks of 50
-        for i in range(0, len(video_ids), 50):
-            chunk = video_ids[i:i + 50]
-            logger.info(f"Mengambil detail {len(chunk)} videos (batch {i // 50 + 1})")
+        for batch in self.iter_channel_details(channel_ids):
+            all_channel_data.update((channel_id, record.data()) for channel_id, record in batch.items())
+            all_channel_data.failed_ids.extend(batch.failed_ids)
 
-            params = {
-                "key": self.api_key,
-                "part": "snippet,statistics",
-                "id": ",".join(chunk)
-            }
+        logger.info(
+            f"Berhasil mengambil {len(all_channel_data)} channel details (total), "
+            f"{len(all_channel_data.failed_ids)} ID gagal"
+        )
 
-            try:
-                response = self.session.get(
-                    f"{self.base_url}/videos",
-                    params=params,
-                    timeout=30
-                )
-                response.raise_for_status()
-
-                data = response.json()
-
-                if "error" in data:
-                    self._handle_api_error(data["error"])
-
-                # Parse video details
-                for item in data.get("items", []):
-                    video = {
-                        "video_id": item["id"],
-                        "title": item["snippet"]["title"],
-                        "channel_id": item["snippet"]["channelId"],
-                        "channel_title": item["snippet"]["channelTitle"],
-                        "upload_date": item["snippet"]["publishedAt"],
-                        "views": int(item["statistics"].get("viewCount", 0)),
-                        "likes": int(item["statistics"].get("likeCount", 0)),
-                        "description": item["snippet"].get("description", ""),
-                        "thumbnail_url": self._extract_thumbnail(
-                            item["snippet"]["thumbnails"]
-                        )
-                    }
-                    all_videos.append(video)
-
-                logger.info(f"Batch {i // 50 + 1} selesai, total {len(all_videos)} videos")
-
-                # Rate limiting antar batch
-                if i + 50 < len(video_ids):
-                    self.rate_limit()
-
-            except requests.exceptions.RequestException as e:
-                logger.error(f"Request gagal pada batch {i // 50 + 1}: {e}")
-                raise YouTubeAPIError(f"Gagal mengambil detail video: {e}")
-
-        logger.info(f"Berhasil mengambil detail {len(all_videos)} videos (total)")
+        return all_channel_data
+
+    def iter_channel_details(self, channel_ids: List[str]) -> Iterator[ChannelBatchResult]:
+        """
+        Generator channel details: yield per batch begitu tersedia.
+
+        Urutan: channel dari cache dulu (satu batch), lalu setiap batch
+        channels.list, lalu channel yang ditunggu dari request lain.
+
+        Args:
+            channel_ids: List channel ID.
+
+        Yields:
+            ChannelBatchResult berisi channel_id -> ChannelRecord.
+
+        Raises:
+            QuotaExceededException: Jika semua API key kehabisan quota.
+        """
+        cached, to_fetch, pending = self._channel_cache_batch(channel_ids)
+        if cached:
+            yield cached
+
+        chunks = self._chunk_ids(to_fetch)
+        settled = 0
+        try:
+            for batch_no, chunk in enumerate(chunks, 1):
+                logger.info(f"Mengambil detail {len(chunk)} channels (batch {batch_no})")
+
+                try:
+                    data = self._send("channels", self._channel_params(chunk))
+                except QuotaExceededException:
+                    raise
+                except (YouTubeAPIError, requests.exceptions.RequestException) as e:
+                    self._log_failed_batch("channels", batch_no, chunk, e)
+                    batch = ChannelBatchResult(failed_ids=chunk)
+                else:
+                    batch = ChannelBatchResult(self._parse_channel_records(data))
+
+                self._settle_channel_claims(chunk, batch)
+                settled += 1
+                yield batch
+        finally:
+            self._release_channel_claims(chunks[settled:])
+
+        if pending:
+            outcomes = []
+            for channel_id, future in pending.items():
+                try:
+                    outcomes.append((channel_id, future.result()))
+                except YouTubeAPIError as e:
+                    outcomes.append((channel_id, e))
+            yield self._collect_pending_channels(outcomes)
+
+    async def get_video_details_async(
+        self,
+        video_ids: List[str],
+        max_concurrency: int = None,
+        snippets: Dict[str, VideoSnippet] = None
+    ) -> VideoBatchResult:
+        """
+        Versi async dari get_video_details.
+
+        Semua batch 50-ID dikirim bersamaan (dibatasi max_concurrency),
+        tanpa sleep antar batch. Urutan hasil sama dengan versi sinkron.
+
+        Args:
+            video_ids: List video ID (lebih dari 50 akan di-batch otomatis).
+            max_concurrency: Maksimal request paralel. Default dari Config.
+            snippets: Snippet dari search (lihat get_video_details).
+
+        Returns:
+            VideoBatchResult (list of video metadata dictionaries + failed_ids).
+
+        Raises:
+            QuotaExceededException: Jika semua API key kehabisan quota.
+        """
+        batches, failed_ids = await self._gather_chunks(
+            "videos",
+            self._chunk_ids(video_ids),
+            lambda chunk: self._video_params(chunk, snippets),
+            lambda data: self._parse_video_response(data, snippets),
+            max_concurrency
+        )
+        all_videos = VideoBatchResult(
+            (video for batch in batches for video in batch),
+            failed_ids
+        )
+
+        logger.info(
+            f"Berhasil mengambil detail {len(all_videos)} videos (total, async), "
+            f"{len(failed_ids)} ID gagal"
+        )
 
         return all_videos
 
-    def get_channel_details(self, channel_ids: List[str]) -> Dict[str, dict]:
+    async def iter_video_details_async(
+        self,
+        video_ids: List[str],
+        max_concurrency: int = None,
+        snippets: Dict[str, VideoSnippet] = None
+    ) -> AsyncIterator[VideoBatchResult]:
         """
-        Ambil channel details (subs + location) secara batch dengan auto-batching.
+        Versi async dari iter_video_details.
+
+        Semua batch dikirim concurrent; batch di-yield sesuai urutan selesai
+        (bukan urutan ID).
+
+        Args:
+            video_ids: List video ID.
+            max_concurrency: Maksimal request paralel. Default dari Config.
+            snippets: Snippet dari search (lihat get_video_details).
+
+        Yields:
+            VideoBatchResult berisi VideoRecord.
+
+        Raises:
+            QuotaExceededException: Jika semua API key kehabisan quota.
+        """
+        async for _, chunk, data in self._stream_chunks(
+            "videos",
+            self._chunk_ids(video_ids),
+            lambda chunk: self._video_params(chunk, snippets),
+            max_concurrency
+        ):
+            if data is None:
+                yield VideoBatchResult(failed_ids=chunk)
+            else:
+                yield VideoBatchResult(self._parse_video_records(data, snippets))
+
+    async def iter_video_statistics_async(
+        self,
+        video_ids: List[str],
+        max_concurrency: int = None
+    ) -> AsyncIterator[VideoBatchResult]:
+        """
+        Poll statistik (views, likes) video, per batch 50 ID (1 unit per batch).
+
+        Response cache dilewati (statistik selalu baru), tapi hasilnya
+        tetap disimpan ke cache. Batch di-yield sesuai urutan selesai.
+        Video yang sudah dihapus/privat tidak ada di hasil.
+
+        Args:
+            video_ids: List video ID.
+            max_concurrency: Maksimal request paralel. Default dari Config.
+
+        Yields:
+            VideoBatchResult berisi VideoStats.
+
+        Raises:
+            QuotaExceededException: Jika semua API key kehabisan quota.
+        """
+        async for _, chunk, data in self._stream_chunks(
+            "videos",
+            self._chunk_ids(video_ids),
+            self._statistics_params,
+            max_concurrency,
+            use_cache=False
+        ):
+            if data is None:
+                yield VideoBatchResult(failed_ids=chunk)
+            else:
+                yield VideoBatchResult(
+                    VideoStats(
+                        video_id=item["id"],
+                        views=int(item.get("statistics", {}).get("viewCount", 0)),
+                        likes=int(item.get("statistics", {}).get("likeCount", 0))
+                    )
+                    for item in data.get("items", [])
+                )
+
+    async def get_channel_details_async(
+        self,
+        channel_ids: List[str],
+        max_concurrency: int = None
+    ) -> ChannelBatchResult:
+        """
+        Versi async dari get_channel_details.
 
         Args:
             channel_ids: List channel ID (lebih dari 50 akan di-batch otomatis).
+            max_concurrency: Maksimal request paralel. Default dari Config.
 
         Returns:
-            Dict mapping channel_id ke {subscriber_count, location}.
+            ChannelBatchResult (dict channel_id -> {subscriber_count, location}
+            + failed_ids).
 
         Raises:
-            YouTubeAPIError: Jika request gagal.
+            QuotaExceededException: Jika semua API key kehabisan quota.
+        """
+        all_channel_data = ChannelBatchResult()
+
+        async for batch in self.iter_channel_details_async(channel_ids, max_concurrency):
+            all_channel_data.update((channel_id, record.data()) for channel_id, record in batch.items())
+            all_channel_data.failed_ids.extend(batch.failed_ids)
+
+        logger.info(
+            f"Berhasil mengambil {len(all_channel_data)} channel details (total, async), "
+            f"{len(all_channel_data.failed_ids)} ID gagal"
+        )
+
+        return all_channel_data
+
+    async def iter_channel_details_async(
+        self,
+        channel_ids: List[str],
+        max_concurrency: int = None
+    ) -> AsyncIterator[ChannelBatchResult]:
+        """
+        Versi async dari iter_channel_details (batch di-yield sesuai urutan selesai).
+
+        Args:
+            channel_ids: List channel ID.
+            max_concurrency: Maksimal request paralel. Default dari Config.
+
+        Yields:
+            ChannelBatchResult berisi channel_id -> ChannelRecord.
+
+        Raises:
+            QuotaExceededException: Jika semua API key kehabisan quota.
+        """
+        cached, to_fetch, pending = await asyncio.to_thread(self._channel_cache_batch, channel_ids)
+        if cached:
+            yield cached
+
+        chunks = self._chunk_ids(to_fetch)
+        unsettled = {tuple(chunk): chunk for chunk in chunks}
+        try:
+            async for _, chunk, data in self._stream_chunks(
+                "channels", chunks, self._channel_params, max_concurrency
+            ):
+                if data is None:
+                    batch = ChannelBatchResult(failed_ids=chunk)
+                else:
+                    batch = ChannelBatchResult(self._parse_channel_records(data))
+
+                await asyncio.to_thread(self._settle_channel_claims, chunk, batch)
+                del unsettled[tuple(chunk)]
+                yield batch
+        finally:
+            self._release_channel_claims(list(unsettled.values()))
+
+        if pending:
+            outcomes = []
+            for channel_id, future in pending.items():
+                try:
+                    outcomes.append((channel_id, await asyncio.wrap_future(future)))
+                except YouTubeAPIError as e:
+                    outcomes.append((channel_id, e))
+            yield self._collect_pending_channels(outcomes)
+
+    def _channel_cache_batch(
+        self,
+        channel_ids: List[str]
+    ) -> Tuple[Optional[ChannelBatchResult], List[str], Dict[str, Any]]:
+        """
+        Ambil channel yang masih fresh dari cache dan claim sisanya.
+
+        Args:
+            channel_ids: List channel ID.
+
+        Returns:
+            Tuple (batch dari cache atau None, ID yang harus difetch,
+            channel_id -> Future untuk ID yang sedang difetch request lain).
+        """
+        if not self.channel_cache:
+            return None, list(dict.fromkeys(channel_ids)), {}
+
+        found, missing = self.channel_cache.lookup(channel_ids)
+        to_fetch, pending = self.channel_cache.claim(missing)
+        self._log_channel_cache(len(found), len(to_fetch), len(pending))
+
+        cached = ChannelBatchResult(
+            (channel_id, ChannelRecord(channel_id, data["subscriber_count"], data["location"]))
+            for channel_id, data in found.items()
+        )
+        return cached or None, to_fetch, pending
+
+    def _collect_pending_channels(self, outcomes) -> ChannelBatchResult:
+        """
+        Gabungkan hasil channel yang ditunggu dari request lain.
+
+        Args:
+            outcomes: Iterable (channel_id, data dict / None / exception).
+
+        Returns:
+            ChannelBatchResult berisi ChannelRecord.
+        """
+        batch = ChannelBatchResult()
+        for channel_id, outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                batch.failed_ids.append(channel_id)
+            elif outcome is not None:
+                batch[channel_id] = ChannelRecord(channel_id, outcome["subscriber_count"], outcome["location"])
+        return batch
+
+    def _settle_channel_claims(self, claimed: List[str], fetched: ChannelBatchResult) -> None:
+        """
+        Selesaikan claim channel cache: simpan yang sukses, lepas yang gagal.
+
+        Args:
+            claimed: ID yang di-claim untuk difetch.
+            fetched: Hasil fetch berisi ChannelRecord (dengan failed_ids).
+        """
+        if not self.channel_cache:
+            return
+
+        failed = set(fetched.failed_ids)
+        if failed:
+            self.channel_cache.fail(
+                [channel_id for channel_id in claimed if channel_id in failed],
+                YouTubeAPIError("Gagal mengambil channel details")
+            )
+        self.channel_cache.complete(
+            [channel_id for channel_id in claimed if channel_id not in failed],
+            {channel_id: record.data() for channel_id, record in fetched.items()}
+        )
+
+    def _release_channel_claims(self, chunks: List[List[str]]) -> None:
+        """
+        Lepas claim chunk yang tidak jadi difetch (generator berhenti/error).
+
+        Args:
+            chunks: Chunk ID yang belum diselesaikan.
+        """
+        if self.channel_cache and chunks:
+            self.channel_cache.fail(
+                [channel_id for chunk in chunks for channel_id in chunk],
+                YouTubeAPIError("Fetch channel dibatalkan")
+            )
+
+    def _log_failed_batch(
+        self,
+        endpoint: str,
+        batch_no: int,
+        chunk: List[str],
+        error: BaseException
+    ) -> None:
+        """Log batch yang tetap gagal setelah retry (ID-nya dicatat sebagai failed)."""
+        logger.error(
+            f"Batch {batch_no} {endpoint} gagal ({len(chunk)} ID dilewati): {describe_error(error)}"
+        )
+
+    def _log_channel_cache(self, cached: int, to_fetch: int, pending: int) -> None:
+        """Log pembagian channel antara cache, fetch baru, dan yang ditunggu."""
+        logger.info(
+            f"Channel cache: {cached} dari cache, {to_fetch} perlu difetch, "
+            f"{pending} menunggu request lain"
+        )
+
+    async def _gather_chunks(
+        self,
+        endpoint: str,
+        chunks: List[List[str]],
+        build_params: Callable[[List[str]], Dict[str, Any]],
+        parse_response: Callable[[Dict[str, Any]], Any],
+        max_concurrency: Optional[int]
+    ) -> Tuple[List[Any], List[str]]:
+        """
+        Ambil semua chunk secara concurrent, hasil sesuai urutan chunk.
+
+        Args:
+            endpoint: Nama endpoint (videos, channels).
+            chunks: List chunk ID.
+            build_params: Function chunk -> query params.
+            parse_response: Function response JSON -> hasil parse.
+            max_concurrency: Maksimal request paralel per API key. Default dari Config.
+
+        Returns:
+            Tuple (hasil chunk yang sukses sesuai urutan chunks, ID yang gagal).
+
+        Raises:
+            QuotaExceededException: Jika semua API key kehabisan quota.
+        """
+        results = {}
+        failed = {}
+
+        async for index, chunk, data in self._stream_chunks(endpoint, chunks, build_params, max_concurrency):
+            if data is None:
+                failed[index] = chunk
+            else:
+                results[index] = parse_response(data)
+
+        failed_ids = [item_id for index in sorted(failed) for item_id in failed[index]]
+        return [results[index] for index in sorted(results)], failed_ids
+
+    async def _stream_chunks(
+        self,
+        endpoint: str,
+        chunks: List[List[str]],
+        build_params: Callable[[List[str]], Dict[str, Any]],
+        max_concurrency: Optional[int],
+        use_cache: bool = True
+    ) -> AsyncIterator[Tuple[int, List[str], Optional[Dict[str, Any]]]]:
+        """
+        Kirim semua chunk concurrent dan yield response sesuai urutan selesai.
+
+        Semaphore membatasi jumlah request paralel (per API key di pool);
+        tiap chunk dikirim lewat _send_async. Chunk yang gagal di-yield
+        dengan data None dan tidak membatalkan chunk lain. Kalau pemanggil
+        berhenti lebih awal, request yang belum selesai dibatalkan.
+
+        Args:
+            endpoint: Nama endpoint (videos, channels).
+            chunks: List chunk ID.
+            build_params: Function chunk -> query params.
+            max_concurrency: Maksimal request paralel per API key. Default dari Config.
+            use_cache: False untuk melewati lookup response cache.
+
+        Yields:
+            Tuple (index chunk, chunk, response JSON atau None jika gagal).
+
+        Raises:
+            QuotaExceededException: Jika semua API key kehabisan quota.
+        """
+        if max_concurrency is None:
+            max_concurrency = Config.YOUTUBE_MAX_CONCURRENCY
+
+        semaphore = asyncio.Semaphore(max(1, max_concurrency * len(self.key_pool)))
+
+        async def run(index: int, chunk: List[str]):
+            async with semaphore:
+                logger.info(f"Mengambil detail {len(chunk)} {endpoint} (batch {index + 1}, async)")
+                try:
+                    return index, chunk, await self._send_async(endpoint, build_params(chunk), use_cache)
+                except QuotaExceededException:
+                    raise
+                except (YouTubeAPIError, requests.exceptions.RequestException) as e:
+                    self._log_failed_batch(endpoint, index + 1, chunk, e)
+                    return index, chunk, None
+
+        tasks = [asyncio.ensure_future(run(index, chunk)) for index, chunk in enumerate(chunks)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _chunk_ids(self, ids: List[str]) -> List[List[str]]:
+        """
+        Pecah list ID menjadi chunks sesuai BATCH_SIZE.
+
+        Args:
+            ids: List ID.
+
+        Returns:
+            List of chunks.
+        """
+        return [ids[i:i + self.BATCH_SIZE] for i in range(0, len(ids), self.BATCH_SIZE)]
+
+    def _video_params(
+        self,
+        chunk: List[str],
+        snippets: Dict[str, VideoSnippet] = None
+    ) -> Dict[str, Any]:
+        """Query params videos.list untuk satu chunk (ringkas jika snippet lengkap)."""
+        known = bool(snippets) and all(video_id in snippets for video_id in chunk)
+        return {
+            "part": "snippet,statistics",
+            "id": ",".join(chunk),
+            "fields": self.VIDEO_STATS_FIELDS if known else self.VIDEO_FIELDS
+        }
+
+    def _statistics_params(self, chunk: List[str]) -> Dict[str, Any]:
+        """Query params videos.list statistik saja untuk satu chunk."""
+        return {
+            "part": "statistics",
+            "id": ",".join(chunk),
+            "fields": self.STATS_FIELDS
+        }
+
+    def _channel_params(self, chunk: List[str]) -> Dict[str, Any]:
+        """Query params channels.list untuk satu chunk."""
+        return {
+            "part": "statistics,snippet",
+            "id": ",".join(chunk),
+            "fields": self.CHANNEL_FIELDS
+        }
+
+    def _parse_video_records(
+        self,
+        data: Dict[str, Any],
+        snippets: Dict[str, VideoSnippet] = None
+    ) -> List[VideoRecord]:
+        """Parse response videos.list ke list VideoRecord."""
+        snippets = snippets or {}
+        return [
+            self._parse_video_record(item, snippets.get(item["id"]))
+            for item in data.get("items", [])
+        ]
+
+    def _parse_channel_records(self, data: Dict[str, Any]) -> Dict[str, ChannelRecord]:
+        """Parse response channels.list ke dict channel_id -> ChannelRecord."""
+        return {item["id"]: self._parse_channel_record(item) for item in data.get("items", [])}
+
+    def _parse_video_response(
+        self,
+        data: Dict[str, Any],
+        snippets: Dict[str, VideoSnippet] = None
+    ) -> List[Dict[str, Any]]:
+        """Parse response videos.list ke list video metadata."""
+        return [record._asdict() for record in self._parse_video_records(data, snippets)]
+
+    def _send(self, endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """
-        all_channel_data = {}
+        Kirim GET request ke endpoint YouTube API dan parse JSON-nya.
 
-        # Batch otomatis: pecah jadi chunks of 50
-        for i in range(0, len(channel_ids), 50):
-            chunk = channel_ids[i:i + 50]
-            logger.info(f"Mengambil detail {len(chunk)} channels (batch {i // 50 + 1})")
+        Semua request lewat sini (atau _send_async): cek response cache dulu,
+        lalu ambil key + izin rate limiter dari pool. Kalau key kena
+        quotaExceeded, request diulang dengan key lain (failover transparan).
+        Error sementara (5xx, 429, timeout) di-retry dengan backoff + jitter,
+        dan circuit breaker menolak request saat API sedang down.
 
-            params = {
-                "key": self.api_key,
-                "part": "statistics,snippet",
-                "id": ",".join(chunk)
-            }
+        Args:
+            endpoint: Nama endpoint (search, videos, channels).
+            params: Query parameters tanpa API key.
+
+        Returns:
+            Response JSON sebagai dict.
 
+        Raises:
+            requests.exceptions.RequestException: Jika HTTP request gagal.
+            QuotaExceededException: Jika semua key kehabisan quota.
+            CircuitOpenError: Jika circuit breaker terbuka.
+            YouTubeAPIError: Jika YouTube mengembalikan error.
+        """
+        entry = self.cache.lookup(endpoint, params) if self.cache else None
+        if entry is not None and entry.fresh:
+            logger.debug(f"Cache hit {endpoint}")
+            return entry.data()
+
+        attempt = 0
+        while True:
+            self.circuit_breaker.before_request()
+            slot = self.key_pool.acquire(endpoint)
             try:
-                response = self.session.get(
-                    f"{self.base_url}/channels",
-                    params=params,
-                    timeout=30
-                )
-                response.raise_for_status()
+                data = self._request(endpoint, params, slot, entry)
+            except QuotaExceededException:
+                self._fail_over(endpoint, slot)
+                continue
+            except (RateLimitedError, requests.exceptions.RequestException) as e:
+                attempt += 1
+                delay = self._retry_delay(endpoint, attempt, e)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+                continue
+            except YouTubeAPIError:
+                # API menjawab (error permanen): bukan tanda outage
+                self.circuit_breaker.record_success()
+                raise
+
+            self.circuit_breaker.record_success()
+            return data
+
+    async def _send_async(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        use_cache: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Versi async dari _send.
 
-                data = response.json()
+        Key dan izin rate limiter diambil di event loop (tanpa blocking
+        sleep); cache lookup dan HTTP request dijalankan di thread pool.
 
-                if "error" in data:
-                    self._handle_api_error(data["error"])
+        Args:
+            endpoint: Nama endpoint (search, videos, channels).
+            params: Query parameters tanpa API key.
+            use_cache: False untuk selalu request ke API (response tetap
+                disimpan ke cache).
 
-                # Parse channel details
-                for item in data.get("items", []):
-                    channel_id = item["id"]
-                    subscriber_count = int(item["statistics"].get("subscriberCount", 0))
-                    # Ambil lokasi dari snippet (negara)
-                    location = item["snippet"].get("country", "")
-                    # Atau dari localized title/description
-                    if not location:
-                        location = item["snippet"].get("localized", {}).get("country", "")
+        Returns:
+            Response JSON sebagai dict.
 
-                    all_channel_data[channel_id] = {
-                        "subscriber_count": subscriber_count,
-                        "location": location
-                    }
+        Raises:
+            requests.exceptions.RequestException: Jika HTTP request gagal.
+            QuotaExceededException: Jika semua key kehabisan quota.
+            CircuitOpenError: Jika circuit breaker terbuka.
+            YouTubeAPIError: Jika YouTube mengembalikan error.
+        """
+        entry = None
+        if self.cache and use_cache:
+            entry = await asyncio.to_thread(self.cache.lookup, endpoint, params)
+            if entry is not None and entry.fresh:
+                logger.debug(f"Cache hit {endpoint}")
+                return entry.data()
+
+        attempt = 0
+        while True:
+            self.circuit_breaker.before_request()
+            slot = await self.key_pool.acquire_async(endpoint)
+            try:
+                data = await asyncio.to_thread(self._request, endpoint, params, slot, entry)
+            except QuotaExceededException:
+                self._fail_over(endpoint, slot)
+                continue
+            except (RateLimitedError, requests.exceptions.RequestException) as e:
+                attempt += 1
+                delay = self._retry_delay(endpoint, attempt, e)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                continue
+            except YouTubeAPIError:
+                self.circuit_breaker.record_success()
+                raise
+
+            self.circuit_breaker.record_success()
+            return data
+
+    def _retry_delay(self, endpoint: str, attempt: int, error: BaseException) -> Optional[float]:
+        """
+        Tentukan apakah request yang gagal di-retry, dan berapa lama menunggu.
 
-                logger.info(f"Batch {i // 50 + 1} selesai, total {len(all_channel_data)} channels")
+        Error sementara dicatat ke circuit breaker. Error permanen (4xx
+        selain 429) tidak di-retry, dan karena server menjawab, tidak
+        dihitung sebagai outage.
 
-                # Rate limiting antar batch
-                if i + 50 < len(channel_ids):
-                    self.rate_limit()
+        Args:
+            endpoint: Nama endpoint.
+            attempt: Nomor percobaan yang baru saja gagal (mulai 1).
+            error: Exception percobaan itu.
 
-            except requests.exceptions.RequestException as e:
-                logger.error(f"Request gagal pada batch {i // 50 + 1}: {e}")
-                raise YouTubeAPIError(f"Gagal mengambil channel details: {e}")
+        Returns:
+            Detik tunggu sebelum retry, atau None jika tidak perlu retry.
+        """
+        if not self.retry_policy.is_retryable(error):
+            if isinstance(error, requests.exceptions.HTTPError):
+                self.circuit_breaker.record_success()
+            return None
 
-        logger.info(f"Berhasil mengambil {len(all_channel_data)} channel details (total)")
+        self.circuit_breaker.record_failure()
 
-        return all_channel_data
+        if attempt >= self.retry_policy.max_attempts:
+            logger.error(
+                f"Request {endpoint} gagal setelah {attempt} percobaan: {describe_error(error)}"
+            )
+            return None
+
+        delay = self.retry_policy.backoff(attempt, error)
+        logger.warning(
+            f"Request {endpoint} gagal (percobaan {attempt}/{self.retry_policy.max_attempts}): "
+            f"{describe_error(error)}, retry dalam {delay:.2f} detik"
+        )
+        return delay
+
+    def _fail_over(self, endpoint: str, slot: KeySlot) -> None:
+        """
+        Tandai key habis supaya request berikutnya pindah ke key lain.
+
+        Args:
+            endpoint: Nama endpoint.
+            slot: Key yang kena quotaExceeded.
+        """
+        self.key_pool.mark_exhausted(slot.key_id)
+        logger.warning(f"Failover {endpoint}: key {slot.key_id} habis, coba key lain")
+
+    def _request(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        slot: KeySlot,
+        cached: Optional[CacheEntry] = None
+    ) -> Dict[str, Any]:
+        """
+        Satu HTTP request dengan key tertentu.
+
+        Kalau ada entry cache stale dengan ETag, request dikirim conditional
+        (If-None-Match); 304 langsung memakai body cache tanpa parse response.
+
+        Args:
+            endpoint: Nama endpoint.
+            params: Query parameters tanpa API key.
+            slot: Key yang dipakai.
+            cached: Entry cache stale untuk revalidasi (opsional).
+
+        Returns:
+            Response JSON sebagai dict.
+
+        Raises:
+            requests.exceptions.RequestException: Jika HTTP request gagal.
+            QuotaExceededException: Jika quota key ini habis.
+            YouTubeAPIError: Jika YouTube mengembalikan error.
+        """
+        headers = {}
+        if cached is not None and cached.etag:
+            headers["If-None-Match"] = cached.etag
+
+        response = self.session.get(
+            f"{self.base_url}/{endpoint}",
+            params={"key": slot.api_key, **params},
+            headers=headers,
+            timeout=30
+        )
+
+        # Request sudah sampai ke YouTube: quota terpakai apapun hasilnya
+        QuotaLog.record(
+            endpoint=endpoint,
+            units=slot.rate_limiter.cost(endpoint),
+            key_id=slot.key_id,
+            quota_day=quota_day().isoformat(),
+            run_id=self.run_id
+        )
+
+        if response.status_code == 304 and cached is not None:
+            self.cache.refresh(cached)
+            return cached.data()
+
+        # quotaExceeded dikirim sebagai 403 dengan JSON error body
+        if response.status_code == 403:
+            try:
+                error_data = response.json().get("error")
+            except ValueError:
+                error_data = None
+            if error_data:
+                self._handle_api_error(error_data)
+
+        response.raise_for_status()
+
+        data = response.json()
+
+        # Cek error dari YouTube
+        if "error" in data:
+            self._handle_api_error(data["error"])
+
+        if self.cache:
+            self.cache.store(
+                endpoint,
+                params,
+                response.content,
+                response.headers.get("ETag") or data.get("etag")
+            )
+
+        return data
+
+    def _parse_video_record(
+        self,
+        item: Dict[str, Any],
+        snippet: Optional[VideoSnippet] = None
+    ) -> VideoRecord:
+        """
+        Parse satu item videos.list ke VideoRecord.
+
+        Args:
+            item: Item dari response videos.list.
+            snippet: Snippet dari search. Jika ada, judul/channel/tanggal
+                diambil dari sini (response cukup berisi statistik).
+
+        Returns:
+            VideoRecord.
+        """
+        # Dengan param fields, object tanpa isi (mis. like disembunyikan) tidak dikirim
+        details = item.get("snippet", {})
+        statistics = item.get("statistics", {})
+        thumbnails = details.get("thumbnails", {})
+
+        if snippet is None:
+            snippet = VideoSnippet(
+                title=details["title"],
+                channel_id=details["channelId"],
+                channel_title=details["channelTitle"],
+                upload_date=details["publishedAt"],
+                thumbnail_url=self._extract_thumbnail(thumbnails)
+            )
+        elif thumbnails:
+            # Thumbnail maxres/standard hanya ada di videos.list
+            snippet = snippet._replace(thumbnail_url=self._extract_thumbnail(thumbnails))
+
+        return VideoRecord(
+            video_id=item["id"],
+            title=snippet.title,
+            channel_id=snippet.channel_id,
+            channel_title=snippet.channel_title,
+            upload_date=snippet.upload_date,
+            views=int(statistics.get("viewCount", 0)),
+            likes=int(statistics.get("likeCount", 0)),
+            description=details.get("description", ""),
+            thumbnail_url=snippet.thumbnail_url
+        )
+
+    def _parse_channel_record(self, item: Dict[str, Any]) -> ChannelRecord:
+        """
+        Parse satu item channels.list ke ChannelRecord.
+
+        Args:
+            item: Item dari response channels.list.
+
+        Returns:
+            ChannelRecord.
+        """
+        subscriber_count = int(item.get("statistics", {}).get("subscriberCount", 0))
+        # Ambil lokasi dari snippet (negara); snippet tidak dikirim jika
+        # channel tidak punya country (param fields)
+        location = item.get("snippet", {}).get("country", "")
+
+        return ChannelRecord(
+            channel_id=item["id"],
+            subscriber_count=subscriber_count,
+            location=location
+        )
+
+    def cache_stats(self) -> Dict[str, int]:
+        """
+        Counter hit/miss response cache.
+
+        Returns:
+            Dict dari ResponseCache.stats(), kosong jika cache tidak aktif.
+        """
+        return self.cache.stats() if self.cache else {}
+
+    def channel_cache_stats(self) -> Dict[str, int]:
+        """
+        Counter hit/miss channel cache.
+
+        Returns:
+            Dict dari ChannelCache.stats(), kosong jika cache tidak aktif.
+        """
+        return self.channel_cache.stats() if self.channel_cache else {}
+
+    def http_stats(self) -> Dict[str, Any]:
+        """
+        Statistik pemakaian ulang koneksi HTTP (pool shared).
+
+        Returns:
+            Dict dari HTTPPool.stats().
+        """
+        return self.http_pool.stats()
+
+    def circuit_stats(self) -> Dict[str, Any]:
+        """
+        Statistik circuit breaker client ini.
+
+        Returns:
+            Dict dari CircuitBreaker.stats().
+        """
+        return self.circuit_breaker.stats()
+
+    def remaining_quota(self) -> int:
+        """
+        Sisa quota unit hari ini di semua API key client ini.
+
+        Returns:
+            Jumlah unit yang masih bisa dipakai.
+        """
+        self._sync_quota_from_ledger()
+        return self.key_pool.remaining_units()
+
+    def _sync_quota_from_ledger(self) -> None:
+        """Samakan pemakaian unit setiap key dengan ledger quota hari ini."""
+        today = quota_day().isoformat()
+        for slot in self.key_pool.slots:
+            slot.rate_limiter.sync_units_used(QuotaLog.units_used_on(today, slot.key_id))
 
     def calculate_days_ago(self, upload_date_str: str) -> int:
         """
@@ -339,20 +1375,28 @@ class YouTubeAPI:
 
         Raises:
             QuotaExceededException: Jika quota habis.
+            RateLimitedError: Jika kena rate limit (bisa di-retry).
             YouTubeAPIError: Untuk error lainnya.
         """
         reason = error_data.get("errors", [{}])[0].get("reason", "unknown")
 
-        if reason == "quotaExceeded":
+        if reason in ("quotaExceeded", "dailyLimitExceeded"):
             logger.error("YouTube API quota habis")
             raise QuotaExceededException("YouTube API quota habis")
 
+        if reason in ("rateLimitExceeded", "userRateLimitExceeded"):
+            logger.warning(f"YouTube API rate limit: {reason}")
+            raise RateLimitedError(f"YouTube API rate limit: {reason}")
+
         logger.error(f"YouTube API error: {reason}")
         raise YouTubeAPIError(f"YouTube API error: {reason}")
 
     def rate_limit(self, delay: float = None) -> None:
         """
-        Apply rate limiting dengan delay.
+        Apply delay manual.
+
+        Request API sudah dibatasi otomatis oleh rate_limiter; method ini
+        hanya untuk jeda eksplisit di luar request.
 
         Args:
             delay: Delay dalam detik. Default dari config.
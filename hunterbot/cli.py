@@ -0,0 +1,563 @@
+"""
+CLI Hunterbot - jalankan hunt tanpa GUI (headless, cron).
+
+Contoh:
+    python -m hunterbot hunt "american truck" "us election" --target 50
+    python -m hunterbot hunt --queries-file queries.txt --workers 3 --output hasil.jsonl
+    cat queries.txt | python -m hunterbot hunt --output -
+    python -m hunterbot resume
+    python -m hunterbot schedule add truk --cron "0 */4 * * *" "american truck" --target 50
+    python -m hunterbot scheduler --processes 4 --workers 2
+    python -m hunterbot gui
+
+Setiap query dijalankan sebagai run terpisah (atau satu batch hunt dengan
+--batch); beberapa run berjalan paralel di process pool (--workers).
+Dengan --workers N, sisa quota hari ini dibagi rata menjadi jatah tetap
+setiap worker, jadi total pemakaian tidak melebihi sisa quota.
+Hasil selalu tersimpan di database; --output menulis video hasil setiap
+run sebagai JSONL. Tanpa --output, stdout berisi satu baris JSON ringkasan
+per run. Log ditulis ke stderr.
+
+Subcommand schedule mengelola jadwal hunt berkala, jobs menampilkan
+antrian job, dan scheduler menjalankan scheduler (modules.scheduler) di
+foreground sampai dihentikan (Ctrl+C / SIGTERM).
+
+Module ini hanya mengimpor library standar dan Config di level module.
+HunterModule (numpy, requests) diimpor saat hunt dijalankan dan GUI
+(customtkinter) hanya untuk subcommand gui, supaya CLI cepat start dan
+bisa jalan di mesin tanpa display.
+"""
+
+import argparse
+import json
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional, TextIO
+
+from hunterbot.config import Config
+
+# Exit code
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_USAGE = 2
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Parser argumen CLI."""
+    parser = argparse.ArgumentParser(
+        prog="python -m hunterbot",
+        description="Hunterbot - hunt video YouTube tanpa GUI"
+    )
+    parser.add_argument("--db", default=None, help="Path database (default dari Config)")
+    parser.add_argument("--log-level", default=None, help="Level log (default dari Config)")
+    commands = parser.add_subparsers(dest="command")
+
+    hunt = commands.add_parser("hunt", help="Jalankan hunt untuk query dari argumen, file, atau stdin")
+    hunt.add_argument("queries", nargs="*", help="Query pencarian")
+    hunt.add_argument("-f", "--queries-file", default=None,
+                      help="File berisi satu query per baris ('-' = stdin, baris # diabaikan)")
+    hunt.add_argument("-r", "--region", action="append", dest="regions", default=None,
+                      help="Region code (boleh diulang). Default Config.REGION_CODE")
+    hunt.add_argument("-t", "--target", type=int, default=None, help="Target video per run")
+    hunt.add_argument("--buffer", type=float, default=None,
+                      help="Buffer factor kandidat. Default dipelajari dari run sebelumnya")
+    hunt.add_argument("--rules", default=None, help="File JSON berisi list rule filter (modules.rules)")
+    hunt.add_argument("--batch", action="store_true",
+                      help="Semua query dalam satu batch hunt (satu run) alih-alih satu run per query")
+    hunt.add_argument("-w", "--workers", type=int, default=1, help="Jumlah run paralel (process)")
+    hunt.add_argument("-o", "--output", default=None, help="Tulis video hasil sebagai JSONL ('-' = stdout)")
+    hunt.add_argument("--no-scale-down", action="store_true",
+                      help="Tolak hunt (jangan perkecil target) kalau quota tidak cukup")
+
+    resume = commands.add_parser("resume", help="Lanjutkan run yang terputus")
+    resume.add_argument("run_id", nargs="?", default=None, help="ID run. Default run terakhir yang terputus")
+    resume.add_argument("-o", "--output", default=None, help="Tulis video hasil sebagai JSONL ('-' = stdout)")
+
+    schedule = commands.add_parser("schedule", help="Kelola jadwal hunt berkala")
+    schedule_commands = schedule.add_subparsers(dest="schedule_command")
+    add = schedule_commands.add_parser("add", help="Tambah jadwal")
+    add.add_argument("name", help="Nama unik jadwal")
+    add.add_argument("queries", nargs="+", help="Query pencarian")
+    add.add_argument("-c", "--cron", required=True, help="Ekspresi cron 5 field (waktu lokal) atau @hourly/@daily")
+    add.add_argument("-r", "--region", action="append", dest="regions", default=None,
+                     help="Region code (boleh diulang). Default Config.REGION_CODE")
+    add.add_argument("-t", "--target", type=int, default=None, help="Target video per hunt")
+    add.add_argument("--rules", default=None, help="File JSON berisi list rule filter (modules.rules)")
+    add.add_argument("-p", "--priority", type=float, default=1.0, help="Bobot prioritas (default 1.0)")
+    schedule_commands.add_parser("list", help="Daftar jadwal")
+    for action, help_text in (("remove", "Hapus jadwal"), ("enable", "Aktifkan jadwal"),
+                              ("disable", "Nonaktifkan jadwal")):
+        schedule_commands.add_parser(action, help=help_text).add_argument("name", help="Nama atau ID jadwal")
+
+    jobs = commands.add_parser("jobs", help="Daftar job scheduler")
+    jobs.add_argument("-s", "--status", default=None, help="Filter status (queued, deferred, running, ...)")
+    jobs.add_argument("-n", "--limit", type=int, default=20, help="Jumlah job (default 20)")
+
+    daemon = commands.add_parser("scheduler", help="Jalankan scheduler hunt berkala (foreground)")
+    daemon.add_argument("-w", "--workers", type=int, default=None, help="Job paralel. Default Config")
+    daemon.add_argument("--poll", type=float, default=None, help="Detik antar tick. Default Config")
+    daemon.add_argument("-P", "--processes", type=int, default=1,
+                        help="Proses scheduler yang berbagi antrian job (default 1)")
+
+    commands.add_parser("gui", help="Jalankan aplikasi desktop")
+    return parser
+
+
+def read_queries(queries: List[str], queries_file: Optional[str], stdin: TextIO = None) -> List[str]:
+    """
+    Kumpulkan query dari argumen dan file/stdin.
+
+    Tanpa argumen dan tanpa file, query dibaca dari stdin kalau stdin
+    bukan terminal (pipe/redirect).
+
+    Args:
+        queries: Query dari argumen.
+        queries_file: Path file query, '-' untuk stdin, atau None.
+        stdin: Stream stdin. Default sys.stdin.
+
+    Returns:
+        List query unik (urutan dipertahankan), tanpa baris kosong/komentar.
+    """
+    stdin = stdin or sys.stdin
+    lines = list(queries)
+    if queries_file == "-" or (queries_file is None and not queries and not stdin.isatty()):
+        lines.extend(stdin.read().splitlines())
+    elif queries_file:
+        with open(queries_file, encoding="utf-8") as f:
+            lines.extend(f.read().splitlines())
+
+    cleaned = (line.strip() for line in lines)
+    return list(dict.fromkeys(line for line in cleaned if line and not line.startswith("#")))
+
+
+def load_rules(path: Optional[str]) -> Optional[List[dict]]:
+    """
+    Baca dan validasi file rule JSON.
+
+    Args:
+        path: Path file, atau None.
+
+    Returns:
+        List rule (format RuleSet.to_list), atau None jika path None.
+
+    Raises:
+        ValueError: Jika file tidak bisa dibaca atau rule tidak valid.
+    """
+    if not path:
+        return None
+
+    from hunterbot.modules.rules import RuleSet
+
+    try:
+        with open(path, encoding="utf-8") as f:
+            rules = json.load(f)
+        RuleSet.from_list(rules)
+    except (OSError, ValueError, TypeError) as e:
+        raise ValueError(f"Rule tidak valid ({path}): {e}")
+    return rules
+
+
+def _init_worker(
+    database_path: Optional[str],
+    log_level: Optional[str],
+    rate_share: int,
+    unit_budget: Optional[int] = None
+) -> None:
+    """
+    Inisialisasi process (worker pool atau process utama).
+
+    Args:
+        database_path: Path database, None = default Config.
+        log_level: Level log, None = default Config.
+        rate_share: Jumlah process yang berbagi rate limit YouTube; setiap
+            process mendapat 1/rate_share dari YOUTUBE_REQUESTS_PER_SECOND.
+        unit_budget: Jatah quota unit process ini untuk semua run-nya
+            (Config.YOUTUBE_UNIT_BUDGET), None = tanpa jatah.
+    """
+    from hunterbot.utils.logger import setup_logging
+
+    if database_path:
+        Config.DATABASE_PATH = database_path
+    if rate_share > 1:
+        Config.YOUTUBE_REQUESTS_PER_SECOND = Config.YOUTUBE_REQUESTS_PER_SECOND / rate_share
+    if unit_budget is not None:
+        Config.YOUTUBE_UNIT_BUDGET = unit_budget
+    setup_logging(log_level, stream=sys.stderr)
+
+
+def _unit_share(workers: int) -> int:
+    """
+    Jatah quota unit per worker: sisa quota hari ini (ledger) dibagi rata.
+
+    Setiap worker hanya menghitung request-nya sendiri, jadi tanpa jatah
+    N worker bisa memakai sampai N x sisa quota.
+
+    Args:
+        workers: Jumlah worker process.
+
+    Returns:
+        Unit per worker.
+
+    Raises:
+        ValueError: Jika API key tidak ada.
+    """
+    from hunterbot.api.youtube_api import YouTubeAPI
+
+    return max(0, YouTubeAPI().remaining_quota()) // workers
+
+
+def _summary(queries: List[str], hunter, status: str, error: str = None) -> Dict[str, Any]:
+    """Ringkasan satu run (bisa di-pickle dan di-serialize ke JSON)."""
+    stats = dict(hunter.stats)
+    stats["failed_ids"] = len(stats.get("failed_ids") or [])
+    return {
+        "queries": queries,
+        "run_id": hunter.run_id,
+        "status": status,
+        "error": error,
+        "stats": json.loads(json.dumps(stats, default=str)),
+    }
+
+
+def run_hunt(queries: List[str], options: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Jalankan satu run hunt (dipanggil di worker process).
+
+    Args:
+        queries: Query run ini (lebih dari satu = batch hunt).
+        options: Dict regions, target_count, buffer_factor,
+            allow_scale_down, rules (argumen scrape_batch).
+
+    Returns:
+        Dict queries, run_id, status (completed, interrupted, failed),
+        error, stats. Error tidak di-raise supaya run lain tetap jalan.
+    """
+    from hunterbot.api.youtube_api import QuotaExceededException, YouTubeAPIError
+    from hunterbot.modules.hunter import HunterModule
+
+    hunter = HunterModule()
+    try:
+        hunter.scrape_batch(queries, **options)
+    except (QuotaExceededException, YouTubeAPIError) as e:
+        # Run sudah tercatat: bisa dilanjutkan dengan subcommand resume
+        status = "interrupted" if hunter.run_id else "failed"
+        return _summary(queries, hunter, status, str(e))
+    except Exception as e:
+        return _summary(queries, hunter, "failed", str(e))
+    return _summary(queries, hunter, "completed")
+
+
+def write_videos(run_id: str, queries: List[str], output: TextIO) -> int:
+    """
+    Tulis video hasil satu run sebagai JSONL.
+
+    Args:
+        run_id: ID run.
+        queries: Query run (ikut ditulis di setiap baris).
+        output: Stream tujuan.
+
+    Returns:
+        Jumlah baris yang ditulis.
+    """
+    from hunterbot.database.models import Video
+
+    videos = Video.get_all(run_id=run_id)
+    for video in videos:
+        output.write(json.dumps({"run_id": run_id, "queries": queries, **video.to_dict()}, default=str) + "\n")
+    output.flush()
+    return len(videos)
+
+
+def _open_output(path: Optional[str]) -> Optional[TextIO]:
+    """Stream output JSONL: None, stdout ('-'), atau file (append)."""
+    if path is None:
+        return None
+    if path == "-":
+        return sys.stdout
+    return open(path, "a", encoding="utf-8")
+
+
+def _report(result: Dict[str, Any], output: Optional[TextIO]) -> None:
+    """Tulis hasil satu run: video ke output JSONL, ringkasan ke stdout/stderr."""
+    stats = result["stats"]
+    line = (
+        f"Run {result['run_id'] or '-'} {result['status']}: {', '.join(result['queries'])} - "
+        f"{stats.get('total_scraped', 0)} discraping, {stats.get('saved', {}).get('inserted', 0)} baru, "
+        f"quota {stats.get('quota_units', 0)} unit"
+    )
+    if result["error"]:
+        line += f" ({result['error']})"
+    print(line, file=sys.stderr)
+
+    if output is None:
+        print(json.dumps(result), flush=True)
+    elif result["run_id"] and result["status"] == "completed":
+        write_videos(result["run_id"], result["queries"], output)
+
+
+def cmd_hunt(args: argparse.Namespace) -> int:
+    """Subcommand hunt."""
+    try:
+        queries = read_queries(args.queries, args.queries_file)
+    except OSError as e:
+        print(f"Gagal membaca file query: {e}", file=sys.stderr)
+        return EXIT_USAGE
+    if not queries:
+        print("Tidak ada query (argumen, --queries-file, atau stdin)", file=sys.stderr)
+        return EXIT_USAGE
+    if args.workers < 1:
+        print("--workers minimal 1", file=sys.stderr)
+        return EXIT_USAGE
+
+    try:
+        rules = load_rules(args.rules)
+    except ValueError as e:
+        print(str(e), file=sys.stderr)
+        return EXIT_USAGE
+
+    options = {
+        "regions": args.regions,
+        "target_count": args.target,
+        "buffer_factor": args.buffer,
+        "allow_scale_down": not args.no_scale_down,
+        "rules": rules,
+    }
+    jobs = [queries] if args.batch else [[query] for query in queries]
+    workers = min(args.workers, len(jobs))
+
+    _init_worker(args.db, args.log_level, 1)
+    from hunterbot.database.schema import init_database
+
+    init_database().close()
+
+    unit_budget = None
+    if workers > 1:
+        try:
+            unit_budget = _unit_share(workers)
+        except ValueError as e:
+            print(str(e), file=sys.stderr)
+            return EXIT_FAILED
+        print(f"Jatah quota per worker: {unit_budget} unit", file=sys.stderr)
+
+    output = _open_output(args.output)
+    results = []
+    try:
+        if workers == 1:
+            for job in jobs:
+                results.append(run_hunt(job, options))
+                _report(results[-1], output)
+        else:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(args.db, args.log_level, workers, unit_budget)
+            ) as pool:
+                futures = [pool.submit(run_hunt, job, options) for job in jobs]
+                for future in as_completed(futures):
+                    results.append(future.result())
+                    _report(results[-1], output)
+    finally:
+        if output is not None and output is not sys.stdout:
+            output.close()
+
+    return EXIT_OK if all(r["status"] == "completed" for r in results) else EXIT_FAILED
+
+
+def cmd_resume(args: argparse.Namespace) -> int:
+    """Subcommand resume."""
+    _init_worker(args.db, args.log_level, 1)
+    from hunterbot.api.youtube_api import QuotaExceededException, YouTubeAPIError
+    from hunterbot.database.models import Run
+    from hunterbot.database.schema import init_database
+    from hunterbot.modules.hunter import HunterModule
+
+    init_database().close()
+    hunter = HunterModule()
+    try:
+        hunter.resume_run(args.run_id)
+    except ValueError as e:
+        print(str(e), file=sys.stderr)
+        return EXIT_USAGE
+    except (QuotaExceededException, YouTubeAPIError) as e:
+        status, error = "interrupted", str(e)
+    else:
+        status, error = "completed", None
+
+    queries = [query for query, _ in Run.get(hunter.run_id)["params"]["searches"]]
+    result = _summary(queries, hunter, status, error)
+    output = _open_output(args.output)
+    try:
+        _report(result, output)
+    finally:
+        if output is not None and output is not sys.stdout:
+            output.close()
+    return EXIT_OK if result["status"] == "completed" else EXIT_FAILED
+
+
+def cmd_schedule(args: argparse.Namespace) -> int:
+    """Subcommand schedule (add, list, remove, enable, disable)."""
+    _init_worker(args.db, args.log_level, 1)
+    from hunterbot.database.models import Schedule
+    from hunterbot.database.schema import init_database
+    from hunterbot.modules.scheduler import HuntScheduler
+
+    init_database().close()
+    if args.schedule_command == "list":
+        for schedule in Schedule.get_all():
+            print(json.dumps(schedule))
+        return EXIT_OK
+    if args.schedule_command is None:
+        print("Subcommand schedule: add, list, remove, enable, disable", file=sys.stderr)
+        return EXIT_USAGE
+
+    try:
+        # YouTubeAPI di dalam HuntScheduler butuh API key (ValueError)
+        scheduler = HuntScheduler()
+        if args.schedule_command == "add":
+            schedule = scheduler.add_schedule(
+                args.name, args.cron, args.queries, args.regions,
+                args.target, load_rules(args.rules), args.priority
+            )
+        elif args.schedule_command == "remove":
+            if not scheduler.remove_schedule(args.name):
+                raise ValueError(f"Jadwal tidak ditemukan: {args.name}")
+            return EXIT_OK
+        else:
+            schedule = scheduler.set_enabled(args.name, args.schedule_command == "enable")
+    except ValueError as e:
+        print(str(e), file=sys.stderr)
+        return EXIT_USAGE
+
+    print(json.dumps(schedule))
+    return EXIT_OK
+
+
+def cmd_jobs(args: argparse.Namespace) -> int:
+    """Subcommand jobs."""
+    _init_worker(args.db, args.log_level, 1)
+    from hunterbot.database.models import Job
+    from hunterbot.database.schema import init_database
+
+    init_database().close()
+    for job in Job.recent(args.status, args.limit):
+        print(json.dumps(job))
+    return EXIT_OK
+
+
+def run_scheduler(
+    database_path: Optional[str],
+    log_level: Optional[str],
+    workers: Optional[int],
+    poll_interval: Optional[float],
+    rate_share: int
+) -> None:
+    """
+    Jalankan satu proses scheduler sampai Ctrl+C atau SIGTERM.
+
+    Args:
+        database_path: Path database, None = default Config.
+        log_level: Level log, None = default Config.
+        workers: Job paralel (thread) proses ini, None = default Config.
+        poll_interval: Detik antar tick, None = default Config.
+        rate_share: Jumlah proses yang berbagi rate limit YouTube.
+    """
+    import signal
+    import threading
+
+    _init_worker(database_path, log_level, rate_share)
+    from hunterbot.modules.scheduler import HuntScheduler
+
+    stopped = threading.Event()
+    signal.signal(signal.SIGTERM, lambda signum, frame: stopped.set())
+
+    scheduler = HuntScheduler(workers, poll_interval)
+    scheduler.start()
+    try:
+        while not stopped.wait(1.0):
+            pass
+    except KeyboardInterrupt:
+        pass
+    finally:
+        scheduler.stop()
+
+
+def cmd_scheduler(args: argparse.Namespace) -> int:
+    """
+    Subcommand scheduler: jalan sampai Ctrl+C atau SIGTERM.
+
+    Dengan --processes N, N proses scheduler berbagi antrian job di
+    database (lease + heartbeat, lihat modules.scheduler); SIGTERM
+    diteruskan ke semua proses.
+    """
+    import multiprocessing
+    import signal
+
+    if args.processes < 1:
+        print("--processes minimal 1", file=sys.stderr)
+        return EXIT_USAGE
+
+    _init_worker(args.db, args.log_level, 1)
+    from hunterbot.database.schema import init_database
+
+    init_database().close()
+    if args.processes == 1:
+        run_scheduler(args.db, args.log_level, args.workers, args.poll, 1)
+        return EXIT_OK
+
+    processes = [
+        multiprocessing.Process(
+            target=run_scheduler,
+            args=(args.db, args.log_level, args.workers, args.poll, args.processes),
+            name=f"hunterbot-scheduler-{index}"
+        )
+        for index in range(args.processes)
+    ]
+    for process in processes:
+        process.start()
+    signal.signal(signal.SIGTERM, lambda signum, frame: [p.terminate() for p in processes if p.is_alive()])
+
+    for process in processes:
+        while process.is_alive():
+            try:
+                process.join()
+            except KeyboardInterrupt:
+                # Ctrl+C juga diterima proses anak (satu process group)
+                pass
+    return EXIT_OK if all(process.exitcode == 0 for process in processes) else EXIT_FAILED
+
+
+def cmd_gui(args: argparse.Namespace) -> int:
+    """Subcommand gui (aplikasi desktop)."""
+    if args.db:
+        Config.DATABASE_PATH = args.db
+    from hunterbot.main import main as gui_main
+
+    return gui_main()
+
+
+def main(argv: List[str] = None) -> int:
+    """
+    Entry point CLI.
+
+    Args:
+        argv: Argumen (tanpa nama program). Default sys.argv[1:].
+
+    Returns:
+        Exit code: 0 semua run selesai, 1 ada run gagal/terputus,
+        2 argumen tidak valid.
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    commands = {
+        "hunt": cmd_hunt,
+        "resume": cmd_resume,
+        "schedule": cmd_schedule,
+        "jobs": cmd_jobs,
+        "scheduler": cmd_scheduler,
+        "gui": cmd_gui,
+    }
+    if args.command not in commands:
+        parser.print_help(sys.stderr)
+        return EXIT_USAGE
+    return commands[args.command](args)
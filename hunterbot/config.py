@@ -6,7 +6,7 @@ Module ini berisi semua konfigurasi global untuk aplikasi.
 
 import os
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 from dotenv import load_dotenv
 
 # Load environment variables dari .env file
@@ -24,6 +24,20 @@ LOGS_DIR.mkdir(exist_ok=True)
 EXPORTS_DIR.mkdir(exist_ok=True)
 
 
+def _load_youtube_api_keys() -> List[str]:
+    """
+    Kumpulkan semua YouTube API key dari environment.
+
+    YOUTUBE_API_KEY (key utama) ditambah YOUTUBE_API_KEYS (dipisah koma).
+
+    Returns:
+        List API key unik, key utama di depan.
+    """
+    keys = [os.getenv("YOUTUBE_API_KEY", "")]
+    keys.extend(os.getenv("YOUTUBE_API_KEYS", "").split(","))
+    return list(dict.fromkeys(key.strip() for key in keys if key.strip()))
+
+
 class Config:
     """Konfigurasi global aplikasi."""
 
@@ -31,20 +45,90 @@ class Config:
     DATABASE_PATH: str = str(DATABASE_PATH)
     DATABASE_BACKUP_DIR: Path = BASE_DIR / "backups"
     DATABASE_BACKUP_DIR.mkdir(exist_ok=True)
+    DATABASE_JOURNAL_MODE: str = os.getenv("DATABASE_JOURNAL_MODE", "WAL").upper()  # DELETE untuk volume jaringan
 
     # Kunci API (dari environment variables)
     YOUTUBE_API_KEY: str = os.getenv("YOUTUBE_API_KEY", "")
+    YOUTUBE_API_KEYS: List[str] = _load_youtube_api_keys()  # Pool key (Guardian)
     DEEPGRAM_API_KEY: str = os.getenv("DEEPGRAM_API_KEY", "")
     GEMINI_API_KEY: str = os.getenv("GEMINI_API_KEY", "")
 
+    # YouTube Data API
+    YOUTUBE_API_BASE_URL: str = os.getenv(
+        "YOUTUBE_API_BASE_URL", "https://www.googleapis.com/youtube/v3"
+    )
+    YOUTUBE_MAX_CONCURRENCY: int = 4  # Maksimal request paralel per API key (mode async)
+    YOUTUBE_REQUESTS_PER_SECOND: float = 5.0  # Token bucket request per detik
+    YOUTUBE_DAILY_QUOTA: int = 10000  # Quota unit harian per API key
+    YOUTUBE_UNIT_BUDGET: Optional[int] = None  # Jatah unit proses ini (semua key/run), None = tanpa batas
+    YOUTUBE_QUOTA_COSTS: Dict[str, int] = {
+        "search": 100,
+        "videos": 1,
+        "channels": 1,
+    }
+    YOUTUBE_EST_REQUEST_LATENCY: float = 0.5  # Estimasi latency per request (planner)
+    YOUTUBE_CACHE_ENABLED: bool = os.getenv("YOUTUBE_CACHE_ENABLED", "1") != "0"
+    YOUTUBE_CACHE_TTL: Dict[str, int] = {  # TTL response cache (detik)
+        "search": 6 * 3600,
+        "videos": 3600,
+        "channels": 24 * 3600,
+    }
+    YOUTUBE_RETRY_ATTEMPTS: int = 4  # Maksimal percobaan per request (error sementara)
+    YOUTUBE_RETRY_BASE_DELAY: float = 0.5  # Backoff awal (detik), naik eksponensial
+    YOUTUBE_RETRY_MAX_DELAY: float = 30.0  # Batas backoff / Retry-After (detik)
+    YOUTUBE_BREAKER_THRESHOLD: int = 5  # Error beruntun sebelum circuit breaker terbuka
+    YOUTUBE_BREAKER_RESET: float = 30.0  # Detik circuit terbuka sebelum request percobaan
+    YOUTUBE_HTTP_POOL_SIZE: int = int(os.getenv("YOUTUBE_HTTP_POOL_SIZE", "32"))  # Koneksi per host (shared)
+    YOUTUBE_HTTP_POOL_BLOCK: bool = False  # True: tunggu koneksi bebas saat pool penuh
+    YOUTUBE_HTTP_TCP_KEEPALIVE: bool = True  # SO_KEEPALIVE untuk koneksi yang idle
+    # Transport HTTP: live (default), record (rekam ke cassette), replay (offline)
+    YOUTUBE_TRANSPORT: str = os.getenv("YOUTUBE_TRANSPORT", "live")
+    YOUTUBE_CASSETTE_PATH: str = os.getenv(
+        "YOUTUBE_CASSETTE_PATH", str(BASE_DIR / "cassettes" / "youtube.jsonl.gz")
+    )
+    YOUTUBE_REPLAY_LATENCY: float = float(os.getenv("YOUTUBE_REPLAY_LATENCY", "0"))
+    YOUTUBE_REPLAY_ERROR_RATE: float = float(os.getenv("YOUTUBE_REPLAY_ERROR_RATE", "0"))
+    CHANNEL_CACHE_TTL: int = 72 * 3600  # Umur maksimal data channel (detik)
+    CHANNEL_LRU_SIZE: int = 5000  # Jumlah channel di cache in-process
+
+    # Refresh statistik berkala (time series views/likes untuk VPH)
+    STATS_REFRESH_ENABLED: bool = os.getenv("STATS_REFRESH_ENABLED", "1") != "0"
+    STATS_REFRESH_INTERVAL: int = int(os.getenv("STATS_REFRESH_INTERVAL", "3600"))  # Detik antar poll
+    STATS_TRACK_DAYS: int = 14  # Hanya video yang diupload N hari terakhir yang dipoll
+    STATS_VELOCITY_WINDOW_HOURS: int = 48  # Snapshot yang dipakai untuk VPH/akselerasi
+    STATS_RETENTION_DAYS: int = 30  # Snapshot lebih lama dari ini dihapus
+
+    # Scheduler hunt berkala (jadwal cron + antrian job di database)
+    SCHEDULER_ENABLED: bool = os.getenv("SCHEDULER_ENABLED", "0") == "1"  # Jalankan bersama GUI
+    SCHEDULER_WORKERS: int = 2  # Hunt yang berjalan paralel (thread)
+    SCHEDULER_POLL_INTERVAL: float = 30.0  # Detik antar cek jadwal dan antrian
+    SCHEDULER_RESERVE_UNITS: int = 1000  # Sisa quota harian yang tidak dipakai job (hunt manual)
+    SCHEDULER_MAX_ATTEMPTS: int = 3  # Percobaan job yang error sebelum ditandai failed
+    SCHEDULER_RETRY_DELAY: float = 300.0  # Jeda retry job yang error (detik, dikali percobaan)
+    SCHEDULER_LEASE_SECONDS: float = 120.0  # Lease job; worker mati = job diambil lagi setelah ini
+    SCHEDULER_HEARTBEAT_INTERVAL: float = 30.0  # Detik antar perpanjangan lease job yang berjalan
+
     # Scraping settings
     TARGET_VIDEO_COUNT: int = 100  # MVP: 100 videos
+    SEARCH_BUFFER_FACTOR: float = 3.0  # Fetch 3× target untuk buffer filter
+    SEARCH_BUFFER_ADAPTIVE: bool = True  # Buffer dipelajari dari pass rate run sebelumnya
+    SEARCH_BUFFER_MIN: float = 1.2  # Batas bawah buffer hasil belajar
+    SEARCH_BUFFER_MAX: float = 6.0  # Batas atas buffer hasil belajar
+    SEARCH_BUFFER_SAFETY: float = 1.25  # Kelebihan kandidat di atas target / pass rate
+    SEARCH_BUFFER_PRIOR_WEIGHT: int = 100  # Bobot default (kandidat semu) saat histori sedikit
+    SEARCH_BUFFER_HISTORY_RUNS: int = 20  # Run selesai terakhir yang dipakai untuk belajar
+    SEARCH_EARLY_STOP: bool = True  # Berhenti fetch kandidat begitu target lulus Tier 1 tercapai
     MAX_RESULTS_PER_REQUEST: int = 50
+    SEARCH_SLICE_CAPACITY: int = 500  # Hasil maksimal yang bisa di-paginate per date window
+    SEARCH_MIN_SLICE_HOURS: int = 1  # Slice date window terkecil (tidak dibagi lagi)
+    PIPELINE_VALIDATE_WORKERS: int = 2  # Worker paralel stage validasi Tier 1 (CPU)
+    PIPELINE_QUEUE_SIZE: int = 64  # Kapasitas antrian stage per video (backpressure)
+    PIPELINE_PERSIST_BATCH: int = 50  # Video per transaksi simpan (Video.save_many)
     REGION_CODE: str = "US"
     RELEVANCE_LANGUAGE: str = "en"
 
     # Rate limiting (seconds)
-    YOUTUBE_RATE_LIMIT: float = 2.0
+    YOUTUBE_RATE_LIMIT: float = 2.0  # Delay manual (request dibatasi rate limiter)
     DEEPGRAM_RATE_LIMIT: float = 2.0
     GEMINI_RATE_LIMIT: float = 1.0
 
@@ -67,7 +151,7 @@ class Config:
             Dict dengan status validasi setiap komponen.
         """
         validation_result = {
-            "youtube_api_key": bool(cls.YOUTUBE_API_KEY),
+            "youtube_api_key": bool(cls.YOUTUBE_API_KEYS),
             "deepgram_api_key": bool(cls.DEEPGRAM_API_KEY),  # Optional untuk MVP
             "gemini_api_key": bool(cls.GEMINI_API_KEY),      # Optional untuk MVP
             "database_path": True,  # Akan dibuat otomatis
@@ -82,4 +166,4 @@ class Config:
 
         MVP hanya butuh YouTube API key.
         """
-        return bool(cls.YOUTUBE_API_KEY)
+        return bool(cls.YOUTUBE_API_KEYS)
@@ -3,6 +3,6 @@ Package untuk database Hunterbot.
 """
 
 from hunterbot.database.schema import init_database
-from hunterbot.database.models import Video
+from hunterbot.database.models import Video, QuotaLog, Channel, VideoStat, Run, RunCheckpoint, Schedule, Job
 
-__all__ = ["init_database", "Video"]
+__all__ = ["init_database", "Video", "QuotaLog", "Channel", "VideoStat", "Run", "RunCheckpoint", "Schedule", "Job"]
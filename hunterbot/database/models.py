@@ -4,20 +4,34 @@ Model database Hunterbot.
 Module ini berisi kelas model untuk interaksi dengan tabel database.
 """
 
+import json
 import sqlite3
 import logging
 import time
 import threading
 from typing import Optional, List, Dict, Any
-from datetime import datetime
+from datetime import datetime, timezone
 
 from hunterbot.database.schema import get_connection
 
 logger = logging.getLogger(__name__)
 
-# Global lock untuk mencegah concurrent write ke database
+# Global lock untuk mencegah concurrent write ke database (antar thread satu
+# proses). Antar proses, transaksi tulis memakai BEGIN IMMEDIATE supaya lock
+# tulis SQLite diambil di awal dan busy_timeout berlaku (tanpa gagal upgrade
+# lock di tengah transaksi)
 _db_write_lock = threading.Lock()
 
+# Kolom INSERT tabel videos (urutan sesuai Video._insert_values)
+_VIDEO_INSERT_COLUMNS = """
+    video_id, title, channel_id, channel_title, subscriber_count,
+    upload_date, upload_days_ago, views, likes, thumbnail_url, description,
+    state, error_message, passed_min_views, passed_max_views_vs_subs, passed_upload_age,
+    tier1_validated, tier1_score, tier1_language_score, tier1_currency_score,
+    tier1_cultural_score, tier1_region_score, tier1_has_exclude, channel_location
+"""
+_VIDEO_INSERT_PLACEHOLDERS = ", ".join(["?"] * 24)
+
 
 def retry_on_locked(func, max_retries=3):
     """
@@ -57,6 +71,9 @@ class Video:
     STATE_PROCESSED = "PROCESSED"
     STATE_FAILED = "FAILED"
 
+    # Batas parameter per query IN (aman untuk SQLite lama)
+    QUERY_CHUNK_SIZE = 500
+
     def __init__(self, **kwargs):
         """
         Inisialisasi objek Video.
@@ -178,40 +195,10 @@ class Video:
 
                 if self.id is None:
                     # Insert baru dengan IGNORE untuk skip duplicate
-                    cursor.execute("""
-                        INSERT OR IGNORE INTO videos (
-                            video_id, title, channel_id, channel_title, subscriber_count,
-                            upload_date, upload_days_ago, views, likes, thumbnail_url, description,
-                            state, error_message, passed_min_views, passed_max_views_vs_subs, passed_upload_age,
-                            tier1_validated, tier1_score, tier1_language_score, tier1_currency_score,
-                            tier1_cultural_score, tier1_region_score, tier1_has_exclude, channel_location
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        self.video_id,
-                        self.title,
-                        self.channel_id,
-                        self.channel_title,
-                        self.subscriber_count,
-                        self.upload_date,
-                        self.upload_days_ago,
-                        self.views,
-                        self.likes,
-                        self.thumbnail_url,
-                        self.description,
-                        self.state,
-                        self.error_message,
-                        1 if self.passed_min_views else 0,
-                        1 if self.passed_max_views_vs_subs else 0,
-                        1 if self.passed_upload_age else 0,
-                        1 if self.tier1_validated else 0,
-                        self.tier1_score,
-                        self.tier1_language_score,
-                        self.tier1_currency_score,
-                        self.tier1_cultural_score,
-                        self.tier1_region_score,
-                        1 if self.tier1_has_exclude else 0,
-                        self.channel_location
-                    ))
+                    cursor.execute(f"""
+                        INSERT OR IGNORE INTO videos ({_VIDEO_INSERT_COLUMNS})
+                        VALUES ({_VIDEO_INSERT_PLACEHOLDERS})
+                    """, self._insert_values())
 
                     # Cek apakah insert berhasil atau di-skip karena duplicate
                     if cursor.rowcount > 0:
@@ -281,6 +268,143 @@ class Video:
 
         return False
 
+    def _insert_values(self) -> tuple:
+        """Nilai kolom untuk INSERT, urut sesuai _VIDEO_INSERT_COLUMNS."""
+        return (
+            self.video_id,
+            self.title,
+            self.channel_id,
+            self.channel_title,
+            self.subscriber_count,
+            self.upload_date,
+            self.upload_days_ago,
+            self.views,
+            self.likes,
+            self.thumbnail_url,
+            self.description,
+            self.state,
+            self.error_message,
+            1 if self.passed_min_views else 0,
+            1 if self.passed_max_views_vs_subs else 0,
+            1 if self.passed_upload_age else 0,
+            1 if self.tier1_validated else 0,
+            self.tier1_score,
+            self.tier1_language_score,
+            self.tier1_currency_score,
+            self.tier1_cultural_score,
+            self.tier1_region_score,
+            1 if self.tier1_has_exclude else 0,
+            self.channel_location
+        )
+
+    @classmethod
+    def save_many(cls, videos: List["Video"], run_id: Optional[str] = None) -> Dict[str, int]:
+        """
+        Simpan banyak video sekaligus (upsert) dalam satu transaksi.
+
+        Video yang video_id-nya sudah ada diperbarui metadata, hasil
+        filter dan skor Tier 1-nya. state dan error_message baris lama
+        tidak diubah supaya video yang sudah diproses tidak kembali ke
+        SCRAPED. Video dengan video_id sama dalam satu batch: yang
+        terakhir dipakai. Jika run_id diisi, keanggotaan video di run itu
+        (tabel run_videos) dicatat di transaksi yang sama.
+
+        Args:
+            videos: List Video.
+            run_id: ID run pemilik hasil ini (opsional).
+
+        Returns:
+            Dict inserted, updated, failed (jumlah video).
+        """
+        result = {"inserted": 0, "updated": 0, "failed": 0}
+        unique = list({video.video_id: video for video in videos}.values())
+        if not unique:
+            return result
+
+        video_ids = [video.video_id for video in unique]
+        rows = [video._insert_values() for video in unique]
+
+        max_retries = 3
+        for attempt in range(max_retries):
+            conn = None
+            try:
+                with _db_write_lock:
+                    conn = get_connection()
+                    conn.execute("BEGIN IMMEDIATE")
+
+                    existing = set()
+                    for i in range(0, len(video_ids), cls.QUERY_CHUNK_SIZE):
+                        chunk = video_ids[i:i + cls.QUERY_CHUNK_SIZE]
+                        placeholders = ",".join("?" * len(chunk))
+                        existing.update(row[0] for row in conn.execute(
+                            f"SELECT video_id FROM videos WHERE video_id IN ({placeholders})", chunk
+                        ))
+
+                    conn.executemany(f"""
+                        INSERT INTO videos ({_VIDEO_INSERT_COLUMNS})
+                        VALUES ({_VIDEO_INSERT_PLACEHOLDERS})
+                        ON CONFLICT(video_id) DO UPDATE SET
+                            title = excluded.title,
+                            channel_id = excluded.channel_id,
+                            channel_title = excluded.channel_title,
+                            subscriber_count = excluded.subscriber_count,
+                            upload_date = excluded.upload_date,
+                            upload_days_ago = excluded.upload_days_ago,
+                            views = excluded.views,
+                            likes = excluded.likes,
+                            thumbnail_url = excluded.thumbnail_url,
+                            description = excluded.description,
+                            passed_min_views = excluded.passed_min_views,
+                            passed_max_views_vs_subs = excluded.passed_max_views_vs_subs,
+                            passed_upload_age = excluded.passed_upload_age,
+                            tier1_validated = excluded.tier1_validated,
+                            tier1_score = excluded.tier1_score,
+                            tier1_language_score = excluded.tier1_language_score,
+                            tier1_currency_score = excluded.tier1_currency_score,
+                            tier1_cultural_score = excluded.tier1_cultural_score,
+                            tier1_region_score = excluded.tier1_region_score,
+                            tier1_has_exclude = excluded.tier1_has_exclude,
+                            channel_location = excluded.channel_location,
+                            updated_at = datetime('now')
+                    """, rows)
+                    if run_id:
+                        conn.executemany(
+                            "INSERT OR IGNORE INTO run_videos (run_id, video_id) VALUES (?, ?)",
+                            [(run_id, video_id) for video_id in video_ids]
+                        )
+                    conn.commit()
+
+                result["updated"] = len(existing)
+                result["inserted"] = len(unique) - len(existing)
+                logger.info(
+                    f"Bulk save: {result['inserted']} video baru, {result['updated']} diperbarui"
+                )
+                return result
+
+            except sqlite3.OperationalError as e:
+                if conn:
+                    conn.rollback()
+                if "locked" in str(e).lower() and attempt < max_retries - 1:
+                    wait_time = 0.5 * (2 ** attempt)  # 0.5s, 1s, 2s
+                    logger.warning(f"Database locked, retry {attempt + 1}/{max_retries} dalam {wait_time}s")
+                    time.sleep(wait_time)
+                    continue
+                logger.error(f"Gagal bulk save {len(unique)} video: {e}")
+                break
+
+            except sqlite3.Error as e:
+                logger.error(f"Gagal bulk save {len(unique)} video: {e}")
+                if conn:
+                    conn.rollback()
+                break
+
+            finally:
+                if conn:
+                    conn.close()
+
+        result["failed"] = len(unique)
+        return result
+
     @classmethod
     def get_by_video_id(cls, video_id: str) -> Optional["Video"]:
         """
@@ -315,12 +439,13 @@ class Video:
                 conn.close()
 
     @classmethod
-    def get_all(cls, limit: Optional[int] = None) -> List["Video"]:
+    def get_all(cls, limit: Optional[int] = None, run_id: Optional[str] = None) -> List["Video"]:
         """
         Ambil semua video dari database.
 
         Args:
             limit: Maksimal jumlah video. Default None (semua).
+            run_id: Hanya video hasil run ini. Default None (semua run).
 
         Returns:
             List of Video objects.
@@ -330,11 +455,20 @@ class Video:
             conn = get_connection()
             cursor = conn.cursor()
 
-            query = "SELECT * FROM videos ORDER BY views DESC"
+            if run_id:
+                query = """
+                    SELECT v.* FROM run_videos r
+                    JOIN videos v ON v.video_id = r.video_id
+                    WHERE r.run_id = ? ORDER BY v.views DESC
+                """
+                params = (run_id,)
+            else:
+                query = "SELECT * FROM videos ORDER BY views DESC"
+                params = ()
             if limit:
-                query += f" LIMIT {limit}"
+                query += f" LIMIT {int(limit)}"
 
-            cursor.execute(query)
+            cursor.execute(query, params)
             rows = cursor.fetchall()
 
             return [cls.from_db_row(row) for row in rows]
@@ -347,10 +481,40 @@ class Video:
                 conn.close()
 
     @classmethod
-    def count(cls) -> int:
+    def ids_uploaded_since(cls, upload_date: str) -> List[str]:
+        """
+        Ambil video ID yang diupload sejak tanggal tertentu.
+
+        Args:
+            upload_date: Batas bawah (ISO 8601 UTC, format YYYY-MM-DDTHH:MM:SSZ).
+
+        Returns:
+            List video ID, views terbanyak dulu.
+        """
+        conn = None
+        try:
+            conn = get_connection()
+            rows = conn.execute(
+                "SELECT video_id FROM videos WHERE upload_date >= ? ORDER BY views DESC",
+                (upload_date,)
+            ).fetchall()
+            return [row["video_id"] for row in rows]
+
+        except sqlite3.Error as e:
+            logger.error(f"Gagal mengambil daftar video: {e}")
+            return []
+        finally:
+            if conn:
+                conn.close()
+
+    @classmethod
+    def count(cls, run_id: Optional[str] = None) -> int:
         """
         Hitung total video dalam database.
 
+        Args:
+            run_id: Hanya video hasil run ini. Default None (semua run).
+
         Returns:
             Jumlah video dalam database.
         """
@@ -359,7 +523,10 @@ class Video:
             conn = get_connection()
             cursor = conn.cursor()
 
-            cursor.execute("SELECT COUNT(*) FROM videos")
+            if run_id:
+                cursor.execute("SELECT COUNT(*) FROM run_videos WHERE run_id = ?", (run_id,))
+            else:
+                cursor.execute("SELECT COUNT(*) FROM videos")
             count = cursor.fetchone()[0]
 
             return count
@@ -374,19 +541,25 @@ class Video:
     @classmethod
     def delete_all(cls) -> int:
         """
-        Hapus semua video dari database.
+        Hapus semua video dari database (termasuk keanggotaan run).
+
+        Hunt tidak memanggil ini lagi: hasil setiap run dicatat di
+        run_videos dan dibaca lewat get_all(run_id=...).
 
         Returns:
             Jumlah video yang dihapus.
         """
         conn = None
         try:
-            conn = get_connection()
-            cursor = conn.cursor()
+            with _db_write_lock:
+                conn = get_connection()
+                cursor = conn.cursor()
 
-            cursor.execute("DELETE FROM videos")
-            count = cursor.rowcount
-            conn.commit()
+                cursor.execute("BEGIN IMMEDIATE")
+                cursor.execute("DELETE FROM videos")
+                count = cursor.rowcount
+                cursor.execute("DELETE FROM run_videos")
+                conn.commit()
 
             logger.info(f"Semua video dihapus: {count} record")
             return count
@@ -446,14 +619,22 @@ class Video:
     @property
     def vph(self) -> float:
         """
-        Views Per Hour - VPH.
+        Views Per Hour - VPH rata-rata sejak upload.
 
-        Hitungan: views / (days_ago × 24)
+        Hitungan: views / jam sejak upload_date (minimal 1 jam), jadi video
+        yang baru diupload (< 1 hari) tetap punya nilai. VPH sesaat dari
+        snapshot statistik ada di StatsRefresher.velocity().
         """
-        if self.upload_days_ago and self.upload_days_ago > 0:
-            hours = self.upload_days_ago * 24
-            return round(self.views / hours, 2) if self.views else 0
-        return 0.0
+        if not self.views or not self.upload_date:
+            return 0.0
+        try:
+            uploaded = datetime.fromisoformat(self.upload_date.replace("Z", "+00:00"))
+        except ValueError:
+            return 0.0
+        if uploaded.tzinfo is None:
+            uploaded = uploaded.replace(tzinfo=timezone.utc)
+        hours = max(1.0, (datetime.now(timezone.utc) - uploaded).total_seconds() / 3600)
+        return round(self.views / hours, 2)
 
     @property
     def engagement_rate(self) -> float:
@@ -501,3 +682,1426 @@ class Video:
             "NZ": "New Zealand",
         }
         return country_map.get(self.channel_location.upper(), self.channel_location)
+
+
+class QuotaLog:
+    """
+    Model untuk tabel quota_log (ledger quota YouTube API).
+
+    Setiap request ke YouTube API dicatat satu baris: endpoint, unit,
+    fingerprint key, dan run id.
+    """
+
+    @classmethod
+    def record(
+        cls,
+        endpoint: str,
+        units: int,
+        key_id: str,
+        quota_day: str,
+        run_id: Optional[str] = None
+    ) -> bool:
+        """
+        Catat pemakaian quota satu request.
+
+        Args:
+            endpoint: Nama endpoint (search, videos, channels).
+            units: Quota unit yang terpakai.
+            key_id: Fingerprint API key.
+            quota_day: Hari quota YouTube (YYYY-MM-DD).
+            run_id: ID run hunt (opsional).
+
+        Returns:
+            bool: True jika berhasil dicatat.
+        """
+        conn = None
+        try:
+            with _db_write_lock:
+                conn = get_connection()
+                conn.execute("""
+                    INSERT INTO quota_log (run_id, key_id, endpoint, units, quota_day)
+                    VALUES (?, ?, ?, ?, ?)
+                """, (run_id, key_id, endpoint, units, quota_day))
+                conn.commit()
+            return True
+
+        except sqlite3.Error as e:
+            logger.warning(f"Gagal mencatat quota {endpoint} ({units} unit): {e}")
+            return False
+        finally:
+            if conn:
+                conn.close()
+
+    @classmethod
+    def units_used_on(cls, quota_day: str, key_id: Optional[str] = None) -> int:
+        """
+        Total unit terpakai pada satu hari quota.
+
+        Args:
+            quota_day: Hari quota YouTube (YYYY-MM-DD).
+            key_id: Fingerprint API key. Default None (semua key).
+
+        Returns:
+            Jumlah unit.
+        """
+        conn = None
+        try:
+            conn = get_connection()
+            query = "SELECT COALESCE(SUM(units), 0) FROM quota_log WHERE quota_day = ?"
+            params: List[Any] = [quota_day]
+            if key_id is not None:
+                query += " AND key_id = ?"
+                params.append(key_id)
+
+            return conn.execute(query, params).fetchone()[0]
+
+        except sqlite3.Error as e:
+            logger.warning(f"Gagal membaca ledger quota: {e}")
+            return 0
+        finally:
+            if conn:
+                conn.close()
+
+    @classmethod
+    def units_for_run(cls, run_id: str) -> Dict[str, int]:
+        """
+        Pemakaian unit per endpoint untuk satu run.
+
+        Args:
+            run_id: ID run hunt.
+
+        Returns:
+            Dict mapping endpoint ke jumlah unit.
+        """
+        conn = None
+        try:
+            conn = get_connection()
+            rows = conn.execute("""
+                SELECT endpoint, SUM(units) AS units FROM quota_log
+                WHERE run_id = ? GROUP BY endpoint
+            """, (run_id,)).fetchall()
+
+            return {row["endpoint"]: row["units"] for row in rows}
+
+        except sqlite3.Error as e:
+            logger.warning(f"Gagal membaca quota run {run_id}: {e}")
+            return {}
+        finally:
+            if conn:
+                conn.close()
+
+
+class Channel:
+    """
+    Model untuk tabel channels (cache metadata channel).
+
+    Menyimpan subscriber count dan lokasi channel beserta waktu fetch,
+    supaya channels.list tidak perlu dipanggil ulang untuk channel yang sama.
+    """
+
+    # Batas parameter per query IN (aman untuk SQLite lama)
+    QUERY_CHUNK_SIZE = 500
+
+    @classmethod
+    def get_many(
+        cls,
+        channel_ids: List[str],
+        min_fetched_at: float = 0.0
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Ambil data channel yang fetched_at >= min_fetched_at.
+
+        Args:
+            channel_ids: List channel ID.
+            min_fetched_at: Batas bawah fetched_at (Unix timestamp).
+
+        Returns:
+            Dict mapping channel_id ke {subscriber_count, location, fetched_at}.
+        """
+        result: Dict[str, Dict[str, Any]] = {}
+        if not channel_ids:
+            return result
+
+        conn = None
+        try:
+            conn = get_connection()
+            for i in range(0, len(channel_ids), cls.QUERY_CHUNK_SIZE):
+                chunk = channel_ids[i:i + cls.QUERY_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(f"""
+                    SELECT channel_id, subscriber_count, location, fetched_at
+                    FROM channels
+                    WHERE channel_id IN ({placeholders}) AND fetched_at >= ?
+                """, (*chunk, min_fetched_at)).fetchall()
+
+                for row in rows:
+                    result[row["channel_id"]] = {
+                        "subscriber_count": row["subscriber_count"],
+                        "location": row["location"] or "",
+                        "fetched_at": row["fetched_at"],
+                    }
+
+            return result
+
+        except sqlite3.Error as e:
+            logger.warning(f"Gagal membaca cache channel: {e}")
+            return result
+        finally:
+            if conn:
+                conn.close()
+
+    @classmethod
+    def save_many(cls, channels: Dict[str, Dict[str, Any]], fetched_at: float) -> int:
+        """
+        Simpan/update data channel sekaligus dalam satu transaksi.
+
+        Args:
+            channels: Dict mapping channel_id ke {subscriber_count, location}.
+            fetched_at: Waktu fetch (Unix timestamp).
+
+        Returns:
+            Jumlah channel yang disimpan.
+        """
+        if not channels:
+            return 0
+
+        rows = [
+            (channel_id, data.get("subscriber_count", 0), data.get("location", ""), fetched_at)
+            for channel_id, data in channels.items()
+        ]
+
+        conn = None
+        try:
+            with _db_write_lock:
+                conn = get_connection()
+                conn.execute("BEGIN IMMEDIATE")
+                conn.executemany("""
+                    INSERT INTO channels (channel_id, subscriber_count, location, fetched_at)
+                    VALUES (?, ?, ?, ?)
+                    ON CONFLICT(channel_id) DO UPDATE SET
+                        subscriber_count = excluded.subscriber_count,
+                        location = excluded.location,
+                        fetched_at = excluded.fetched_at
+                """, rows)
+                conn.commit()
+            return len(rows)
+
+        except sqlite3.Error as e:
+            logger.warning(f"Gagal menyimpan cache channel: {e}")
+            if conn:
+                conn.rollback()
+            return 0
+        finally:
+            if conn:
+                conn.close()
+
+
+class VideoStat:
+    """
+    Model untuk tabel video_stats (time series statistik video).
+
+    Setiap refresh menambah satu snapshot (video_id, ts, views, likes)
+    per video; VPH dan akselerasi dihitung dari selisih antar snapshot.
+    """
+
+    # Batas parameter per query IN (aman untuk SQLite lama)
+    QUERY_CHUNK_SIZE = 500
+
+    @classmethod
+    def record_many(cls, snapshots: List[tuple], ts: float) -> int:
+        """
+        Simpan snapshot statistik dan perbarui views/likes di tabel videos.
+
+        Keduanya ditulis dalam satu transaksi.
+
+        Args:
+            snapshots: List (video_id, views, likes).
+            ts: Waktu poll (Unix timestamp).
+
+        Returns:
+            Jumlah snapshot yang disimpan.
+        """
+        if not snapshots:
+            return 0
+
+        conn = None
+        try:
+            with _db_write_lock:
+                conn = get_connection()
+                conn.execute("BEGIN IMMEDIATE")
+                conn.executemany("""
+                    INSERT OR REPLACE INTO video_stats (video_id, ts, views, likes)
+                    VALUES (?, ?, ?, ?)
+                """, [(video_id, ts, views, likes) for video_id, views, likes in snapshots])
+                conn.executemany("""
+                    UPDATE videos SET views = ?, likes = ? WHERE video_id = ?
+                """, [(views, likes, video_id) for video_id, views, likes in snapshots])
+                conn.commit()
+            return len(snapshots)
+
+        except sqlite3.Error as e:
+            logger.warning(f"Gagal menyimpan snapshot statistik: {e}")
+            if conn:
+                conn.rollback()
+            return 0
+        finally:
+            if conn:
+                conn.close()
+
+    @classmethod
+    def series(
+        cls,
+        video_ids: Optional[List[str]] = None,
+        since: float = 0.0
+    ) -> List[tuple]:
+        """
+        Ambil snapshot, urut per video lalu waktu.
+
+        Args:
+            video_ids: Filter video ID. Default None (semua video).
+            since: Hanya snapshot dengan ts >= since (Unix timestamp).
+
+        Returns:
+            List (video_id, ts, views, likes).
+        """
+        conn = None
+        try:
+            conn = get_connection()
+            if video_ids is None:
+                return [tuple(row) for row in conn.execute("""
+                    SELECT video_id, ts, views, likes FROM video_stats
+                    WHERE ts >= ? ORDER BY video_id, ts
+                """, (since,))]
+
+            rows = []
+            for i in range(0, len(video_ids), cls.QUERY_CHUNK_SIZE):
+                chunk = video_ids[i:i + cls.QUERY_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                rows.extend(tuple(row) for row in conn.execute(f"""
+                    SELECT video_id, ts, views, likes FROM video_stats
+                    WHERE video_id IN ({placeholders}) AND ts >= ?
+                """, (*chunk, since)))
+            rows.sort(key=lambda row: (row[0], row[1]))
+            return rows
+
+        except sqlite3.Error as e:
+            logger.warning(f"Gagal membaca snapshot statistik: {e}")
+            return []
+        finally:
+            if conn:
+                conn.close()
+
+    @classmethod
+    def last_poll_at(cls) -> Optional[float]:
+        """
+        Waktu snapshot terakhir.
+
+        Returns:
+            Unix timestamp, atau None jika belum ada snapshot.
+        """
+        conn = None
+        try:
+            conn = get_connection()
+            return conn.execute("SELECT MAX(ts) FROM video_stats").fetchone()[0]
+
+        except sqlite3.Error as e:
+            logger.warning(f"Gagal membaca snapshot statistik: {e}")
+            return None
+        finally:
+            if conn:
+                conn.close()
+
+    @classmethod
+    def prune(cls, older_than: float) -> int:
+        """
+        Hapus snapshot yang lebih lama dari batas waktu.
+
+        Args:
+            older_than: Unix timestamp batas.
+
+        Returns:
+            Jumlah snapshot yang dihapus.
+        """
+        conn = None
+        try:
+            with _db_write_lock:
+                conn = get_connection()
+                cursor = conn.execute("DELETE FROM video_stats WHERE ts < ?", (older_than,))
+                conn.commit()
+            return cursor.rowcount
+
+        except sqlite3.Error as e:
+            logger.warning(f"Gagal membersihkan snapshot statistik: {e}")
+            return 0
+        finally:
+            if conn:
+                conn.close()
+
+
+class Run:
+    """
+    Model untuk tabel runs (satu baris per hunt).
+
+    Hunt yang berhenti di tengah jalan (quota habis, error, app crash)
+    tetap berstatus running/interrupted dan bisa dilanjutkan dari
+    checkpoint-nya (lihat RunCheckpoint).
+    """
+
+    STATUS_RUNNING = "running"
+    STATUS_INTERRUPTED = "interrupted"
+    STATUS_COMPLETED = "completed"
+
+    # Status yang masih bisa dilanjutkan
+    RESUMABLE = (STATUS_RUNNING, STATUS_INTERRUPTED)
+
+    @classmethod
+    def create(cls, run_id: str, params: Dict[str, Any]) -> bool:
+        """
+        Catat run baru dengan status running.
+
+        Args:
+            run_id: ID run.
+            params: Parameter hunt (harus bisa di-serialize ke JSON).
+
+        Returns:
+            True jika tersimpan.
+        """
+        now = time.time()
+        conn = None
+        try:
+            with _db_write_lock:
+                conn = get_connection()
+                conn.execute("""
+                    INSERT INTO runs (run_id, status, params, created_at, updated_at)
+                    VALUES (?, ?, ?, ?, ?)
+                """, (run_id, cls.STATUS_RUNNING, json.dumps(params), now, now))
+            return True
+
+        except sqlite3.Error as e:
+            logger.warning(f"Gagal mencatat run {run_id}: {e}")
+            return False
+        finally:
+            if conn:
+                conn.close()
+
+    @classmethod
+    def update(
+        cls,
+        run_id: str,
+        status: str,
+        stats: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None
+    ) -> bool:
+        """
+        Perbarui status run.
+
+        Args:
+            run_id: ID run.
+            status: Status baru (STATUS_*).
+            stats: Statistik terakhir (opsional, JSON).
+            error: Pesan error (opsional).
+
+        Returns:
+            True jika tersimpan.
+        """
+        conn = None
+        try:
+            with _db_write_lock:
+                conn = get_connection()
+                conn.execute("""
+                    UPDATE runs SET status = ?, stats = COALESCE(?, stats), error = ?, updated_at = ?
+                    WHERE run_id = ?
+                """, (
+                    status,
+                    json.dumps(stats, default=str) if stats is not None else None,
+                    error,
+                    time.time(),
+                    run_id
+                ))
+            return True
+
+        except sqlite3.Error as e:
+            logger.warning(f"Gagal memperbarui run {run_id}: {e}")
+            return False
+        finally:
+            if conn:
+                conn.close()
+
+    @classmethod
+    def get(cls, run_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Ambil run berdasarkan ID.
+
+        Args:
+            run_id: ID run.
+
+        Returns:
+            Dict run_id, status, params, stats, error, created_at,
+            updated_at (params/stats sudah di-decode), atau None.
+        """
+        conn = None
+        try:
+            conn = get_connection()
+            row = conn.execute("SELECT * FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+            return cls._from_row(row) if row else None
+
+        except sqlite3.Error as e:
+            logger.warning(f"Gagal membaca run {run_id}: {e}")
+            return None
+        finally:
+            if conn:
+                conn.close()
+
+    @classmethod
+    def latest_resumable(cls) -> Optional[Dict[str, Any]]:
+        """
+        Run terakhir yang belum selesai.
+
+        Returns:
+            Dict run (format get()), atau None.
+        """
+        conn = None
+        try:
+            conn = get_connection()
+            placeholders = ",".join("?" * len(cls.RESUMABLE))
+            row = conn.execute(f"""
+                SELECT * FROM runs WHERE status IN ({placeholders})
+                ORDER BY updated_at DESC LIMIT 1
+            """, cls.RESUMABLE).fetchone()
+            return cls._from_row(row) if row else None
+
+        except sqlite3.Error as e:
+            logger.warning(f"Gagal membaca run: {e}")
+            return None
+        finally:
+            if conn:
+                conn.close()
+
+    @classmethod
+    def recent(cls, status: Optional[str] = None, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        Run terbaru, yang terakhir diperbarui dulu.
+
+        Args:
+            status: Filter status (STATUS_*). Default semua status.
+            limit: Jumlah run maksimal.
+
+        Returns:
+            List dict run (format get()).
+        """
+        conn = None
+        try:
+            conn = get_connection()
+            if status:
+                rows = conn.execute(
+                    "SELECT * FROM runs WHERE status = ? ORDER BY updated_at DESC LIMIT ?",
+                    (status, limit)
+                ).fetchall()
+            else:
+                rows = conn.execute(
+                    "SELECT * FROM runs ORDER BY updated_at DESC LIMIT ?", (limit,)
+                ).fetchall()
+            return [cls._from_row(row) for row in rows]
+
+        except sqlite3.Error as e:
+            logger.warning(f"Gagal membaca daftar run: {e}")
+            return []
+        finally:
+            if conn:
+                conn.close()
+
+    @staticmethod
+    def _from_row(row: sqlite3.Row) -> Dict[str, Any]:
+        """Konversi row runs ke dict (JSON di-decode)."""
+        run = dict(row)
+        run["params"] = json.loads(run["params"])
+        run["stats"] = json.loads(run["stats"]) if run["stats"] else {}
+        return run
+
+
+class RunCheckpoint:
+    """
+    Checkpoint progress hunt di tabel run_slices dan run_candidates.
+
+    Setiap response API dicatat begitu diterima: halaman search (page
+    token berikutnya + ID baru beserta snippet), detail video, data
+    channel, lalu hasil filter per video. Run yang dilanjutkan memulai
+    setiap kandidat dari stage terakhir yang tercatat, jadi request yang
+    sudah selesai tidak dikirim ulang.
+    """
+
+    # Status kandidat, urut sesuai stage pipeline
+    FOUND = "found"
+    FETCHED = "fetched"
+    ENRICHED = "enriched"
+    REJECTED = "rejected"
+    SAVED = "saved"
+
+    # Status slice
+    SLICE_OPEN = "open"
+    SLICE_DONE = "done"
+    SLICE_SPLIT = "split"
+
+    @classmethod
+    def open_slices(cls, run_id: str, search_index: int, slices: List[tuple]) -> bool:
+        """
+        Catat slice baru (slice yang sudah tercatat tidak diubah).
+
+        Args:
+            run_id: ID run.
+            search_index: Index sub-search.
+            slices: List (published_after, published_before, need, first_limit).
+
+        Returns:
+            True jika tersimpan.
+        """
+        return cls._write(f"membuka slice run {run_id}", [(
+            """
+            INSERT OR IGNORE INTO run_slices
+                (run_id, search_index, published_after, published_before, need, first_limit)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            [(run_id, search_index, *slice_) for slice_ in slices]
+        )])
+
+    @classmethod
+    def record_page(
+        cls,
+        run_id: str,
+        search_index: int,
+        published_after: str,
+        published_before: str,
+        page_token: Optional[str],
+        pages: int,
+        got: int,
+        total_results: int,
+        candidates: List[tuple]
+    ) -> bool:
+        """
+        Catat satu halaman search: progress slice + kandidat baru (satu transaksi).
+
+        Args:
+            run_id: ID run.
+            search_index: Index sub-search.
+            published_after: Batas awal slice.
+            published_before: Batas akhir slice.
+            page_token: Token halaman berikutnya (None jika pagination habis).
+            pages: Jumlah halaman yang sudah diambil.
+            got: Jumlah hasil yang sudah terbaca di slice.
+            total_results: Estimasi total hasil slice.
+            candidates: List (video_id, snippet) untuk ID baru; snippet
+                berupa list/dict yang bisa di-serialize JSON atau None.
+
+        Returns:
+            True jika tersimpan.
+        """
+        return cls._write(f"mencatat halaman search run {run_id}", [
+            ("""
+                UPDATE run_slices SET page_token = ?, pages = ?, got = ?, total_results = ?
+                WHERE run_id = ? AND search_index = ? AND published_after = ? AND published_before = ?
+            """, [(
+                page_token, pages, got, total_results,
+                run_id, search_index, published_after, published_before
+            )]),
+            ("""
+                INSERT OR IGNORE INTO run_candidates (run_id, video_id, search_index, status, snippet)
+                VALUES (?, ?, ?, ?, ?)
+            """, [
+                (run_id, video_id, search_index, cls.FOUND,
+                 json.dumps(snippet) if snippet is not None else None)
+                for video_id, snippet in candidates
+            ]),
+        ])
+
+    @classmethod
+    def close_slice(
+        cls,
+        run_id: str,
+        search_index: int,
+        published_after: str,
+        published_before: str,
+        children: List[tuple] = ()
+    ) -> bool:
+        """
+        Tandai slice selesai; slice pecahannya (jika dibagi) dicatat dalam
+        transaksi yang sama supaya resume tidak membagi dua kali.
+
+        Args:
+            run_id: ID run.
+            search_index: Index sub-search.
+            published_after: Batas awal slice.
+            published_before: Batas akhir slice.
+            children: List (published_after, published_before, need, first_limit).
+
+        Returns:
+            True jika tersimpan.
+        """
+        return cls._write(f"menutup slice run {run_id}", [
+            ("""
+                INSERT OR IGNORE INTO run_slices
+                    (run_id, search_index, published_after, published_before, need, first_limit)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, [(run_id, search_index, *child) for child in children]),
+            ("""
+                UPDATE run_slices SET status = ?
+                WHERE run_id = ? AND search_index = ? AND published_after = ? AND published_before = ?
+            """, [(
+                cls.SLICE_SPLIT if children else cls.SLICE_DONE,
+                run_id, search_index, published_after, published_before
+            )]),
+        ])
+
+    @classmethod
+    def mark_fetched(cls, run_id: str, records: List[tuple]) -> bool:
+        """
+        Catat detail video hasil videos.list.
+
+        Args:
+            run_id: ID run.
+            records: List (video_id, record) dengan record list/dict JSON.
+
+        Returns:
+            True jika tersimpan.
+        """
+        return cls._write(f"mencatat detail video run {run_id}", [(
+            "UPDATE run_candidates SET status = ?, record = ? WHERE run_id = ? AND video_id = ?",
+            [(cls.FETCHED, json.dumps(record), run_id, video_id) for video_id, record in records]
+        )])
+
+    @classmethod
+    def mark_enriched(cls, run_id: str, channels: List[tuple]) -> bool:
+        """
+        Catat data channel setiap video hasil channels.list.
+
+        Args:
+            run_id: ID run.
+            channels: List (video_id, channel_data).
+
+        Returns:
+            True jika tersimpan.
+        """
+        return cls._write(f"mencatat data channel run {run_id}", [(
+            "UPDATE run_candidates SET status = ?, channel = ? WHERE run_id = ? AND video_id = ?",
+            [(cls.ENRICHED, json.dumps(channel), run_id, video_id) for video_id, channel in channels]
+        )])
+
+    @classmethod
+    def mark_done(cls, run_id: str, results: List[tuple]) -> bool:
+        """
+        Catat hasil akhir video (posisi filter).
+
+        Args:
+            run_id: ID run.
+            results: List (video_id, status, flags); status REJECTED atau SAVED,
+                flags bitmask hard filter yang lulus.
+
+        Returns:
+            True jika tersimpan.
+        """
+        return cls._write(f"mencatat hasil filter run {run_id}", [(
+            "UPDATE run_candidates SET status = ?, flags = ? WHERE run_id = ? AND video_id = ?",
+            [(status, flags, run_id, video_id) for video_id, status, flags in results]
+        )])
+
+    @classmethod
+    def load(cls, run_id: str) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Ambil seluruh checkpoint run.
+
+        Args:
+            run_id: ID run.
+
+        Returns:
+            Dict slices (list dict kolom run_slices) dan candidates (list
+            dict kolom run_candidates, JSON sudah di-decode).
+        """
+        conn = None
+        try:
+            conn = get_connection()
+            slices = [dict(row) for row in conn.execute("""
+                SELECT * FROM run_slices WHERE run_id = ?
+                ORDER BY search_index, published_after, published_before
+            """, (run_id,))]
+            candidates = []
+            for row in conn.execute("SELECT * FROM run_candidates WHERE run_id = ?", (run_id,)):
+                candidate = dict(row)
+                for key in ("snippet", "record", "channel"):
+                    if candidate[key] is not None:
+                        candidate[key] = json.loads(candidate[key])
+                candidates.append(candidate)
+            return {"slices": slices, "candidates": candidates}
+
+        except sqlite3.Error as e:
+            logger.warning(f"Gagal membaca checkpoint run {run_id}: {e}")
+            return {"slices": [], "candidates": []}
+        finally:
+            if conn:
+                conn.close()
+
+    @classmethod
+    def clear(cls, run_id: str) -> bool:
+        """
+        Hapus checkpoint run (setelah run selesai).
+
+        Args:
+            run_id: ID run.
+
+        Returns:
+            True jika terhapus.
+        """
+        return cls._write(f"menghapus checkpoint run {run_id}", [
+            ("DELETE FROM run_slices WHERE run_id = ?", [(run_id,)]),
+            ("DELETE FROM run_candidates WHERE run_id = ?", [(run_id,)]),
+        ])
+
+    @staticmethod
+    def _write(action: str, statements: List[tuple]) -> bool:
+        """
+        Jalankan beberapa executemany dalam satu transaksi.
+
+        Args:
+            action: Deskripsi untuk log jika gagal.
+            statements: List (sql, rows).
+
+        Returns:
+            True jika tersimpan.
+        """
+        conn = None
+        try:
+            with _db_write_lock:
+                conn = get_connection()
+                conn.execute("BEGIN IMMEDIATE")
+                for sql, rows in statements:
+                    if rows:
+                        conn.executemany(sql, rows)
+                conn.commit()
+            return True
+
+        except sqlite3.Error as e:
+            logger.warning(f"Gagal {action}: {e}")
+            if conn:
+                conn.rollback()
+            return False
+        finally:
+            if conn:
+                conn.close()
+
+
+class Schedule:
+    """
+    Model untuk tabel schedules (definisi hunt berkala).
+
+    params berisi argumen scrape_batch (queries, regions, target_count,
+    rules); setiap kali jadwal jatuh tempo, scheduler memasukkan satu job
+    ke antrian (lihat Job.enqueue_scheduled).
+    """
+
+    @classmethod
+    def create(
+        cls,
+        schedule_id: str,
+        name: str,
+        cron: str,
+        params: Dict[str, Any],
+        next_run_at: float,
+        priority: float = 1.0
+    ) -> bool:
+        """
+        Simpan jadwal baru.
+
+        Args:
+            schedule_id: ID jadwal.
+            name: Nama unik jadwal.
+            cron: Ekspresi cron.
+            params: Argumen scrape_batch (JSON).
+            next_run_at: Unix timestamp jadwal pertama.
+            priority: Bobot prioritas job.
+
+        Returns:
+            True jika tersimpan, False jika nama sudah dipakai atau gagal.
+        """
+        now = time.time()
+        conn = None
+        try:
+            with _db_write_lock:
+                conn = get_connection()
+                conn.execute("""
+                    INSERT INTO schedules
+                        (schedule_id, name, cron, params, priority, next_run_at, created_at, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """, (schedule_id, name, cron, json.dumps(params), priority, next_run_at, now, now))
+            return True
+
+        except sqlite3.Error as e:
+            logger.warning(f"Gagal menyimpan jadwal {name}: {e}")
+            return False
+        finally:
+            if conn:
+                conn.close()
+
+    @classmethod
+    def get(cls, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Ambil jadwal berdasarkan nama atau ID.
+
+        Args:
+            name: Nama atau schedule_id.
+
+        Returns:
+            Dict kolom schedules (params sudah di-decode), atau None.
+        """
+        conn = None
+        try:
+            conn = get_connection()
+            row = conn.execute(
+                "SELECT * FROM schedules WHERE name = ? OR schedule_id = ?", (name, name)
+            ).fetchone()
+            return cls._from_row(row) if row else None
+
+        except sqlite3.Error as e:
+            logger.warning(f"Gagal membaca jadwal {name}: {e}")
+            return None
+        finally:
+            if conn:
+                conn.close()
+
+    @classmethod
+    def get_all(cls, due_before: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Ambil semua jadwal, urut jadwal berikutnya.
+
+        Args:
+            due_before: Jika diisi, hanya jadwal aktif dengan
+                next_run_at <= due_before (jatuh tempo).
+
+        Returns:
+            List dict jadwal (format get()).
+        """
+        conn = None
+        try:
+            conn = get_connection()
+            if due_before is not None:
+                rows = conn.execute(
+                    "SELECT * FROM schedules WHERE enabled = 1 AND next_run_at <= ? ORDER BY next_run_at",
+                    (due_before,)
+                ).fetchall()
+            else:
+                rows = conn.execute("SELECT * FROM schedules ORDER BY next_run_at").fetchall()
+            return [cls._from_row(row) for row in rows]
+
+        except sqlite3.Error as e:
+            logger.warning(f"Gagal membaca daftar jadwal: {e}")
+            return []
+        finally:
+            if conn:
+                conn.close()
+
+    @classmethod
+    def set_enabled(cls, schedule_id: str, enabled: bool, next_run_at: Optional[float] = None) -> bool:
+        """
+        Aktifkan/nonaktifkan jadwal.
+
+        Args:
+            schedule_id: ID jadwal.
+            enabled: Status baru.
+            next_run_at: Jadwal berikutnya (opsional, supaya jadwal yang
+                diaktifkan lagi tidak langsung jatuh tempo).
+
+        Returns:
+            True jika tersimpan.
+        """
+        conn = None
+        try:
+            with _db_write_lock:
+                conn = get_connection()
+                conn.execute("""
+                    UPDATE schedules SET enabled = ?, next_run_at = COALESCE(?, next_run_at), updated_at = ?
+                    WHERE schedule_id = ?
+                """, (int(enabled), next_run_at, time.time(), schedule_id))
+            return True
+
+        except sqlite3.Error as e:
+            logger.warning(f"Gagal memperbarui jadwal {schedule_id}: {e}")
+            return False
+        finally:
+            if conn:
+                conn.close()
+
+    @classmethod
+    def delete(cls, schedule_id: str) -> bool:
+        """
+        Hapus jadwal beserta job-nya yang belum berjalan.
+
+        Args:
+            schedule_id: ID jadwal.
+
+        Returns:
+            True jika terhapus.
+        """
+        conn = None
+        try:
+            with _db_write_lock:
+                conn = get_connection()
+                conn.execute("BEGIN IMMEDIATE")
+                conn.execute(
+                    "DELETE FROM jobs WHERE schedule_id = ? AND status IN (?, ?)",
+                    (schedule_id, Job.STATUS_QUEUED, Job.STATUS_DEFERRED)
+                )
+                cursor = conn.execute("DELETE FROM schedules WHERE schedule_id = ?", (schedule_id,))
+                conn.commit()
+            return cursor.rowcount > 0
+
+        except sqlite3.Error as e:
+            logger.warning(f"Gagal menghapus jadwal {schedule_id}: {e}")
+            if conn:
+                conn.rollback()
+            return False
+        finally:
+            if conn:
+                conn.close()
+
+    @staticmethod
+    def _from_row(row: sqlite3.Row) -> Dict[str, Any]:
+        """Konversi row schedules ke dict (JSON di-decode)."""
+        schedule = dict(row)
+        schedule["params"] = json.loads(schedule["params"])
+        schedule["enabled"] = bool(schedule["enabled"])
+        return schedule
+
+
+class Job:
+    """
+    Model untuk tabel jobs (antrian hunt scheduler).
+
+    Job queued/deferred yang sudah jatuh tempo (due_at) dipilih scheduler
+    sesuai prioritas; job deferred menunggu sisa quota harian cukup.
+
+    Beberapa proses (atau host yang berbagi database) bisa melayani
+    antrian yang sama: job diambil dengan UPDATE bersyarat (atomic di
+    SQLite, lintas proses) dan dipegang dengan lease yang diperpanjang
+    heartbeat. Job yang lease-nya habis (worker mati) dikembalikan ke
+    antrian oleh expire_leases; hasil job hanya dicatat oleh worker yang
+    masih memegang lease-nya.
+    """
+
+    STATUS_QUEUED = "queued"
+    STATUS_DEFERRED = "deferred"
+    STATUS_RUNNING = "running"
+    STATUS_COMPLETED = "completed"
+    STATUS_FAILED = "failed"
+
+    # Status yang masih menunggu dijalankan
+    PENDING = (STATUS_QUEUED, STATUS_DEFERRED)
+
+    @classmethod
+    def create(
+        cls,
+        job_id: str,
+        params: Dict[str, Any],
+        priority: float = 1.0,
+        due_at: Optional[float] = None,
+        schedule_id: Optional[str] = None
+    ) -> bool:
+        """
+        Masukkan job ke antrian.
+
+        Args:
+            job_id: ID job.
+            params: Argumen scrape_batch (JSON).
+            priority: Bobot prioritas.
+            due_at: Unix timestamp paling awal job boleh jalan. Default sekarang.
+            schedule_id: Jadwal asal job (opsional).
+
+        Returns:
+            True jika tersimpan.
+        """
+        now = time.time()
+        conn = None
+        try:
+            with _db_write_lock:
+                conn = get_connection()
+                conn.execute("""
+                    INSERT INTO jobs (job_id, schedule_id, params, priority, status, due_at, created_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                """, (
+                    job_id, schedule_id, json.dumps(params), priority,
+                    cls.STATUS_QUEUED, now if due_at is None else due_at, now
+                ))
+            return True
+
+        except sqlite3.Error as e:
+            logger.warning(f"Gagal memasukkan job {job_id}: {e}")
+            return False
+        finally:
+            if conn:
+                conn.close()
+
+    @classmethod
+    def enqueue_scheduled(
+        cls,
+        schedule: Dict[str, Any],
+        job_id: str,
+        next_run_at: float
+    ) -> Optional[str]:
+        """
+        Majukan jadwal yang jatuh tempo dan masukkan job-nya.
+
+        Dalam satu transaksi: next_run_at jadwal dimajukan (hanya jika
+        belum dimajukan proses lain), lalu job baru dimasukkan kecuali
+        jadwal itu masih punya job yang menunggu atau berjalan (jadwal
+        yang terlewat beberapa kali hanya menghasilkan satu job).
+
+        Args:
+            schedule: Dict jadwal (format Schedule.get).
+            job_id: ID job baru.
+            next_run_at: Unix timestamp jadwal berikutnya.
+
+        Returns:
+            job_id jika job dimasukkan, None jika tidak.
+        """
+        now = time.time()
+        conn = None
+        try:
+            with _db_write_lock:
+                conn = get_connection()
+                conn.execute("BEGIN IMMEDIATE")
+                cursor = conn.execute("""
+                    UPDATE schedules SET next_run_at = ?, last_run_at = ?, updated_at = ?
+                    WHERE schedule_id = ? AND next_run_at = ?
+                """, (next_run_at, now, now, schedule["schedule_id"], schedule["next_run_at"]))
+                if cursor.rowcount == 0:
+                    conn.rollback()
+                    return None
+
+                active = conn.execute(
+                    "SELECT 1 FROM jobs WHERE schedule_id = ? AND status IN (?, ?, ?) LIMIT 1",
+                    (schedule["schedule_id"], *cls.PENDING, cls.STATUS_RUNNING)
+                ).fetchone()
+                if active is None:
+                    conn.execute("""
+                        INSERT INTO jobs (job_id, schedule_id, params, priority, status, due_at, created_at)
+                        VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """, (
+                        job_id, schedule["schedule_id"], json.dumps(schedule["params"]),
+                        schedule["priority"], cls.STATUS_QUEUED, now, now
+                    ))
+                conn.commit()
+            return job_id if active is None else None
+
+        except sqlite3.Error as e:
+            logger.warning(f"Gagal memasukkan job jadwal {schedule['name']}: {e}")
+            if conn:
+                conn.rollback()
+            return None
+        finally:
+            if conn:
+                conn.close()
+
+    @classmethod
+    def pending(cls, now: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Job queued/deferred yang sudah jatuh tempo.
+
+        Args:
+            now: Unix timestamp acuan. Default sekarang.
+
+        Returns:
+            List dict job (format get()), yang paling lama menunggu dulu.
+        """
+        conn = None
+        try:
+            conn = get_connection()
+            rows = conn.execute(
+                "SELECT * FROM jobs WHERE status IN (?, ?) AND due_at <= ? ORDER BY due_at",
+                (*cls.PENDING, time.time() if now is None else now)
+            ).fetchall()
+            return [cls._from_row(row) for row in rows]
+
+        except sqlite3.Error as e:
+            logger.warning(f"Gagal membaca antrian job: {e}")
+            return []
+        finally:
+            if conn:
+                conn.close()
+
+    @classmethod
+    def claim(cls, job_id: str, worker_id: str, lease_seconds: float) -> bool:
+        """
+        Ambil job (hanya jika masih menunggu) dan pegang lease-nya.
+
+        Args:
+            job_id: ID job.
+            worker_id: ID worker yang mengambil.
+            lease_seconds: Lama lease sebelum harus diperpanjang (heartbeat).
+
+        Returns:
+            True jika job berhasil diambil worker ini.
+        """
+        now = time.time()
+        conn = None
+        try:
+            with _db_write_lock:
+                conn = get_connection()
+                cursor = conn.execute("""
+                    UPDATE jobs SET status = ?, attempts = attempts + 1, started_at = ?, error = NULL,
+                        worker_id = ?, lease_expires_at = ?, heartbeat_at = ?
+                    WHERE job_id = ? AND status IN (?, ?)
+                """, (cls.STATUS_RUNNING, now, worker_id, now + lease_seconds, now, job_id, *cls.PENDING))
+            return cursor.rowcount > 0
+
+        except sqlite3.Error as e:
+            logger.warning(f"Gagal mengambil job {job_id}: {e}")
+            return False
+        finally:
+            if conn:
+                conn.close()
+
+    @classmethod
+    def heartbeat(cls, worker_id: str, jobs: List[tuple], lease_seconds: float) -> List[str]:
+        """
+        Perpanjang lease job yang sedang dijalankan worker.
+
+        Args:
+            worker_id: ID worker.
+            jobs: List (job_id, run_id); run_id (boleh None) ikut dicatat
+                supaya worker lain bisa melanjutkan run-nya kalau worker
+                ini mati.
+            lease_seconds: Lama lease baru.
+
+        Returns:
+            List ID job yang lease-nya sudah tidak dipegang worker ini.
+        """
+        now = time.time()
+        lost = []
+        conn = None
+        try:
+            with _db_write_lock:
+                conn = get_connection()
+                conn.execute("BEGIN IMMEDIATE")
+                for job_id, run_id in jobs:
+                    cursor = conn.execute("""
+                        UPDATE jobs SET lease_expires_at = ?, heartbeat_at = ?, run_id = COALESCE(?, run_id)
+                        WHERE job_id = ? AND worker_id = ? AND status = ?
+                    """, (now + lease_seconds, now, run_id, job_id, worker_id, cls.STATUS_RUNNING))
+                    if cursor.rowcount == 0:
+                        lost.append(job_id)
+                conn.commit()
+            return lost
+
+        except sqlite3.Error as e:
+            logger.warning(f"Gagal memperpanjang lease job: {e}")
+            if conn:
+                conn.rollback()
+            return []
+        finally:
+            if conn:
+                conn.close()
+
+    @classmethod
+    def expire_leases(cls, max_attempts: int, now: Optional[float] = None) -> Dict[str, int]:
+        """
+        Kembalikan job running yang lease-nya habis (worker mati/hang).
+
+        Job yang sudah dicoba max_attempts kali ditandai failed supaya job
+        yang selalu mematikan worker tidak diulang terus.
+
+        Args:
+            max_attempts: Batas percobaan.
+            now: Unix timestamp acuan. Default sekarang.
+
+        Returns:
+            Dict requeued, failed.
+        """
+        now = time.time() if now is None else now
+        conn = None
+        try:
+            with _db_write_lock:
+                conn = get_connection()
+                conn.execute("BEGIN IMMEDIATE")
+                failed = conn.execute("""
+                    UPDATE jobs SET status = ?, worker_id = NULL, lease_expires_at = NULL, finished_at = ?,
+                        error = 'Lease habis: worker berhenti sebelum job selesai'
+                    WHERE status = ? AND COALESCE(lease_expires_at, 0) < ? AND attempts >= ?
+                """, (cls.STATUS_FAILED, now, cls.STATUS_RUNNING, now, max_attempts)).rowcount
+                requeued = conn.execute("""
+                    UPDATE jobs SET status = ?, worker_id = NULL, lease_expires_at = NULL
+                    WHERE status = ? AND COALESCE(lease_expires_at, 0) < ?
+                """, (cls.STATUS_QUEUED, cls.STATUS_RUNNING, now)).rowcount
+                conn.commit()
+            return {"requeued": requeued, "failed": failed}
+
+        except sqlite3.Error as e:
+            logger.warning(f"Gagal memeriksa lease job: {e}")
+            if conn:
+                conn.rollback()
+            return {"requeued": 0, "failed": 0}
+        finally:
+            if conn:
+                conn.close()
+
+    @classmethod
+    def running_units(cls, now: Optional[float] = None) -> int:
+        """
+        Total estimasi unit job yang sedang berjalan (semua worker).
+
+        Args:
+            now: Unix timestamp acuan. Default sekarang.
+
+        Returns:
+            Jumlah est_units job running dengan lease aktif.
+        """
+        conn = None
+        try:
+            conn = get_connection()
+            row = conn.execute(
+                "SELECT COALESCE(SUM(est_units), 0) FROM jobs WHERE status = ? AND lease_expires_at >= ?",
+                (cls.STATUS_RUNNING, time.time() if now is None else now)
+            ).fetchone()
+            return row[0]
+
+        except sqlite3.Error as e:
+            logger.warning(f"Gagal membaca job running: {e}")
+            return 0
+        finally:
+            if conn:
+                conn.close()
+
+    @classmethod
+    def update_estimates(cls, estimates: List[tuple]) -> bool:
+        """
+        Simpan estimasi terakhir dan status menunggu (queued/deferred).
+
+        Args:
+            estimates: List (status, est_units, yield_per_unit, job_id).
+
+        Returns:
+            True jika tersimpan.
+        """
+        conn = None
+        try:
+            with _db_write_lock:
+                conn = get_connection()
+                conn.execute("BEGIN IMMEDIATE")
+                conn.executemany(f"""
+                    UPDATE jobs SET status = ?, est_units = ?, yield_per_unit = ?
+                    WHERE job_id = ? AND status IN ({",".join("?" * len(cls.PENDING))})
+                """, [(*row, *cls.PENDING) for row in estimates])
+                conn.commit()
+            return True
+
+        except sqlite3.Error as e:
+            logger.warning(f"Gagal menyimpan estimasi job: {e}")
+            if conn:
+                conn.rollback()
+            return False
+        finally:
+            if conn:
+                conn.close()
+
+    @classmethod
+    def finish(
+        cls,
+        job_id: str,
+        status: str,
+        run_id: Optional[str] = None,
+        error: Optional[str] = None,
+        due_at: Optional[float] = None,
+        worker_id: Optional[str] = None
+    ) -> bool:
+        """
+        Catat hasil job dan lepas lease-nya.
+
+        Args:
+            job_id: ID job.
+            status: completed/failed, atau queued/deferred untuk dicoba lagi.
+            run_id: Run hunt job (disimpan supaya retry melanjutkan run ini).
+            error: Pesan error (opsional).
+            due_at: Waktu paling awal retry (status queued/deferred).
+            worker_id: Jika diisi, hasil hanya dicatat kalau worker ini
+                masih memegang lease job.
+
+        Returns:
+            True jika tersimpan (False jika lease sudah dipegang worker lain).
+        """
+        conn = None
+        try:
+            with _db_write_lock:
+                conn = get_connection()
+                cursor = conn.execute("""
+                    UPDATE jobs SET status = ?, run_id = COALESCE(?, run_id), error = ?,
+                        due_at = COALESCE(?, due_at), finished_at = ?,
+                        worker_id = NULL, lease_expires_at = NULL
+                    WHERE job_id = ? AND (? IS NULL OR (worker_id = ? AND status = ?))
+                """, (status, run_id, error, due_at, time.time(), job_id, worker_id, worker_id, cls.STATUS_RUNNING))
+            return cursor.rowcount > 0
+
+        except sqlite3.Error as e:
+            logger.warning(f"Gagal mencatat hasil job {job_id}: {e}")
+            return False
+        finally:
+            if conn:
+                conn.close()
+
+    @classmethod
+    def get(cls, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Ambil job berdasarkan ID.
+
+        Args:
+            job_id: ID job.
+
+        Returns:
+            Dict kolom jobs (params sudah di-decode), atau None.
+        """
+        conn = None
+        try:
+            conn = get_connection()
+            row = conn.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+            return cls._from_row(row) if row else None
+
+        except sqlite3.Error as e:
+            logger.warning(f"Gagal membaca job {job_id}: {e}")
+            return None
+        finally:
+            if conn:
+                conn.close()
+
+    @classmethod
+    def recent(cls, status: Optional[str] = None, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        Job terbaru, yang terakhir dibuat dulu.
+
+        Args:
+            status: Filter status (STATUS_*). Default semua status.
+            limit: Jumlah job maksimal.
+
+        Returns:
+            List dict job (format get()).
+        """
+        conn = None
+        try:
+            conn = get_connection()
+            if status:
+                rows = conn.execute(
+                    "SELECT * FROM jobs WHERE status = ? ORDER BY created_at DESC LIMIT ?",
+                    (status, limit)
+                ).fetchall()
+            else:
+                rows = conn.execute(
+                    "SELECT * FROM jobs ORDER BY created_at DESC LIMIT ?", (limit,)
+                ).fetchall()
+            return [cls._from_row(row) for row in rows]
+
+        except sqlite3.Error as e:
+            logger.warning(f"Gagal membaca daftar job: {e}")
+            return []
+        finally:
+            if conn:
+                conn.close()
+
+    @staticmethod
+    def _from_row(row: sqlite3.Row) -> Dict[str, Any]:
+        """Konversi row jobs ke dict (JSON di-decode)."""
+        job = dict(row)
+        job["params"] = json.loads(job["params"])
+        return job
@@ -74,6 +74,200 @@ END;
 """
 
 
+# SQL Schema untuk ledger quota YouTube API (satu baris per request)
+QUOTA_LOG_TABLE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS quota_log (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id TEXT,
+    key_id TEXT NOT NULL,          -- Fingerprint API key (bukan key asli)
+    endpoint TEXT NOT NULL,        -- search | videos | channels
+    units INTEGER NOT NULL,
+    quota_day TEXT NOT NULL,       -- Hari quota YouTube (Pacific), YYYY-MM-DD
+    timestamp TEXT DEFAULT (datetime('now'))
+);
+
+CREATE INDEX IF NOT EXISTS idx_quota_day_key ON quota_log(quota_day, key_id);
+CREATE INDEX IF NOT EXISTS idx_quota_run ON quota_log(run_id);
+"""
+
+
+# SQL Schema untuk cache response YouTube API (body terkompresi zlib)
+HTTP_CACHE_TABLE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS http_cache (
+    cache_key TEXT PRIMARY KEY,    -- SHA-256 endpoint + params (tanpa API key)
+    endpoint TEXT NOT NULL,
+    etag TEXT,
+    body BLOB NOT NULL,
+    fetched_at REAL NOT NULL,      -- Unix timestamp
+    expires_at REAL NOT NULL       -- Unix timestamp
+);
+
+CREATE INDEX IF NOT EXISTS idx_http_cache_expires ON http_cache(expires_at);
+"""
+
+
+# SQL Schema untuk cache metadata channel (subscriber + lokasi)
+CHANNEL_TABLE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS channels (
+    channel_id TEXT PRIMARY KEY,
+    subscriber_count INTEGER DEFAULT 0,
+    location TEXT,
+    fetched_at REAL NOT NULL       -- Unix timestamp
+);
+
+CREATE INDEX IF NOT EXISTS idx_channels_fetched_at ON channels(fetched_at);
+"""
+
+
+# SQL Schema untuk time series statistik video (hasil refresh berkala)
+VIDEO_STATS_TABLE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS video_stats (
+    video_id TEXT NOT NULL,
+    ts REAL NOT NULL,              -- Unix timestamp poll
+    views INTEGER NOT NULL,
+    likes INTEGER NOT NULL,
+    PRIMARY KEY (video_id, ts)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_video_stats_ts ON video_stats(ts);
+"""
+
+
+# SQL Schema untuk run hunt + checkpoint (resume hunt yang terputus)
+RUN_TABLE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,          -- running, interrupted, completed
+    params TEXT NOT NULL,          -- JSON parameter hunt (searches, target, date range)
+    stats TEXT,                    -- JSON statistik terakhir
+    error TEXT,
+    created_at REAL NOT NULL,      -- Unix timestamp
+    updated_at REAL NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_runs_status ON runs(status, updated_at);
+
+-- Progress pagination setiap slice date window
+CREATE TABLE IF NOT EXISTS run_slices (
+    run_id TEXT NOT NULL,
+    search_index INTEGER NOT NULL,
+    published_after TEXT NOT NULL,
+    published_before TEXT NOT NULL,
+    need INTEGER NOT NULL,
+    first_limit INTEGER NOT NULL,
+    page_token TEXT,               -- NULL setelah halaman terakhir
+    pages INTEGER DEFAULT 0,
+    got INTEGER DEFAULT 0,
+    total_results INTEGER DEFAULT 0,
+    status TEXT DEFAULT 'open',    -- open, done, split
+    PRIMARY KEY (run_id, search_index, published_after, published_before)
+) WITHOUT ROWID;
+
+-- Kandidat video dan sampai stage mana sudah diproses
+CREATE TABLE IF NOT EXISTS run_candidates (
+    run_id TEXT NOT NULL,
+    video_id TEXT NOT NULL,
+    search_index INTEGER NOT NULL,
+    status TEXT NOT NULL,          -- found, fetched, enriched, rejected, saved
+    snippet TEXT,                  -- JSON snippet hasil search
+    record TEXT,                   -- JSON detail video (videos.list)
+    channel TEXT,                  -- JSON data channel (channels.list)
+    flags INTEGER DEFAULT 0,       -- Bitmask hard filter yang lulus
+    PRIMARY KEY (run_id, video_id)
+) WITHOUT ROWID;
+
+-- Keanggotaan video per run (video di-upsert lintas run, tidak dihapus)
+CREATE TABLE IF NOT EXISTS run_videos (
+    run_id TEXT NOT NULL,
+    video_id TEXT NOT NULL,
+    added_at TEXT DEFAULT (datetime('now')),
+    PRIMARY KEY (run_id, video_id)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_run_videos_video ON run_videos(video_id);
+"""
+
+
+# SQL Schema untuk jadwal hunt berkala dan antrian job scheduler
+SCHEDULE_TABLE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS schedules (
+    schedule_id TEXT PRIMARY KEY,
+    name TEXT UNIQUE NOT NULL,
+    cron TEXT NOT NULL,            -- Ekspresi cron 5 field (waktu lokal)
+    params TEXT NOT NULL,          -- JSON argumen scrape_batch (queries, regions, target_count, rules)
+    priority REAL DEFAULT 1.0,     -- Bobot, dikali estimasi yield per unit quota
+    enabled BOOLEAN DEFAULT 1,
+    next_run_at REAL NOT NULL,     -- Unix timestamp jadwal berikutnya
+    last_run_at REAL,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_schedules_due ON schedules(enabled, next_run_at);
+
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    schedule_id TEXT,              -- NULL untuk job sekali jalan
+    params TEXT NOT NULL,          -- JSON argumen scrape_batch
+    priority REAL DEFAULT 1.0,
+    status TEXT NOT NULL,          -- queued, deferred, running, completed, failed
+    due_at REAL NOT NULL,          -- Unix timestamp, job tidak dijalankan sebelum ini
+    est_units INTEGER,             -- Estimasi quota terakhir (planner)
+    yield_per_unit REAL,           -- Estimasi video lulus per unit quota
+    run_id TEXT,                   -- Run hunt job ini (dilanjutkan saat retry)
+    attempts INTEGER DEFAULT 0,
+    worker_id TEXT,                -- Worker pemegang lease (host:pid:id)
+    lease_expires_at REAL,         -- Unix timestamp; lease habis = job diambil worker lain
+    heartbeat_at REAL,
+    error TEXT,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL
+);
+
+CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status, due_at);
+CREATE INDEX IF NOT EXISTS idx_jobs_schedule ON jobs(schedule_id, status);
+"""
+
+# Kolom yang ditambahkan ke tabel yang sudah ada: (tabel, kolom, tipe).
+# CREATE TABLE IF NOT EXISTS tidak mengubah tabel di database lama, jadi
+# kolom ini ditambahkan lewat ALTER TABLE (lihat _migrate_columns)
+ADDED_COLUMNS = [
+    ("jobs", "worker_id", "TEXT"),
+    ("jobs", "lease_expires_at", "REAL"),
+    ("jobs", "heartbeat_at", "REAL"),
+]
+
+# Index yang memakai kolom ADDED_COLUMNS (dibuat setelah migrasi)
+MIGRATED_INDEX_SCHEMA = """
+CREATE INDEX IF NOT EXISTS idx_jobs_lease ON jobs(status, lease_expires_at);
+"""
+
+
+def _migrate_columns(conn: sqlite3.Connection) -> None:
+    """
+    Tambahkan kolom ADDED_COLUMNS yang belum ada (database versi lama).
+
+    Dijalankan dalam satu transaksi BEGIN IMMEDIATE supaya proses lain
+    yang inisialisasi bersamaan tidak menambahkan kolom yang sama.
+
+    Args:
+        conn: Koneksi database.
+    """
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        for table, column, column_type in ADDED_COLUMNS:
+            existing = {row["name"] for row in conn.execute(f"PRAGMA table_info({table})")}
+            if column not in existing:
+                conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {column_type}")
+                logger.info(f"Migrasi: kolom {table}.{column} ditambahkan")
+        conn.execute(MIGRATED_INDEX_SCHEMA)
+        conn.commit()
+    except sqlite3.Error:
+        conn.rollback()
+        raise
+
+
 def init_database(db_path: Optional[str] = None) -> sqlite3.Connection:
     """
     Inisialisasi database dan buat tabel jika belum ada.
@@ -97,20 +291,32 @@ def init_database(db_path: Optional[str] = None) -> sqlite3.Connection:
     )
     conn.row_factory = sqlite3.Row  # Return baris sebagai objek seperti dict
 
-    # Enable WAL mode untuk better concurrency
+    # Enable WAL mode untuk better concurrency (DATABASE_JOURNAL_MODE=DELETE
+    # untuk database di volume jaringan: WAL butuh shared memory satu host)
+    journal_mode = Config.DATABASE_JOURNAL_MODE
+    if journal_mode not in ("WAL", "DELETE", "TRUNCATE", "PERSIST"):
+        logger.warning(f"Journal mode tidak dikenal: {journal_mode}, pakai WAL")
+        journal_mode = "WAL"
     try:
-        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(f"PRAGMA journal_mode={journal_mode}")
         conn.execute("PRAGMA busy_timeout=10000")  # 10 detik
         conn.execute("PRAGMA synchronous=NORMAL")  # Balance speed/safety
-        logger.info("WAL mode diaktifkan, timeout=10s")
+        logger.info(f"Journal mode {journal_mode} diaktifkan, timeout=10s")
     except sqlite3.Error as e:
-        logger.warning(f"Tidak bisa mengaktifkan WAL mode: {e}")
+        logger.warning(f"Tidak bisa mengaktifkan journal mode {journal_mode}: {e}")
 
     # Buat tabel - gunakan executescript untuk multiple statements
     try:
         conn.executescript(VIDEO_TABLE_SCHEMA)
+        conn.executescript(QUOTA_LOG_TABLE_SCHEMA)
+        conn.executescript(HTTP_CACHE_TABLE_SCHEMA)
+        conn.executescript(CHANNEL_TABLE_SCHEMA)
+        conn.executescript(VIDEO_STATS_TABLE_SCHEMA)
+        conn.executescript(RUN_TABLE_SCHEMA)
+        conn.executescript(SCHEDULE_TABLE_SCHEMA)
         conn.commit()
-        logger.info("Tabel videos berhasil dibuat/terverifikasi")
+        _migrate_columns(conn)
+        logger.info("Tabel videos, quota_log, http_cache, channels, video_stats, runs, schedules, jobs berhasil dibuat/terverifikasi")
     except sqlite3.Error as e:
         logger.error(f"Gagal membuat tabel: {e}")
         conn.close()
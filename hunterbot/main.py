@@ -1,19 +1,20 @@
 """
 Entry point utama aplikasi Hunterbot.
 
-File ini adalah starting point untuk menjalankan aplikasi.
+File ini adalah starting point untuk menjalankan aplikasi desktop.
+GUI (customtkinter) baru diimpor di main(), jadi module ini aman diimpor
+di mesin tanpa display; untuk hunt headless lihat hunterbot.cli.
 """
 
 import sys
 import logging
 
 from hunterbot.config import Config
-from hunterbot.ui.main_window import HunterbotWindow
 from hunterbot.utils.logger import setup_logging, get_logger
 from hunterbot.database.schema import init_database
+from hunterbot.modules.stats_refresher import get_stats_refresher
+from hunterbot.modules.scheduler import get_scheduler
 
-# Inisialisasi logging
-setup_logging()
 logger = get_logger(__name__)
 
 
@@ -41,6 +42,9 @@ def main():
     """
     Main function untuk menjalankan aplikasi.
     """
+    # Inisialisasi logging
+    setup_logging()
+
     logger.info("=" * 50)
     logger.info("MEMULAI HUNTERBOT APLIKASI")
     logger.info("=" * 50)
@@ -60,8 +64,22 @@ def main():
         print("  YOUTUBE_API_KEY=your_api_key_here")
         return 1
 
+    # Refresh statistik video berkala (time series VPH) di background
+    refresher = None
+    if Config.STATS_REFRESH_ENABLED:
+        refresher = get_stats_refresher()
+        refresher.start()
+
+    # Hunt berkala dari jadwal (antrian job di database)
+    scheduler = None
+    if Config.SCHEDULER_ENABLED:
+        scheduler = get_scheduler()
+        scheduler.start()
+
     # Buat main window
     try:
+        from hunterbot.ui.main_window import HunterbotWindow
+
         app = HunterbotWindow()
         app.mainloop()
         logger.info("Aplikasi ditutup dengan normal")
@@ -71,6 +89,12 @@ def main():
         print(f"\nERROR: {e}")
         return 1
 
+    finally:
+        if refresher:
+            refresher.stop()
+        if scheduler:
+            scheduler.stop()
+
     return 0
 
 
@@ -13,10 +13,12 @@ Tier 1 Components:
 
 import re
 import logging
+import threading
 from typing import Dict, Any, Optional
 
 try:
     from langdetect import detect, LangDetectException
+    from langdetect.detector_factory import init_factory
 except ImportError:
     detect = None
 
@@ -269,11 +271,22 @@ class GeoValidator:
 
 # Singleton instance
 _validator_instance = None
+_validator_lock = threading.Lock()
 
 
 def get_validator() -> GeoValidator:
-    """Get or create GeoValidator singleton instance."""
+    """
+    Get or create GeoValidator singleton instance.
+
+    Profil bahasa langdetect dimuat di sini (sekali, di bawah lock).
+    Inisialisasi lazy langdetect tidak thread-safe: kalau detect()
+    pertama dipanggil beberapa worker validasi sekaligus, worker lain
+    memakai factory yang profilnya belum lengkap dan hasilnya salah.
+    """
     global _validator_instance
-    if _validator_instance is None:
-        _validator_instance = GeoValidator(target_region="US")
-    return _validator_instance
+    with _validator_lock:
+        if _validator_instance is None:
+            if detect is not None:
+                init_factory()
+            _validator_instance = GeoValidator(target_region="US")
+        return _validator_instance
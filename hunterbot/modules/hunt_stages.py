@@ -0,0 +1,1057 @@
+"""
+Hunt Stages - stage pipeline hunt dan state run yang dipakai bersama.
+
+Alur satu hunt (dirangkai HunterModule lewat modules.pipeline):
+source search -> fetch -> screen -> enrich -> filter -> validate -> persist
+
+Setiap stage adalah class kecil dengan method handle(item) yang dipasang
+ke Stage; semua stage berbagi satu HuntState (parameter run, counter,
+statistik, event early stop, dan request yang menunggu checkpoint), jadi
+satu stage bisa diuji atau dipakai ulang cukup dengan HuntState dan
+dependency-nya (client YouTubeAPI atau GeoValidator).
+"""
+
+import asyncio
+import logging
+import math
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from hunterbot.api.records import VideoRecord, VideoSnippet
+from hunterbot.api.resilience import VideoBatchResult, ChannelBatchResult
+from hunterbot.config import Config
+from hunterbot.database.models import Video, VideoStat, RunCheckpoint
+from hunterbot.modules.rules import RuleSet, VIDEO, CHANNEL, TEXT
+from hunterbot.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class _EnrichedBatch(NamedTuple):
+    """Batch video beserta data channel-nya (output stage enrich)."""
+
+    records: List[VideoRecord]
+    channels: List[dict]
+
+
+def split_date_range(published_after: str, published_before: str, parts: int) -> List[Tuple[str, str]]:
+    """
+    Bagi date range menjadi beberapa slice yang bersambung.
+
+    Batas slice dibulatkan ke menit penuh (params search stabil untuk
+    response cache). Slice tidak pernah lebih pendek dari satu menit.
+
+    Args:
+        published_after: Batas awal (ISO 8601).
+        published_before: Batas akhir (ISO 8601).
+        parts: Jumlah slice yang diinginkan.
+
+    Returns:
+        List (published_after, published_before) per slice, urut waktu.
+    """
+    start = datetime.fromisoformat(published_after.replace("Z", "+00:00"))
+    end = datetime.fromisoformat(published_before.replace("Z", "+00:00"))
+    step = (end - start) / max(1, parts)
+
+    bounds = [start]
+    for i in range(1, max(1, parts)):
+        bound = (start + step * i).replace(second=0, microsecond=0)
+        if bound > bounds[-1]:
+            bounds.append(bound)
+    bounds.append(end)
+
+    return [(a.isoformat(), b.isoformat()) for a, b in zip(bounds, bounds[1:])]
+
+
+def parse_upload_timestamps(upload_dates: List[str]) -> np.ndarray:
+    """
+    Parse tanggal upload (ISO 8601 UTC dari YouTube) sekaligus.
+
+    Format YouTube selalu UTC ("2024-01-15T10:30:00Z"), jadi cukup 19
+    karakter pertama yang diparse numpy dalam satu panggilan. Kalau ada
+    string yang tidak valid, parse diulang per item supaya hanya item itu
+    yang gagal.
+
+    Args:
+        upload_dates: List tanggal upload.
+
+    Returns:
+        Array float64 Unix timestamp; NaN untuk tanggal yang tidak valid.
+    """
+    try:
+        stamps = np.array([d[:19] if d else "NaT" for d in upload_dates], dtype="datetime64[s]")
+    except ValueError:
+        stamps = np.array([_parse_upload_timestamp(d) for d in upload_dates], dtype="datetime64[s]")
+
+    seconds = stamps.astype(np.int64).astype(np.float64)
+    seconds[np.isnat(stamps)] = np.nan
+    return seconds
+
+
+def _parse_upload_timestamp(upload_date: str) -> np.datetime64:
+    """Parse satu tanggal upload; NaT jika tidak valid."""
+    try:
+        return np.datetime64(upload_date[:19], "s")
+    except (TypeError, ValueError):
+        logger.warning(f"Gagal hitung hari dari {upload_date}")
+        return np.datetime64("NaT", "s")
+
+
+def video_columns(records: List[VideoRecord], now: float = None) -> Dict[str, np.ndarray]:
+    """
+    Kolom rule fase video untuk satu batch (data videos.list).
+
+    Args:
+        records: Video dalam batch.
+        now: Waktu acuan umur upload (Unix timestamp). Default sekarang.
+
+    Returns:
+        Dict views, likes, days_ago (array int64 per video). Tanggal
+        upload yang tidak valid dihitung 0 hari.
+    """
+    if now is None:
+        now = time.time()
+
+    count = len(records)
+    uploaded_at = parse_upload_timestamps([v.upload_date for v in records])
+    return {
+        "views": np.fromiter((v.views or 0 for v in records), dtype=np.int64, count=count),
+        "likes": np.fromiter((v.likes or 0 for v in records), dtype=np.int64, count=count),
+        "days_ago": np.nan_to_num(np.floor_divide(now - uploaded_at, 86400), nan=0.0).astype(np.int64),
+    }
+
+
+class HuntState:
+    """
+    State satu run hunt yang dipakai bersama semua stage.
+
+    Berisi parameter run, statistik (dict stats milik HunterModule, diisi
+    langsung), counter progress, dan koordinasi early stop:
+    - in_flight: kandidat yang belum punya hasil akhir; settled di-set
+      setiap ada yang selesai (search menunggu ini sebelum minta halaman)
+    - target_reached: di-set begitu video lulus Tier 1 mencapai target
+
+    Semua method dipanggil dari event loop, kecuali yang disebut lain.
+    """
+
+    def __init__(
+        self,
+        run_id: str,
+        searches: List[Tuple[str, Optional[str]]],
+        target_count: int,
+        target_with_buffer: int,
+        max_videos_per_search: int,
+        published_after: str,
+        published_before: str,
+        rules: RuleSet,
+        stats: dict,
+        progress: Callable[[int, int], None] = None,
+        checkpoint: Optional[dict] = None
+    ):
+        """
+        Inisialisasi state run (dan pulihkan checkpoint kalau ada).
+
+        Harus dibuat di dalam event loop yang menjalankan pipeline.
+
+        Args:
+            run_id: ID run (ledger quota dan checkpoint).
+            searches: List (query, region_code). region_code None = Config.
+            target_count: Target jumlah video.
+            target_with_buffer: Maksimal kandidat yang diproses.
+            max_videos_per_search: Maksimal video per halaman search.
+            published_after: Batas awal upload (ISO 8601).
+            published_before: Batas akhir upload (ISO 8601).
+            rules: Rule filter run.
+            stats: Dict statistik run (diisi).
+            progress: Callback (current, total) progress filter (opsional).
+            checkpoint: Hasil RunCheckpoint.load() untuk resume (opsional).
+        """
+        self.run_id = run_id
+        self.searches = searches
+        self.target_count = target_count
+        self.target_with_buffer = target_with_buffer
+        self.max_videos_per_search = max_videos_per_search
+        self.published_after = published_after
+        self.published_before = published_before
+        self.rules = rules
+        self.stats = stats
+        self.progress = progress
+        self.checkpoint = checkpoint
+
+        # video_id -> index sub-search yang pertama menemukannya
+        self.video_ids_seen: Dict[str, int] = {}
+        self.per_search = [
+            {
+                "query": query,
+                "region_code": region_code or Config.REGION_CODE,
+                "found": 0,
+                "new": 0,
+                "duplicates": 0,
+                "scraped": 0,
+                "tier1_passed": 0,
+                "slices": 0,
+            }
+            for query, region_code in searches
+        ]
+        # Jatah kandidat dan ukuran halaman pertama setiap sub-search
+        self.share = math.ceil(target_with_buffer / len(searches))
+        self.first_page = math.ceil(target_count / len(searches))
+        self.all_passed = rules.phase_mask()
+
+        stats["failed_ids"] = []
+        stats["per_search"] = self.per_search
+        stats["saved"] = {"inserted": 0, "updated": 0, "failed": 0}
+        stats["rules"] = dict.fromkeys((rule.name for rule in rules), 0)
+
+        # Slice yang dilanjutkan saat resume, per index sub-search
+        self.restored_slices: Dict[int, List[dict]] = {}
+        self.tier1_passed = self._restore(checkpoint) if checkpoint else 0
+        # Video yang sudah dievaluasi rule video / rule channel
+        self.processed = stats["total_scraped"]
+        self.filtered = 0
+
+        self.target_reached = asyncio.Event()
+        if Config.SEARCH_EARLY_STOP and self.tier1_passed >= target_count:
+            self.target_reached.set()
+        self.in_flight = len(self.video_ids_seen) - self.processed
+        self.settled = asyncio.Event()
+        self.expected_pass_rate = min(1.0, Config.SEARCH_BUFFER_SAFETY * target_count / target_with_buffer)
+
+        # Request yang sudah terkirim tetap ditunggu sampai hasilnya tercatat
+        # di checkpoint walaupun pipeline berhenti (quota habis/error), supaya
+        # resume tidak mengulang request yang quota-nya sudah terpakai
+        self.inflight: set = set()
+
+    def _restore(self, checkpoint: dict) -> int:
+        """
+        Pulihkan statistik dan ID yang sudah ditemukan dari checkpoint run.
+
+        Args:
+            checkpoint: Hasil RunCheckpoint.load().
+
+        Returns:
+            Jumlah video yang sudah lulus Tier 1 dan tersimpan.
+        """
+        tier1_passed = 0
+
+        for slice_state in checkpoint["slices"]:
+            self.restored_slices.setdefault(slice_state["search_index"], []).append(slice_state)
+            yield_stats = self.per_search[slice_state["search_index"]]
+            yield_stats["found"] += slice_state["got"]
+            if slice_state["status"] != RunCheckpoint.SLICE_SPLIT:
+                yield_stats["slices"] += 1
+
+        for candidate in checkpoint["candidates"]:
+            yield_stats = self.per_search[candidate["search_index"]]
+            self.video_ids_seen[candidate["video_id"]] = candidate["search_index"]
+            yield_stats["new"] += 1
+            if candidate["status"] not in (RunCheckpoint.REJECTED, RunCheckpoint.SAVED):
+                continue
+
+            flags = candidate["flags"]
+            yield_stats["scraped"] += 1
+            self.stats["total_scraped"] += 1
+            self.count_rule_passes(flags)
+            if flags & self.rules.hard_mask == self.rules.hard_mask:
+                self.stats["passed_all"] += 1
+
+            if candidate["status"] == RunCheckpoint.SAVED:
+                tier1_passed += 1
+                yield_stats["tier1_passed"] += 1
+            else:
+                self.stats["failed"] += 1
+
+        for yield_stats in self.per_search:
+            yield_stats["duplicates"] = max(0, yield_stats["found"] - yield_stats["new"])
+
+        self.stats["resumed"] = {
+            "candidates": len(checkpoint["candidates"]),
+            "processed": self.stats["total_scraped"],
+            "tier1_passed": tier1_passed,
+        }
+        logger.info(
+            f"Checkpoint dipulihkan: {len(self.video_ids_seen)} kandidat, "
+            f"{self.stats['total_scraped']} sudah difilter, {tier1_passed} tersimpan"
+        )
+        return tier1_passed
+
+    async def save_checkpoint(self, method: Callable, *args) -> None:
+        """Panggil method RunCheckpoint (run_id + args) di thread."""
+        await asyncio.to_thread(method, self.run_id, *args)
+
+    async def checkpointed(self, coro):
+        """
+        Jalankan coroutine request yang hasilnya dicatat ke checkpoint.
+
+        Coroutine tetap berjalan sampai selesai walaupun pemanggilnya
+        dibatalkan; drain() menunggunya di akhir pipeline.
+        """
+        task = asyncio.ensure_future(coro)
+        self.inflight.add(task)
+        task.add_done_callback(self.inflight.discard)
+        return await asyncio.shield(task)
+
+    async def drain(self) -> None:
+        """Tunggu semua request checkpointed yang masih berjalan."""
+        await asyncio.gather(*self.inflight, return_exceptions=True)
+
+    def admit(self, video_ids: List[str], search_index: int) -> None:
+        """Catat kandidat baru dari sub-search search_index."""
+        self.video_ids_seen.update(dict.fromkeys(video_ids, search_index))
+        self.in_flight += len(video_ids)
+        self.per_search[search_index]["new"] += len(video_ids)
+
+    def settle(self, count: int) -> None:
+        """Catat count kandidat yang sudah punya hasil akhir."""
+        if count > 0:
+            self.in_flight -= count
+            self.settled.set()
+
+    def skip(self, count: int) -> None:
+        """Catat count kandidat yang dilewati karena target sudah tercapai."""
+        self.stats["skipped"] += count
+        self.settle(count)
+
+    async def wait_for_demand(self) -> bool:
+        """
+        Tunggu sampai kandidat di pipeline diperkirakan kurang untuk target.
+
+        Returns:
+            True jika search perlu minta halaman berikutnya, False jika
+            target sudah tercapai.
+        """
+        if not Config.SEARCH_EARLY_STOP:
+            return True
+        while not self.target_reached.is_set():
+            if self.tier1_passed + self.in_flight * self.expected_pass_rate < self.target_count:
+                return True
+            self.settled.clear()
+            await self.settled.wait()
+        return False
+
+    def record_pass(self, video_id: str) -> None:
+        """Catat satu video yang lulus Tier 1 (early stop kalau target tercapai)."""
+        self.tier1_passed += 1
+        self.per_search[self.video_ids_seen[video_id]]["tier1_passed"] += 1
+        if (
+            Config.SEARCH_EARLY_STOP
+            and self.tier1_passed >= self.target_count
+            and not self.target_reached.is_set()
+        ):
+            logger.info(f"Target {self.target_count} video tercapai, fetch kandidat berikutnya dihentikan")
+            self.stats["early_stopped"] = True
+            self.target_reached.set()
+            self.settled.set()
+
+    def update_progress(self) -> None:
+        """Laporkan jumlah video yang sudah difilter ke callback progress."""
+        if self.progress:
+            self.progress(self.processed, self.target_with_buffer)
+
+    def apply_rules(self, phase: str, columns: Dict[str, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Evaluasi rule satu fase untuk satu batch (mask numpy).
+
+        Jumlah video yang lulus setiap rule ditambahkan ke
+        stats["rules"], yang gagal ke stats["failed"].
+
+        Args:
+            phase: Fase yang dievaluasi (VIDEO atau CHANNEL).
+            columns: Dict field -> array nilai per video.
+
+        Returns:
+            Tuple (index video yang lulus semua rule fase ini, bitmask rule
+            fase ini yang lulus per video).
+        """
+        result = self.rules.evaluate(phase, columns)
+        for name, mask in result["masks"].items():
+            self.stats["rules"][name] += int(np.count_nonzero(mask))
+
+        passed = np.flatnonzero(result["passed"])
+        self.stats["failed"] += len(result["passed"]) - len(passed)
+        return passed, result["flags"]
+
+    def count_rule_passes(self, flags: int, *phases: str) -> None:
+        """
+        Tambah stats["rules"] dari bitmask flags satu video.
+
+        Args:
+            flags: Bitmask rule yang lulus.
+            phases: Fase yang dihitung. Default semua fase.
+        """
+        for bit, rule in enumerate(self.rules):
+            if (not phases or rule.phase in phases) and flags >> bit & 1:
+                self.stats["rules"][rule.name] += 1
+
+    def log_rule_failures(
+        self,
+        phase: str,
+        records: List[VideoRecord],
+        columns: Dict[str, np.ndarray],
+        passed: np.ndarray,
+        offset: int
+    ) -> None:
+        """
+        Log rule yang gagal per video (level DEBUG).
+
+        Args:
+            phase: Fase yang baru dievaluasi.
+            records: Video dalam batch.
+            columns: Kolom yang dipakai evaluasi.
+            passed: Index video yang lulus.
+            offset: Jumlah video sebelum batch ini (untuk nomor urut).
+        """
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+
+        phase_rules = [rule for rule in self.rules if rule.phase == phase]
+        masks = {rule.name: rule.evaluate(columns) for rule in phase_rules}
+        passed_set = set(passed.tolist())
+        for i, record in enumerate(records):
+            if i in passed_set:
+                continue
+            reason_str = ", ".join(
+                f"{rule.field}={columns[rule.field][i]} (harus {rule.op} {rule.value})"
+                for rule in phase_rules if not masks[rule.name][i]
+            )
+            logger.debug(
+                f"[{offset + i + 1}/{self.target_with_buffer}] ✗ Hard filter FAIL: {record.video_id} {reason_str}"
+            )
+
+    async def reject(self, records: List[VideoRecord], passed: np.ndarray, flags: np.ndarray) -> None:
+        """Catat video batch yang gagal rule di checkpoint beserta rule yang lulus."""
+        passed_set = set(passed.tolist())
+        rejected = [
+            (v.video_id, RunCheckpoint.REJECTED, int(flags[i]))
+            for i, v in enumerate(records) if i not in passed_set
+        ]
+        self.settle(len(rejected))
+        if rejected:
+            await self.save_checkpoint(RunCheckpoint.mark_done, rejected)
+
+
+class SearchSource:
+    """
+    Source pipeline: halaman search setiap sub-search (query, region).
+
+    Setiap sub-search berjalan concurrent. Date range dibagi menjadi slice
+    yang dicari paralel (halaman dalam satu slice berurutan); slice yang
+    jenuh (pagination habis sebelum jatahnya terpenuhi) dibagi dua lagi.
+    Saat resume, kandidat dari checkpoint di-emit dulu di stage setelah
+    yang tercatat, lalu slice yang belum selesai dilanjutkan.
+    """
+
+    def __init__(self, state: HuntState, youtube_api):
+        """
+        Args:
+            state: State run.
+            youtube_api: Client YouTubeAPI.
+        """
+        self.state = state
+        self.youtube_api = youtube_api
+
+    async def run(self, emit: Callable) -> None:
+        """Source pipeline (Pipeline.run): emit semua kandidat."""
+        if self.state.checkpoint:
+            await self.resume_candidates(emit)
+        await asyncio.gather(*(self.search(emit, i) for i in range(len(self.state.searches))))
+        logger.info(f"Total {len(self.state.video_ids_seen)} video akan diproses")
+
+    async def resume_candidates(self, emit: Callable) -> None:
+        """Emit kandidat dari checkpoint di stage setelah yang tercatat."""
+        pending_by_status = {}
+        for candidate in self.state.checkpoint["candidates"]:
+            pending_by_status.setdefault(candidate["status"], []).append(candidate)
+
+        size = self.state.max_videos_per_search
+        found = pending_by_status.get(RunCheckpoint.FOUND, [])
+        fetched = pending_by_status.get(RunCheckpoint.FETCHED, [])
+        enriched = pending_by_status.get(RunCheckpoint.ENRICHED, [])
+        logger.info(
+            f"Resume run {self.state.run_id}: {len(found)} video belum diambil detailnya, "
+            f"{len(fetched)} belum diambil channel-nya, {len(enriched)} belum difilter"
+        )
+
+        for i in range(0, len(enriched), size):
+            chunk = enriched[i:i + size]
+            await emit(_EnrichedBatch(
+                [VideoRecord(*c["record"]) for c in chunk], [c["channel"] for c in chunk]
+            ))
+        for i in range(0, len(fetched), size):
+            await emit(VideoBatchResult(VideoRecord(*c["record"]) for c in fetched[i:i + size]))
+        for i in range(0, len(found), size):
+            chunk = found[i:i + size]
+            await emit((
+                [c["video_id"] for c in chunk],
+                {c["video_id"]: VideoSnippet(*c["snippet"]) for c in chunk if c["snippet"]}
+            ))
+
+    async def search(self, emit: Callable, index: int) -> None:
+        """Cari satu sub-search: semua slice date range-nya paralel."""
+        state = self.state
+        if index in state.restored_slices:
+            # Resume: lanjutkan slice yang belum selesai dari checkpoint
+            await asyncio.gather(*(
+                self.search_slice(
+                    emit, index, slice_state["published_after"], slice_state["published_before"],
+                    slice_state["need"], slice_state["first_limit"], slice_state
+                )
+                for slice_state in state.restored_slices[index]
+                if slice_state["status"] == RunCheckpoint.SLICE_OPEN
+            ))
+            return
+
+        # Window dibagi supaya setiap slice muat di batas pagination,
+        # semua slice dicari paralel
+        slices = split_date_range(
+            state.published_after, state.published_before,
+            math.ceil(state.share / Config.SEARCH_SLICE_CAPACITY)
+        )
+        state.per_search[index]["slices"] = len(slices)
+        need = math.ceil(state.share / len(slices))
+        first_limit = math.ceil(state.first_page / len(slices))
+        await state.save_checkpoint(
+            RunCheckpoint.open_slices, index,
+            [(after, before, need, first_limit) for after, before in slices]
+        )
+        await asyncio.gather(*(
+            self.search_slice(emit, index, after, before, need, first_limit) for after, before in slices
+        ))
+
+    async def search_slice(
+        self,
+        emit: Callable,
+        index: int,
+        after: str,
+        before: str,
+        need: int,
+        first_limit: int,
+        slice_state: Optional[dict] = None
+    ) -> None:
+        """
+        Paginate satu slice date range, lalu bagi dua kalau jenuh.
+
+        Args:
+            emit: Emit pipeline.
+            index: Index sub-search.
+            after: Batas awal slice.
+            before: Batas akhir slice.
+            need: Jatah hasil search slice.
+            first_limit: Ukuran halaman pertama.
+            slice_state: Progress slice dari checkpoint (resume).
+        """
+        state = self.state
+        yield_stats = state.per_search[index]
+        # Progress pagination slice; state dari checkpoint saat resume
+        progress = {
+            "page_token": slice_state["page_token"] if slice_state else None,
+            "pages": slice_state["pages"] if slice_state else 0,
+            "got": slice_state["got"] if slice_state else 0,
+            "total_results": slice_state["total_results"] if slice_state else 0,
+        }
+        exhausted = progress["pages"] > 0 and not progress["page_token"]
+
+        # Jatah dihitung dari hasil search (termasuk duplikat) supaya jumlah
+        # halaman search tetap sesuai rencana quota; overlap antar
+        # sub-search hanya mengurangi kandidat unik, bukan menambah request
+        while (
+            not exhausted
+            and progress["got"] < need
+            and yield_stats["found"] < state.share
+            and len(state.video_ids_seen) < state.target_with_buffer
+            and await state.wait_for_demand()
+        ):
+            new_ids, snippets, exhausted = await state.checkpointed(
+                self.take_page(index, after, before, first_limit, progress)
+            )
+            if new_ids:
+                await emit((new_ids, snippets))
+
+        # Pagination berhenti sebelum jatah terpenuhi padahal slice masih
+        # punya hasil lain (jenuh, kena batas pagination): bagi dua.
+        # Sisa di bawah satu halaman tidak sebanding dengan 2 request search
+        got = progress["got"]
+        total_results = progress["total_results"]
+        remaining = min(need - got, state.share - yield_stats["found"])
+        span_hours = (
+            datetime.fromisoformat(before) - datetime.fromisoformat(after)
+        ).total_seconds() / 3600
+        children = []
+        if (
+            remaining >= state.max_videos_per_search
+            and total_results > got
+            and len(state.video_ids_seen) < state.target_with_buffer
+            and not state.target_reached.is_set()
+            and span_hours >= 2 * Config.SEARCH_MIN_SLICE_HOURS
+        ):
+            halves = split_date_range(after, before, 2)
+            logger.info(
+                f"Slice {after} s/d {before} jenuh (~{total_results} hasil, "
+                f"terbaca {got}), dibagi menjadi {len(halves)}"
+            )
+            yield_stats["slices"] += len(halves) - 1
+            child_need = math.ceil(remaining / len(halves))
+            children = [(a, b, child_need, state.max_videos_per_search) for a, b in halves]
+
+        await state.save_checkpoint(RunCheckpoint.close_slice, index, after, before, children)
+        await asyncio.gather(*(self.search_slice(emit, index, *child) for child in children))
+
+    async def take_page(
+        self,
+        index: int,
+        after: str,
+        before: str,
+        first_limit: int,
+        progress: dict
+    ) -> tuple:
+        """
+        Ambil halaman search berikutnya satu slice dan catat di checkpoint.
+
+        Args:
+            index: Index sub-search.
+            after: Batas awal slice.
+            before: Batas akhir slice.
+            first_limit: Ukuran halaman pertama.
+            progress: Progress pagination slice (diupdate).
+
+        Returns:
+            Tuple (ID baru, snippet per ID baru, pagination habis).
+        """
+        state = self.state
+        query, region_code = state.searches[index]
+        yield_stats = state.per_search[index]
+        page_count = progress["pages"] + 1
+        if page_count > 1:
+            logger.info(f"Fetch halaman {page_count} ('{query}', {yield_stats['region_code']}, {after})")
+
+        # Halaman pertama sebesar target, berikutnya halaman penuh
+        # (biaya quota per halaman sama berapapun isinya)
+        limit = first_limit if page_count == 1 else state.max_videos_per_search
+        page = await self.youtube_api.search_page_async(
+            query=query,
+            max_results=min(state.max_videos_per_search, limit),
+            region_code=region_code,
+            page_token=progress["page_token"],
+            published_after=after,
+            published_before=before
+        )
+        page_exhausted = not page.video_ids or not page.next_page_token
+
+        unique_ids = list(dict.fromkeys(page.video_ids))
+        new_ids = [v for v in unique_ids if v not in state.video_ids_seen]
+        # ID baru di luar buffer dibuang dan tidak dihitung sebagai
+        # hasil search, jadi found = new + duplicates (juga saat resume,
+        # found dipulihkan dari got)
+        kept = new_ids[:max(0, state.target_with_buffer - len(state.video_ids_seen))]
+        found = len(unique_ids) - (len(new_ids) - len(kept))
+        duplicates = len(unique_ids) - len(new_ids)
+        new_ids = kept
+
+        progress["page_token"] = None if page_exhausted else page.next_page_token
+        progress["pages"] = page_count
+        progress["got"] += found
+        progress["total_results"] = max(progress["total_results"], page.total_results)
+        yield_stats["found"] += found
+        yield_stats["duplicates"] += duplicates
+        state.admit(new_ids, index)
+
+        snippets = {v: page.snippets[v] for v in new_ids if v in page.snippets}
+        await state.save_checkpoint(
+            RunCheckpoint.record_page, index, after, before,
+            progress["page_token"], progress["pages"], progress["got"], progress["total_results"],
+            [(v, list(snippets[v]) if v in snippets else None) for v in new_ids]
+        )
+
+        if not page.video_ids and page_count > 1:
+            logger.warning(f"Tidak ada video tambahan di halaman ini ('{query}')")
+        return new_ids, snippets, page_exhausted
+
+
+class FetchStage:
+    """
+    Stage fetch (I/O): videos.list untuk ID baru dari search.
+
+    Snippet search dipakai ulang, jadi cukup statistik yang diminta.
+    Batch dari checkpoint yang sudah melewati stage ini diteruskan.
+    """
+
+    def __init__(self, state: HuntState, youtube_api):
+        """
+        Args:
+            state: State run.
+            youtube_api: Client YouTubeAPI.
+        """
+        self.state = state
+        self.youtube_api = youtube_api
+
+    async def handle(self, item: tuple) -> list:
+        """(video_ids, snippets) -> list VideoBatchResult."""
+        if isinstance(item, (_EnrichedBatch, VideoBatchResult)):
+            return [item]
+
+        video_ids, snippets = item
+        if self.state.target_reached.is_set():
+            self.state.skip(len(video_ids))
+            return []
+
+        batches = await self.state.checkpointed(self._fetch(video_ids, snippets))
+        # Video yang gagal diambil atau sudah hilang/privat
+        self.state.settle(len(video_ids) - sum(len(batch) for batch in batches))
+        return batches
+
+    async def _fetch(self, video_ids: List[str], snippets: Dict[str, VideoSnippet]) -> List[VideoBatchResult]:
+        """Ambil detail video lalu catat di checkpoint."""
+        batches = [
+            batch async for batch in
+            self.youtube_api.iter_video_details_async(video_ids, snippets=snippets)
+        ]
+        await self.state.save_checkpoint(
+            RunCheckpoint.mark_fetched,
+            [(v.video_id, list(v)) for batch in batches for v in batch]
+        )
+        return batches
+
+
+class ScreenStage:
+    """Stage screen (event loop): rule fase video (views, umur) per batch."""
+
+    def __init__(self, state: HuntState):
+        """
+        Args:
+            state: State run.
+        """
+        self.state = state
+
+    async def handle(self, batch) -> list:
+        """VideoBatchResult atau _EnrichedBatch -> batch video yang lolos."""
+        state = self.state
+        # Kandidat dari checkpoint bisa sudah punya data channel
+        if isinstance(batch, _EnrichedBatch):
+            records, channels = batch
+        else:
+            state.stats["failed_ids"].extend(batch.failed_ids)
+            records, channels = list(batch), None
+        if not records:
+            return []
+
+        offset = state.processed
+        state.processed += len(records)
+        state.stats["total_scraped"] += len(records)
+        for record in records:
+            state.per_search[state.video_ids_seen[record.video_id]]["scraped"] += 1
+
+        columns = video_columns(records)
+        passed, flags = state.apply_rules(VIDEO, columns)
+        state.log_rule_failures(VIDEO, records, columns, passed, offset)
+        state.update_progress()
+        await state.reject(records, passed, flags)
+
+        survivors = passed.tolist()
+        if not survivors:
+            return []
+        if channels is None:
+            return [VideoBatchResult(records[i] for i in survivors)]
+        return [_EnrichedBatch([records[i] for i in survivors], [channels[i] for i in survivors])]
+
+
+class EnrichStage:
+    """
+    Stage enrich (I/O): channels.list untuk video yang lolos screen.
+
+    Channel yang sudah diminta batch lain tidak diminta ulang (request
+    yang sedang berjalan ditunggu bersama).
+    """
+
+    def __init__(self, state: HuntState, youtube_api):
+        """
+        Args:
+            state: State run.
+            youtube_api: Client YouTubeAPI.
+        """
+        self.state = state
+        self.youtube_api = youtube_api
+        # channel_id -> task request channels yang memuatnya
+        self.channel_tasks: Dict[str, asyncio.Future] = {}
+
+    async def handle(self, batch) -> List[_EnrichedBatch]:
+        """VideoBatchResult -> _EnrichedBatch (video + data channel)."""
+        if isinstance(batch, _EnrichedBatch):
+            return [batch]
+        state = self.state
+        if state.target_reached.is_set():
+            state.skip(len(batch))
+            return []
+
+        channel_details = await self.resolve_channels([v.channel_id for v in batch])
+
+        failed_channels = set(channel_details.failed_ids)
+        state.stats["failed_ids"].extend(
+            v.video_id for v in batch if v.channel_id in failed_channels
+        )
+        records = [v for v in batch if v.channel_id not in failed_channels]
+        state.settle(len(batch) - len(records))
+        if not records:
+            return []
+        channels = [channel_details.get(v.channel_id, {}) for v in records]
+        await state.save_checkpoint(
+            RunCheckpoint.mark_enriched,
+            [(v.video_id, channel) for v, channel in zip(records, channels)]
+        )
+        return [_EnrichedBatch(records, channels)]
+
+    async def resolve_channels(self, channel_ids: List[str]) -> ChannelBatchResult:
+        """Data channel untuk channel_ids (request bersama antar batch)."""
+        new_ids = [c for c in dict.fromkeys(channel_ids) if c not in self.channel_tasks]
+        if new_ids:
+            task = asyncio.ensure_future(self.youtube_api.get_channel_details_async(new_ids))
+            for channel_id in new_ids:
+                self.channel_tasks[channel_id] = task
+
+        channel_details = ChannelBatchResult()
+        for batch in await asyncio.gather(*{self.channel_tasks[c] for c in channel_ids}):
+            channel_details.update(batch)
+            channel_details.failed_ids.extend(batch.failed_ids)
+        return channel_details
+
+    def close(self) -> None:
+        """Batalkan request channel yang masih berjalan."""
+        for task in set(self.channel_tasks.values()):
+            task.cancel()
+
+
+class ChannelFilterStage:
+    """Stage filter (event loop): rule fase channel (subscriber) per batch."""
+
+    def __init__(self, state: HuntState):
+        """
+        Args:
+            state: State run.
+        """
+        self.state = state
+
+    async def handle(self, item: _EnrichedBatch) -> List[tuple]:
+        """_EnrichedBatch -> (record, channel, days_ago, posisi) per video yang lolos."""
+        state = self.state
+        records, channels = item
+        offset = state.filtered
+        state.filtered += len(records)
+
+        columns = video_columns(records)
+        columns["subscribers"] = np.fromiter(
+            (c.get("subscriber_count") or 0 for c in channels), dtype=np.int64, count=len(records)
+        )
+        passed, flags = state.apply_rules(CHANNEL, columns)
+        # Yang sampai di sini sudah lulus semua rule video
+        flags |= state.rules.phase_mask(VIDEO)
+        state.stats["passed_all"] += len(passed)
+
+        logger.info(
+            f"[{state.processed}/{state.target_with_buffer}] Hard filter: "
+            f"{len(passed)}/{len(records)} lulus → Tier1 validating..."
+        )
+        state.log_rule_failures(CHANNEL, records, columns, passed, offset)
+        await state.reject(records, passed, flags)
+
+        days_ago = columns["days_ago"]
+        return [
+            (records[i], channels[i], int(days_ago[i]), offset + i + 1)
+            for i in passed.tolist()
+        ]
+
+
+class ValidateStage:
+    """
+    Stage validate (CPU, thread pool): Tier 1 + rule teks.
+
+    Tidak mengubah state run supaya aman dijalankan beberapa worker
+    sekaligus; statistik dicatat stage persist. Tanpa rule teks, Tier 1
+    (langdetect) tidak dijalankan.
+    """
+
+    def __init__(self, state: HuntState, validator):
+        """
+        Args:
+            state: State run.
+            validator: GeoValidator untuk Tier 1 (lihat get_validator).
+        """
+        self.state = state
+        self.validator = validator
+        self.check_text = state.rules.has_phase(TEXT)
+
+    def handle(self, item: tuple) -> List[tuple]:
+        """(record, channel, days_ago, posisi) -> + (hasil Tier 1, flags)."""
+        record, channel_data, days_ago, position = item
+        if not self.check_text:
+            return [(record, channel_data, days_ago, None, self.state.rules.hard_mask, position)]
+        tier1_result, flags = self.validate(record, channel_data, position)
+        return [(record, channel_data, days_ago, tier1_result, flags, position)]
+
+    def validate(self, record: VideoRecord, channel_data: dict, position: int) -> Tuple[Optional[dict], int]:
+        """
+        Validasi Tier 1 satu video.
+
+        Skor Tier 1 dievaluasi dengan rule teks run; pola exclude tetap
+        menggagalkan video.
+
+        Args:
+            record: Metadata video yang lulus rule video dan channel.
+            channel_data: Data channel ({subscriber_count, location}).
+            position: Nomor urut video (untuk log).
+
+        Returns:
+            Tuple (hasil validate_tier1 dengan passed sesuai rule teks,
+            atau None jika validasi error; bitmask rule yang lulus).
+        """
+        rules = self.state.rules
+        total = self.state.target_with_buffer
+        flags = rules.hard_mask
+        try:
+            tier1_result = self.validator.validate_tier1(
+                record.title, record.description, channel_data.get("location", "")
+            )
+        except Exception as e:
+            logger.error(f"Gagal memproses video {record.video_id}: {e}")
+            return None, flags
+
+        text = rules.evaluate(TEXT, {"tier1_score": np.array([tier1_result["score"]])})
+        flags |= int(text["flags"][0])
+        tier1_result["passed"] = bool(text["passed"][0]) and not tier1_result["has_exclude_patterns"]
+
+        if tier1_result["passed"]:
+            # UPDATED: Log lulus Tier 1
+            logger.info(f"[{position}/{total}] ✓✓ Tier1 PASS (score: {tier1_result['score']:.2f}) → SAVING...")
+        else:
+            logger.info(f"[{position}/{total}] ✗ Tier1 FAIL (score: {tier1_result['score']:.2f})")
+        return tier1_result, flags
+
+
+class PersistStage:
+    """
+    Stage persist (I/O SQLite, thread): simpan video yang lulus Tier 1.
+
+    Video ditampung lalu disimpan per PIPELINE_PERSIST_BATCH video
+    (Video.save_many, sekaligus dicatat sebagai hasil run di run_videos);
+    hasil akhir kandidat dicatat di checkpoint setelah videonya tersimpan.
+    """
+
+    def __init__(self, state: HuntState):
+        """
+        Args:
+            state: State run.
+        """
+        self.state = state
+        # Video lulus Tier 1 yang belum ditulis: (Video, snapshot statistik)
+        self.pending: List[tuple] = []
+        # Hasil akhir video (video_id, status, flags) yang belum dicatat di checkpoint
+        self.done: List[tuple] = []
+        # Snapshot statistik awal video yang disimpan (baseline VPH)
+        self.snapshots: List[tuple] = []
+
+    async def handle(self, item: tuple) -> List[str]:
+        """Hasil validate -> [video_id] jika video lulus dan ditampung."""
+        state = self.state
+        record, channel_data, days_ago, tier1_result, flags, position = item
+        state.settle(1)
+        state.count_rule_passes(flags, TEXT)
+        if flags != state.all_passed or (tier1_result is not None and not tier1_result["passed"]):
+            state.stats["failed"] += 1
+            self.done.append((record.video_id, RunCheckpoint.REJECTED, flags))
+            if len(self.done) >= Config.PIPELINE_PERSIST_BATCH:
+                await self.flush()
+            return []
+
+        state.record_pass(record.video_id)
+        self.pending.append((
+            self.build_video(record, channel_data, days_ago, tier1_result, state.rules.passed_rules(flags)),
+            (record.video_id, record.views, record.likes)
+        ))
+        if len(self.pending) >= Config.PIPELINE_PERSIST_BATCH:
+            await self.flush()
+        return [record.video_id]
+
+    async def flush(self) -> None:
+        """Tulis video yang ditampung lalu catat hasilnya di checkpoint."""
+        state = self.state
+        batch = self.pending[:]
+        results = self.done[:]
+        self.pending.clear()
+        self.done.clear()
+        if batch:
+            result = await asyncio.to_thread(
+                Video.save_many, [video for video, _ in batch], state.run_id
+            )
+            for key, count in result.items():
+                state.stats["saved"][key] += count
+            if not result["failed"]:
+                self.snapshots.extend(snapshot for _, snapshot in batch)
+                results.extend(
+                    (video.video_id, RunCheckpoint.SAVED, state.all_passed) for video, _ in batch
+                )
+        # Posisi filter dicatat setelah video tersimpan
+        if results:
+            await state.save_checkpoint(RunCheckpoint.mark_done, results)
+
+    async def close(self) -> None:
+        """Simpan sisa tampungan dan snapshot statistik awal."""
+        await self.flush()
+        await asyncio.to_thread(VideoStat.record_many, self.snapshots, time.time())
+
+    @staticmethod
+    def build_video(
+        record: VideoRecord,
+        channel_data: dict,
+        days_ago: int,
+        tier1_result: Optional[dict],
+        rule_results: Dict[str, bool]
+    ) -> Video:
+        """
+        Buat Video dari video yang lulus semua rule.
+
+        Args:
+            record: Metadata video.
+            channel_data: Data channel ({subscriber_count, location}).
+            days_ago: Umur upload (hari) dari hard filter.
+            tier1_result: Hasil validate_tier1, atau None jika rule set
+                tanpa rule teks (Tier 1 tidak dijalankan).
+            rule_results: Hasil per rule (RuleSet.passed_rules). Flag
+                passed_* untuk rule yang tidak ada di rule set run
+                (tidak dievaluasi) disimpan False.
+
+        Returns:
+            Video (belum disimpan, lihat Video.save_many).
+        """
+        tier1 = {}
+        if tier1_result is not None:
+            tier1 = {
+                "tier1_validated": True,
+                "tier1_score": tier1_result["score"],
+                "tier1_language_score": tier1_result["scores"]["language"],
+                "tier1_currency_score": tier1_result["scores"]["currency"],
+                "tier1_cultural_score": tier1_result["scores"]["cultural"],
+                "tier1_region_score": tier1_result["scores"]["region"],
+                "tier1_has_exclude": tier1_result["has_exclude_patterns"],
+            }
+
+        return Video(
+            video_id=record.video_id,
+            title=record.title,
+            channel_id=record.channel_id,
+            channel_title=record.channel_title,
+            subscriber_count=channel_data.get("subscriber_count", 0),
+            upload_date=record.upload_date,
+            upload_days_ago=days_ago,
+            views=record.views,
+            likes=record.likes,
+            thumbnail_url=record.thumbnail_url,
+            description=record.description,
+            state=Video.STATE_SCRAPED,
+            passed_min_views=rule_results.get("passed_min_views", False),
+            passed_max_views_vs_subs=rule_results.get("passed_max_views", False),
+            passed_upload_age=rule_results.get("passed_upload_age", False),
+            channel_location=channel_data.get("location", ""),
+            # Tier 1 fields
+            **tier1
+        )
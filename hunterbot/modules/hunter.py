@@ -8,17 +8,34 @@ Module ini mengorchestrasi proses scraping dari YouTube:
 4. Apply hard filter (PRD)
 5. Apply Tier 1 validation (baru!)
 6. Simpan ke database
+
+Langkah 2-6 berjalan sebagai stage pipeline (lihat modules.pipeline);
+stage dan state run-nya ada di modules.hunt_stages.
 """
 
-import logging
-from typing import List, Optional, Callable
-from datetime import datetime
+import asyncio
+import math
+import uuid
+from typing import List, Optional, Callable, Tuple
 
 from hunterbot.api.youtube_api import YouTubeAPI, YouTubeAPIError, QuotaExceededException
 from hunterbot.config import Config
-from hunterbot.database.models import Video
+from hunterbot.database.models import Video, QuotaLog, Run, RunCheckpoint
 from hunterbot.utils.logger import get_logger
 from hunterbot.modules.geo_validator import get_validator
+from hunterbot.modules.hunt_stages import (
+    HuntState,
+    SearchSource,
+    FetchStage,
+    ScreenStage,
+    EnrichStage,
+    ChannelFilterStage,
+    ValidateStage,
+    PersistStage,
+)
+from hunterbot.modules.pipeline import Pipeline, Stage
+from hunterbot.modules.planner import HuntPlanner
+from hunterbot.modules.rules import RuleSet
 
 logger = get_logger(__name__)
 
@@ -31,11 +48,24 @@ MIN_DAYS_AGO = 0            # Minimal 0 hari
 MAX_SUBSCRIBER = 300000    # Maksimal 300000 subscriber (medium channels)
 TIER1_THRESHOLD = 0.50     # Tier 1 threshold 50% (dari 70%)
 
+# Rule filter default (bisa diganti per run lewat scrape_batch(rules=...)).
+# Urutan rule = urutan bit di bitmask flags checkpoint run_candidates
+DEFAULT_RULES = [
+    {"name": "passed_min_views", "field": "views", "op": ">=", "value": MIN_VIEWS},
+    {"name": "passed_max_views", "field": "views", "op": "<=", "value": MAX_VIEWS},
+    {"name": "passed_upload_age", "field": "days_ago", "op": "<=", "value": MAX_DAYS_AGO},
+    {"name": "passed_max_subs", "field": "subscribers", "op": "<=", "value": MAX_SUBSCRIBER},
+    {"name": "passed_tier1", "field": "tier1_score", "op": ">=", "value": TIER1_THRESHOLD},
+]
+
 
 def calculate_date_range(max_days_ago: int = 21) -> tuple[str, str]:
     """
     Hitung date range untuk YouTube API filter.
 
+    Batas range dibulatkan ke jam penuh (after ke bawah, before ke atas)
+    supaya params search stabil dalam satu jam dan bisa kena response cache.
+
     Args:
         max_days_ago: Maksimal hari ke belakang dari hari ini.
 
@@ -44,11 +74,11 @@ def calculate_date_range(max_days_ago: int = 21) -> tuple[str, str]:
     """
     from datetime import datetime, timezone, timedelta
 
-    now = datetime.now(timezone.utc)
-    published_before = now.isoformat()
+    hour = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+    published_before = (hour + timedelta(hours=1)).isoformat()
 
     # max_days_ago hari ke belakang
-    published_after = (now - timedelta(days=max_days_ago)).isoformat()
+    published_after = (hour - timedelta(days=max_days_ago)).isoformat()
 
     return published_after, published_before
 
@@ -72,21 +102,26 @@ class HunterModule:
             api_key: YouTube Data API key. Default dari Config.
         """
         self.youtube_api = YouTubeAPI(api_key)
+        self.planner = HuntPlanner(self.youtube_api)
         self.progress_callback: Optional[Callable] = None
+        self.run_id: Optional[str] = None
 
         # UPDATED: Filter statistics dengan filter baru
-        self.stats = {
+        self.stats = self._empty_stats()
+
+        logger.info("Hunter module diinisialisasi")
+
+    @staticmethod
+    def _empty_stats() -> dict:
+        """Statistik awal satu run."""
+        return {
             "total_scraped": 0,
-            "passed_min_views": 0,
-            "passed_max_views": 0,
-            "passed_upload_age": 0,
-            "passed_max_subs": 0,
             "passed_all": 0,
-            "failed": 0
+            "failed": 0,
+            "early_stopped": False,
+            "skipped": 0
         }
 
-        logger.info("Hunter module diinisialisasi")
-
     def set_progress_callback(self, callback: Callable[[int, int], None]) -> None:
         """
         Set callback function untuk update progress UI.
@@ -112,89 +147,224 @@ class HunterModule:
         if message:
             logger.info(f"Progress: {current}/{total} - {message}")
 
-    def _apply_hard_filters(
+    async def _hunt_pipeline(
         self,
-        video_data: dict,
-        subscriber_count: int
-    ) -> tuple[bool, dict]:
+        searches: List[Tuple[str, Optional[str]]],
+        target_count: int,
+        target_with_buffer: int,
+        max_videos_per_search: int,
+        published_after: str,
+        published_before: str,
+        rules: RuleSet,
+        checkpoint: Optional[dict] = None
+    ) -> int:
         """
-        Apply hard filter sesuai user requirement.
-
-        UPDATED: Micro-influencer hunting (5k-50k views, max 30k subs)
+        Jalankan hunt sebagai pipeline bertahap (modules.pipeline).
+
+        Stage-nya ada di modules.hunt_stages dan berbagi satu HuntState
+        (parameter run, counter, statistik, early stop). Source search mengirim ID baru setiap halaman ke stage berikutnya;
+        semua stage berjalan bersamaan, dihubungkan antrian terbatas. Rule
+        dievaluasi dari data termurah (modules.rules), jadi video yang
+        sudah gagal tidak memakan quota channel atau CPU Tier 1:
+        1. fetch (I/O): videos.list untuk ID baru (snippet search dipakai
+           ulang, cukup statistik)
+        2. screen (event loop): rule video (views, umur) per batch
+        3. enrich (I/O): channels.list untuk channel video yang lolos
+           screen. Channel yang sudah diminta batch lain tidak diminta ulang
+        4. filter (event loop): rule channel (subscriber) per batch
+        5. validate (CPU, thread pool): Tier 1 + rule teks, hanya kalau
+           rule set punya rule teks
+        6. persist (I/O SQLite, thread): video yang lulus Tier 1 ditampung
+           lalu disimpan per PIPELINE_PERSIST_BATCH video (Video.save_many,
+           sekaligus dicatat sebagai hasil run di run_videos)
+
+        Search: setiap sub-search (query, region) berjalan concurrent.
+        Date range dibagi menjadi slice yang dicari paralel (halaman dalam
+        satu slice berurutan); slice yang jenuh (pagination habis sebelum
+        jatahnya terpenuhi) dibagi dua lagi. Kandidat dibagi rata antar
+        sub-search; yield setiap sub-search dicatat di stats["per_search"],
+        throughput setiap stage di stats["stages"].
+
+        Early stop (SEARCH_EARLY_STOP): halaman search berikutnya baru
+        diminta kalau kandidat yang masih di pipeline diperkirakan tidak
+        cukup untuk target (pass rate perkiraan = SEARCH_BUFFER_SAFETY x
+        target / buffer). Begitu
+        video yang lulus Tier 1 mencapai target_count, search berhenti dan
+        kandidat yang belum diambil detail/channel-nya dilewati
+        (stats["skipped"]), jadi buffer yang tidak terpakai tidak memakan
+        quota. Halaman search diurutkan viewCount dan urutan itu
+        dipertahankan sampai filter.
+
+        Progress dicatat ke checkpoint run (RunCheckpoint) begitu setiap
+        response diterima. Dengan checkpoint dari run yang terputus, slice
+        dilanjutkan dari page token terakhir dan setiap kandidat masuk ke
+        pipeline di stage berikutnya setelah yang tercatat; request yang
+        sudah selesai tidak dikirim ulang.
 
         Args:
-            video_data: Video metadata dari YouTube API.
-            subscriber_count: Channel subscriber count.
+            searches: List (query, region_code). region_code None = Config.
+            target_count: Target jumlah video.
+            target_with_buffer: Maksimal kandidat yang diproses.
+            max_videos_per_search: Maksimal video per halaman search.
+            published_after: Batas awal upload (ISO 8601).
+            published_before: Batas akhir upload (ISO 8601).
+            rules: Rule filter run.
+            checkpoint: Hasil RunCheckpoint.load() untuk resume (opsional).
 
         Returns:
-            Tuple (passed_all, filter_results).
-        """
-        views = video_data.get("views", 0)
-        upload_date = video_data.get("upload_date", "")
+            Jumlah video yang lulus Tier 1.
 
-        # Calculate days ago
-        days_ago = self.youtube_api.calculate_days_ago(upload_date)
+        Raises:
+            QuotaExceededException: Jika quota habis.
+            YouTubeAPIError: Jika search gagal.
+        """
+        state = HuntState(
+            self.run_id, searches, target_count, target_with_buffer, max_videos_per_search,
+            published_after, published_before, rules, self.stats,
+            progress=self._update_progress, checkpoint=checkpoint
+        )
+        io_workers = max(1, Config.YOUTUBE_MAX_CONCURRENCY * len(self.youtube_api.key_pool))
+        source = SearchSource(state, self.youtube_api)
+        enrich = EnrichStage(state, self.youtube_api)
+        persist = PersistStage(state)
+
+        # Antrian stage I/O sebesar jumlah request paralel: kalau stage
+        # hilir tertinggal, search/fetch ikut menunggu (backpressure)
+        pipeline = Pipeline([
+            Stage("fetch", FetchStage(state, self.youtube_api).handle, workers=io_workers, queue_size=io_workers),
+            Stage("screen", ScreenStage(state).handle, queue_size=io_workers),
+            Stage("enrich", enrich.handle, workers=io_workers, queue_size=io_workers),
+            Stage("filter", ChannelFilterStage(state).handle, queue_size=Config.PIPELINE_QUEUE_SIZE),
+            Stage(
+                "validate", ValidateStage(state, get_validator()).handle,
+                workers=Config.PIPELINE_VALIDATE_WORKERS,
+                queue_size=Config.PIPELINE_QUEUE_SIZE, blocking=True
+            ),
+            Stage("persist", persist.handle, queue_size=Config.PIPELINE_QUEUE_SIZE),
+        ], name="hunt")
 
-        # UPDATED: Filter 1 - Views range 5000 - 50000
-        passed_min_views = views >= MIN_VIEWS      # 5000 views minimum
-        passed_max_views = views <= MAX_VIEWS      # 50000 views maximum
+        try:
+            await pipeline.run(source.run)
+        finally:
+            await state.drain()
+            enrich.close()
+            self.stats["stages"] = pipeline.stats()
+            pipeline.log_stats()
+            # Sisa buffer tetap disimpan walaupun hunt berhenti karena error
+            await persist.close()
 
-        # UPDATED: Filter 2 - Upload age 0-21 days
-        passed_upload_age = days_ago <= MAX_DAYS_AGO
+        if self.stats["failed_ids"]:
+            logger.warning(f"{len(self.stats['failed_ids'])} video dilewati karena request gagal")
 
-        # UPDATED: Filter 3 - Max subscriber 30000 (micro-influencer)
-        passed_max_subs = subscriber_count <= MAX_SUBSCRIBER
+        return state.tier1_passed
 
-        # Semua filter harus lulus
-        passed_all = (
-            passed_min_views and
-            passed_max_views and
-            passed_upload_age and
-            passed_max_subs
-        )
+    def plan_hunt(self, target_count: int, buffer_factor: float = None, searches: int = 1) -> dict:
+        """
+        Estimasi quota dan waktu hunt sebelum dijalankan.
 
-        filter_results = {
-            "passed_min_views": passed_min_views,
-            "passed_max_views": passed_max_views,
-            "passed_upload_age": passed_upload_age,
-            "passed_max_subs": passed_max_subs,
-            "passed_all": passed_all,
-            "days_ago": days_ago,
-        }
+        Args:
+            target_count: Target jumlah video.
+            buffer_factor: Kelipatan kandidat yang difetch. Default dari Config.
+            searches: Jumlah sub-search (batch hunt).
 
-        return passed_all, filter_results
+        Returns:
+            Dict rencana dari HuntPlanner.plan().
+        """
+        return self.planner.plan(target_count, buffer_factor, searches)
 
     def scrape_videos(
         self,
         query: str,
         target_count: int = None,
-        max_videos_per_search: int = 50
+        max_videos_per_search: int = 50,
+        buffer_factor: float = None,
+        allow_scale_down: bool = True,
+        rules: List[dict] = None
     ) -> dict:
         """
         Scraping video dari YouTube dengan hard filter PRD.
 
+        Sebelum mulai, biaya quota hunt diestimasi. Kalau sisa quota hari
+        ini tidak cukup, target diperkecil (allow_scale_down) atau hunt ditolak.
+
         Args:
             query: Kata kunci pencarian.
             target_count: Target jumlah video (default dari config).
             max_videos_per_search: Maksimal video per search (default 50).
+            buffer_factor: Kelipatan kandidat yang difetch. Default dipelajari
+                dari pass rate run sebelumnya (HuntPlanner.learned_buffer_factor).
+            allow_scale_down: Perkecil target kalau quota tidak cukup.
+            rules: Rule filter run (list dict, lihat modules.rules).
+                Default DEFAULT_RULES.
 
         Returns:
             Dict dengan statistik scraping hasil.
 
         Raises:
             ValueError: Jika parameter tidak valid.
+            QuotaExceededException: Jika sisa quota tidak cukup untuk hunt.
             YouTubeAPIError: Jika scraping gagal.
         """
+        return self.scrape_batch(
+            [query],
+            target_count=target_count,
+            max_videos_per_search=max_videos_per_search,
+            buffer_factor=buffer_factor,
+            allow_scale_down=allow_scale_down,
+            rules=rules
+        )
+
+    def scrape_batch(
+        self,
+        queries: List[str],
+        regions: List[str] = None,
+        target_count: int = None,
+        max_videos_per_search: int = 50,
+        buffer_factor: float = None,
+        allow_scale_down: bool = True,
+        rules: List[dict] = None
+    ) -> dict:
+        """
+        Batch hunt: banyak query x region dalam satu run.
+
+        Semua kombinasi (query, region) dicari concurrent lewat satu client
+        (limiter dan key pool yang sama). Video dan channel yang muncul di
+        beberapa sub-search hanya diambil detailnya sekali, jadi overlap
+        tidak memakan quota dua kali. Target dan buffer berlaku untuk
+        seluruh batch dan dibagi rata antar sub-search.
+
+        Args:
+            queries: List kata kunci pencarian.
+            regions: List region code. Default [Config.REGION_CODE].
+            target_count: Target jumlah video (default dari config).
+            max_videos_per_search: Maksimal video per halaman search (default 50).
+            buffer_factor: Kelipatan kandidat yang difetch. Default dipelajari
+                dari pass rate run sebelumnya (HuntPlanner.learned_buffer_factor).
+            allow_scale_down: Perkecil target kalau quota tidak cukup.
+            rules: Rule filter run (list dict, lihat modules.rules).
+                Default DEFAULT_RULES. Rule umur (days_ago) juga membatasi
+                date range search.
+
+        Returns:
+            Dict statistik scraping; stats["per_search"] berisi yield
+            setiap sub-search (found, new, duplicates, scraped, tier1_passed,
+            slices), stats["stages"] berisi throughput setiap stage pipeline,
+            stats["rules"] jumlah video yang lulus setiap rule.
+
+        Raises:
+            ValueError: Jika parameter atau rule tidak valid.
+            QuotaExceededException: Jika sisa quota tidak cukup untuk hunt.
+            YouTubeAPIError: Jika scraping gagal.
+        """
+        queries = list(dict.fromkeys(q.strip() for q in queries if q and q.strip()))
+        if not queries:
+            raise ValueError("queries tidak boleh kosong")
+
+        searches = [(query, region) for query in queries for region in dict.fromkeys(regions or [None])]
+        rule_set = RuleSet.from_list(DEFAULT_RULES if rules is None else rules)
+
         # UPDATED: Reset statistics dengan filter baru
-        self.stats = {
-            "total_scraped": 0,
-            "passed_min_views": 0,
-            "passed_max_views": 0,
-            "passed_upload_age": 0,
-            "passed_max_subs": 0,
-            "passed_all": 0,
-            "failed": 0
-        }
+        self.stats = self._empty_stats()
 
         if target_count is None:
             target_count = Config.TARGET_VIDEO_COUNT
@@ -202,211 +372,185 @@ class HunterModule:
         if target_count <= 0:
             raise ValueError("target_count harus lebih dari 0")
 
-        # UPDATED: Hapus semua data lama sebelum scraping mulai
-        from hunterbot.database.models import Video
-        deleted_count = Video.delete_all()
-        if deleted_count > 0:
-            logger.info(f"Database dibersihkan: {deleted_count} video lama dihapus")
-        else:
-            logger.info("Database kosong, siap untuk scraping baru")
+        if buffer_factor is None:
+            buffer_factor = self.planner.learned_buffer_factor(searches)
+        self.stats["buffer_factor"] = buffer_factor
+
+        # Pre-flight: cek quota sebelum menyentuh database atau API
+        plan = self.plan_hunt(target_count, buffer_factor, len(searches))
+        if not plan["feasible"]:
+            if allow_scale_down and plan["max_target_count"] > 0:
+                logger.warning(
+                    f"Quota tidak cukup untuk target {target_count} "
+                    f"({plan['units']} unit, sisa {plan['remaining_units']}), "
+                    f"target diperkecil ke {plan['max_target_count']}"
+                )
+                target_count = plan["max_target_count"]
+            else:
+                logger.error(
+                    f"Hunt ditolak: butuh {plan['units']} unit, sisa {plan['remaining_units']}"
+                )
+                raise QuotaExceededException(
+                    f"Quota tidak cukup: butuh {plan['units']} unit, sisa {plan['remaining_units']}"
+                )
 
-        logger.info(f"Memulai scraping dengan filter: query='{query}', target={target_count}")
-        logger.info(f"Filter: Views {MIN_VIEWS}-{MAX_VIEWS}, Subs max {MAX_SUBSCRIBER}, {MIN_DAYS_AGO}-{MAX_DAYS_AGO} days, Tier1 threshold {TIER1_THRESHOLD}")
+        # ID run untuk ledger quota dan checkpoint
+        self.run_id = uuid.uuid4().hex[:12]
+        params = {
+            "searches": [list(search) for search in searches],
+            "target_count": target_count,
+            "target_with_buffer": math.ceil(target_count * buffer_factor),
+            "max_videos_per_search": max_videos_per_search,
+            "rules": rule_set.to_list(),
+        }
 
-        # Hitung date range untuk API filter
-        published_after, published_before = calculate_date_range(MAX_DAYS_AGO)
-        logger.info(f"Date range: {published_after} s/d {published_before}")
+        # Data lama tidak dihapus: video di-upsert lintas run dan hasil run
+        # ini dicatat di run_videos (baca lewat Video.get_all(run_id=...))
+        logger.info(f"Run {self.run_id}: {Video.count()} video sudah ada di database")
 
-        video_ids_seen = set()
+        # Hitung date range untuk API filter (disimpan: page token search
+        # hanya berlaku untuk params yang sama persis)
+        max_days_ago = rule_set.upper_bound("days_ago")
+        params["published_after"], params["published_before"] = (
+            calculate_date_range(math.ceil(max_days_ago)) if max_days_ago is not None
+            else calculate_date_range()
+        )
+        Run.create(self.run_id, params)
 
-        try:
-            # Search batch 1 dengan date range filter
-            self._update_progress(0, target_count, "Mencari video...")
+        return self._execute_run(params)
 
-            video_ids, next_page = self.youtube_api.search_videos(
-                query=query,
-                max_results=min(max_videos_per_search, target_count),
-                published_after=published_after,
-                published_before=published_before
-            )
+    def resume_run(self, run_id: str = None) -> dict:
+        """
+        Lanjutkan hunt yang terputus (quota habis, error, app crash).
 
-            video_ids_seen.update(video_ids)
+        Parameter hunt (query, region, target, date range) diambil dari
+        run aslinya. Halaman search, detail video, data channel, dan hasil
+        filter yang sudah tercatat di checkpoint tidak diminta/diproses
+        ulang; database tidak dibersihkan.
 
-            # Pagination kalau butuh lebih banyak video (fetch lebih banyak karena akan difilter)
-            page_count = 1
-            target_with_buffer = target_count * 3  # Fetch 3× lebih banyak untuk buffer filter
+        Args:
+            run_id: ID run. Default run terakhir yang belum selesai.
 
-            while len(video_ids_seen) < target_with_buffer and next_page:
-                page_count += 1
-                logger.info(f"Fetch halaman {page_count}")
+        Returns:
+            Dict statistik scraping (format scrape_batch), termasuk
+            progress dari sesi sebelumnya; stats["resumed"] berisi jumlah
+            yang dipulihkan dari checkpoint.
 
-                video_ids, next_page = self.youtube_api.search_videos(
-                    query=query,
-                    max_results=min(max_videos_per_search, target_with_buffer - len(video_ids_seen)),
-                    page_token=next_page,
-                    published_after=published_after,
-                    published_before=published_before
-                )
+        Raises:
+            ValueError: Jika run tidak ditemukan atau sudah selesai.
+            QuotaExceededException: Jika quota habis.
+            YouTubeAPIError: Jika scraping gagal.
+        """
+        run = Run.get(run_id) if run_id else Run.latest_resumable()
+        if run is None:
+            raise ValueError(f"Run tidak ditemukan: {run_id}" if run_id else "Tidak ada run yang bisa dilanjutkan")
+        if run["status"] not in Run.RESUMABLE:
+            raise ValueError(f"Run {run['run_id']} sudah selesai ({run['status']})")
 
-                video_ids_seen.update(video_ids)
+        self.run_id = run["run_id"]
+        self.stats = self._empty_stats()
+        logger.info(f"Melanjutkan run {self.run_id} (status {run['status']})")
 
-                if not video_ids:
-                    logger.warning("Tidak ada video tambahan di halaman ini")
-                    break
+        return self._execute_run(run["params"], RunCheckpoint.load(self.run_id))
 
-            # Ambil detail video
-            unique_video_ids = list(video_ids_seen)[:target_with_buffer]
-            logger.info(f"Total {len(unique_video_ids)} video akan diproses")
-
-            self._update_progress(0, len(unique_video_ids), "Ambil detail video...")
-
-            video_details = self.youtube_api.get_video_details(unique_video_ids)
-            self.stats["total_scraped"] = len(video_details)
-
-            # Fetch channel details untuk subscriber count
-            self._update_progress(0, len(video_details), "Ambil channel details...")
-
-            unique_channel_ids = list(set([v["channel_id"] for v in video_details]))
-            channel_details = self.youtube_api.get_channel_details(unique_channel_ids)
-
-            # Terapkan filter dan simpan yang lulus
-            self._update_progress(0, len(video_details), "Apply filter & simpan...")
-
-            # Ambil validator Tier 1
-            validator = get_validator()
-
-            saved_count = 0
-            tier1_passed = 0
-
-            for idx, video_data in enumerate(video_details):
-                try:
-                    channel_id = video_data["channel_id"]
-                    channel_data = channel_details.get(channel_id, {})
-                    subscriber_count = channel_data.get("subscriber_count", 0)
-                    channel_location = channel_data.get("location", "")
-                    views = video_data.get("views", 0)
-                    video_id = video_data.get("video_id", "")
-
-                    # UPDATED: Log progress per video
-                    logger.info(f"[{idx+1}/{len(video_details)}] Processing: {video_id} | {views:,} views | {subscriber_count:,} subs")
-
-                    # Terapkan hard filter
-                    passed_hard, filter_results = self._apply_hard_filters(video_data, subscriber_count)
-
-                    # UPDATED: Update statistics dengan filter baru
-                    if filter_results["passed_min_views"]:
-                        self.stats["passed_min_views"] += 1
-                    if filter_results["passed_max_views"]:
-                        self.stats["passed_max_views"] += 1
-                    if filter_results["passed_upload_age"]:
-                        self.stats["passed_upload_age"] += 1
-                    if filter_results["passed_max_subs"]:
-                        self.stats["passed_max_subs"] += 1
-
-                    if passed_hard:
-                        self.stats["passed_all"] += 1
-
-                        # UPDATED: Log lulus hard filter
-                        logger.info(f"[{idx+1}/{len(video_details)}] ✓ Hard filter PASS → Tier1 validating...")
-
-                        # Terapkan validasi Tier 1 (hanya yang lulus hard filter)
-                        title = video_data.get("title", "")
-                        description = video_data.get("description", "")
-                        tier1_result = validator.validate_tier1(title, description, channel_location)
-
-                        # Simpan hanya yang lulus Tier 1
-                        if tier1_result["passed"]:
-                            tier1_passed += 1
-
-                            # UPDATED: Log lulus Tier 1
-                            logger.info(f"[{idx+1}/{len(video_details)}] ✓✓ Tier1 PASS (score: {tier1_result['score']:.2f}) → SAVING...")
-
-                            video = Video(
-                                video_id=video_data["video_id"],
-                                title=video_data["title"],
-                                channel_id=video_data["channel_id"],
-                                channel_title=video_data["channel_title"],
-                                subscriber_count=subscriber_count,
-                                upload_date=video_data["upload_date"],
-                                upload_days_ago=filter_results["days_ago"],
-                                views=video_data["views"],
-                                likes=video_data.get("likes", 0),
-                                thumbnail_url=video_data["thumbnail_url"],
-                                description=description,
-                                state=Video.STATE_SCRAPED,
-                                # UPDATED: Hapus field lama passed_max_views_vs_subs
-                                passed_min_views=True,
-                                passed_max_views=True,
-                                passed_upload_age=True,
-                                # Tier 1 fields
-                                tier1_validated=True,
-                                tier1_score=tier1_result["score"],
-                                tier1_language_score=tier1_result["scores"]["language"],
-                                tier1_currency_score=tier1_result["scores"]["currency"],
-                                tier1_cultural_score=tier1_result["scores"]["cultural"],
-                                tier1_region_score=tier1_result["scores"]["region"],
-                                tier1_has_exclude=tier1_result["has_exclude_patterns"],
-                                channel_location=channel_location
-                            )
-
-                            if video.save():
-                                saved_count += 1
-                                logger.info(f"[{idx+1}/{len(video_details)}] ✓✓ SAVED: {video_data['video_id']}")
-                            else:
-                                logger.warning(f"[{idx+1}/{len(video_details)}] ✗ FAILED TO SAVE: {video_data['video_id']}")
-                        else:
-                            self.stats["failed"] += 1
-                            logger.info(f"[{idx+1}/{len(video_details)}] ✗ Tier1 FAIL (score: {tier1_result['score']:.2f})")
-                    else:
-                        self.stats["failed"] += 1
-                        # UPDATED: Log gagal hard filter dengan alasan
-                        fail_reason = []
-                        if not filter_results["passed_min_views"]:
-                            fail_reason.append(f"views={views}<{MIN_VIEWS}")
-                        if not filter_results["passed_max_views"]:
-                            fail_reason.append(f"views={views}>{MAX_VIEWS}")
-                        if not filter_results["passed_upload_age"]:
-                            fail_reason.append(f"age={filter_results['days_ago']}d>{MAX_DAYS_AGO}")
-                        if not filter_results["passed_max_subs"]:
-                            fail_reason.append(f"subs={subscriber_count}>{MAX_SUBSCRIBER}")
-                        reason_str = ", ".join(fail_reason)
-                        logger.info(f"[{idx+1}/{len(video_details)}] ✗ Hard filter FAIL: {reason_str}")
-
-                    self._update_progress(idx + 1, len(video_details))
-
-                    # Rate limiting
-                    if idx < len(video_details) - 1:
-                        self.youtube_api.rate_limit()
-
-                except Exception as e:
-                    logger.error(f"Gagal memproses video {video_data['video_id']}: {e}")
-                    self.stats["failed"] += 1
-                    continue
-
-        except QuotaExceededException:
+    def _execute_run(self, params: dict, checkpoint: Optional[dict] = None) -> dict:
+        """
+        Jalankan pipeline hunt untuk satu run dan catat statusnya.
+
+        Run yang gagal ditandai interrupted (checkpoint disimpan untuk
+        resume_run); run yang selesai ditandai completed dan checkpoint-nya
+        dihapus.
+
+        Args:
+            params: Parameter run (format Run.create).
+            checkpoint: Hasil RunCheckpoint.load() untuk resume (opsional).
+
+        Returns:
+            Dict statistik scraping.
+
+        Raises:
+            QuotaExceededException: Jika quota habis.
+            YouTubeAPIError: Jika scraping gagal.
+        """
+        searches = [(query, region) for query, region in params["searches"]]
+        target_count = params["target_count"]
+        published_after = params["published_after"]
+        published_before = params["published_before"]
+        # Run lama (sebelum rule engine) memakai rule default
+        rules = RuleSet.from_list(params.get("rules") or DEFAULT_RULES)
+
+        self.youtube_api.run_id = self.run_id
+        self.stats["run_id"] = self.run_id
+        self.stats["target_count"] = target_count
+
+        search_labels = ", ".join(f"'{query}' ({region or Config.REGION_CODE})" for query, region in searches)
+        logger.info(f"Memulai scraping dengan filter: {search_labels}, target={target_count}")
+        logger.info(f"Rules: {rules.describe()}")
+        logger.info(f"Date range: {published_after} s/d {published_before}")
+
+        try:
+            self._update_progress(0, target_count, "Mencari video...")
+
+            # Search, detail video, detail channel, dan filter/simpan berjalan
+            # sebagai pipeline (async), bukan fase berurutan
+            tier1_passed = asyncio.run(self._hunt_pipeline(
+                searches=searches,
+                target_count=target_count,
+                target_with_buffer=params["target_with_buffer"],
+                max_videos_per_search=params["max_videos_per_search"],
+                published_after=published_after,
+                published_before=published_before,
+                rules=rules,
+                checkpoint=checkpoint
+            ))
+
+        except QuotaExceededException as e:
             logger.error("YouTube API quota habis. Gunakan API key lain besok.")
+            logger.info(f"Progress tersimpan, lanjutkan dengan resume_run('{self.run_id}')")
+            Run.update(self.run_id, Run.STATUS_INTERRUPTED, self.stats, str(e))
             raise
 
         except YouTubeAPIError as e:
             logger.error(f"Scraping gagal: {e}")
+            Run.update(self.run_id, Run.STATUS_INTERRUPTED, self.stats, str(e))
             raise
 
         except Exception as e:
             logger.exception(f"Error tidak terduga saat scraping: {e}")
+            Run.update(self.run_id, Run.STATUS_INTERRUPTED, self.stats, str(e))
             raise
 
+        quota_by_endpoint = QuotaLog.units_for_run(self.run_id)
+        self.stats["quota_units"] = sum(quota_by_endpoint.values())
+        Run.update(self.run_id, Run.STATUS_COMPLETED, self.stats)
+        RunCheckpoint.clear(self.run_id)
+
         # UPDATED: Log statistik dengan filter baru
         logger.info("=" * 50)
         logger.info("SCRAPING SELESAI - STATISTIK")
         logger.info("=" * 50)
         logger.info(f"Total discraping: {self.stats['total_scraped']}")
-        logger.info(f"Lulus min views ({MIN_VIEWS}+): {self.stats['passed_min_views']}")
-        logger.info(f"Lulus max views ({MAX_VIEWS}-): {self.stats['passed_max_views']}")
-        logger.info(f"Lulus upload age (0-{MAX_DAYS_AGO} days): {self.stats['passed_upload_age']}")
-        logger.info(f"Lulus max subs ({MAX_SUBSCRIBER}-): {self.stats['passed_max_subs']}")
+        for rule in rules:
+            logger.info(f"Lulus {rule.name} ({rule.describe()}): {self.stats['rules'][rule.name]}")
         logger.info(f"Lulus SEMUA filter: {self.stats['passed_all']}")
         logger.info(f"Lulus Tier 1: {tier1_passed}")
+        logger.info(f"Tersimpan: {self.stats.get('saved')}")
+        if self.stats["early_stopped"]:
+            logger.info(f"Early stop: {self.stats['skipped']} kandidat tidak diambil detailnya")
         logger.info(f"Gagal/Tidak lulus: {self.stats['failed']}")
+        logger.info(f"Quota terpakai: {self.stats['quota_units']} unit {quota_by_endpoint}")
+        logger.info(f"Response cache: {self.youtube_api.cache_stats()}")
+        logger.info(f"Channel cache: {self.youtube_api.channel_cache_stats()}")
+        logger.info(f"Gagal diambil (request error): {len(self.stats.get('failed_ids', []))} video")
+        logger.info(f"Circuit breaker: {self.youtube_api.circuit_stats()}")
+        logger.info(f"Koneksi HTTP: {self.youtube_api.http_stats()}")
+        if len(searches) > 1:
+            for yield_stats in self.stats["per_search"]:
+                logger.info(
+                    f"Yield '{yield_stats['query']}' ({yield_stats['region_code']}): "
+                    f"{yield_stats['new']} baru, {yield_stats['duplicates']} duplikat, "
+                    f"{yield_stats['tier1_passed']}/{yield_stats['scraped']} lulus Tier 1"
+                )
         logger.info("=" * 50)
 
         return self.stats
@@ -0,0 +1,233 @@
+"""
+Pipeline engine - stage yang dihubungkan antrian terbatas.
+
+Setiap stage punya worker sendiri (jumlahnya bisa beda per stage) dan
+antrian input terbatas: kalau stage hilir tertinggal, stage hulu ikut
+menunggu saat menaruh hasil (backpressure), jadi item yang tertahan di
+memori tetap sedikit. Stage I/O berjalan di event loop (async), stage
+CPU (blocking) dijalankan di thread pool, sehingga kerja CPU dan tunggu
+network saling tumpang tindih.
+
+Setiap stage mencatat jumlah item, waktu kerja, waktu menunggu input
+(kekurangan pasokan) dan waktu tertahan saat menaruh output
+(backpressure), untuk laporan throughput per stage di akhir run.
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from hunterbot.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Penanda akhir aliran item di antrian
+_DONE = object()
+
+
+class Stage:
+    """
+    Satu stage pipeline.
+
+    Handler menerima satu item dan mengembalikan iterable output (boleh
+    kosong) atau None (item dibuang). Handler async dipanggil di event
+    loop; handler blocking (CPU-bound atau I/O sinkron) dijalankan lewat
+    asyncio.to_thread.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        handler: Callable[[Any], Any],
+        workers: int = 1,
+        queue_size: int = 0,
+        blocking: bool = False
+    ):
+        """
+        Inisialisasi stage.
+
+        Args:
+            name: Nama stage (untuk log/statistik).
+            handler: Function item -> iterable output atau None.
+            workers: Jumlah worker paralel.
+            queue_size: Kapasitas antrian input. 0 = 2 x workers.
+            blocking: True jika handler sinkron (dijalankan di thread pool).
+        """
+        self.name = name
+        self.handler = handler
+        self.workers = max(1, workers)
+        self.queue_size = queue_size or 2 * self.workers
+        self.blocking = blocking
+
+        self.items_in = 0
+        self.items_out = 0
+        self.busy = 0.0
+        self.starved = 0.0
+        self.blocked = 0.0
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    async def process(self, item: Any) -> Optional[Iterable[Any]]:
+        """Jalankan handler untuk satu item."""
+        if self.blocking:
+            return await asyncio.to_thread(self.handler, item)
+        return await self.handler(item)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Statistik stage.
+
+        Returns:
+            Dict name, workers, items_in, items_out, wall, busy, starved,
+            blocked (detik), throughput (item masuk per detik), utilization
+            (busy / (wall x workers)).
+        """
+        wall = (
+            (self.finished_at or time.perf_counter()) - self.started_at
+            if self.started_at is not None else 0.0
+        )
+        return {
+            "name": self.name,
+            "workers": self.workers,
+            "items_in": self.items_in,
+            "items_out": self.items_out,
+            "wall": round(wall, 3),
+            "busy": round(self.busy, 3),
+            "starved": round(self.starved, 3),
+            "blocked": round(self.blocked, 3),
+            "throughput": round(self.items_in / wall, 2) if wall > 0 else 0.0,
+            "utilization": round(self.busy / (wall * self.workers), 3) if wall > 0 else 0.0,
+        }
+
+
+class Pipeline:
+    """
+    Rangkaian stage: source -> stage 1 -> stage 2 -> ... -> stage terakhir.
+
+    Source adalah coroutine yang menerima function emit(item); setiap
+    item yang di-emit masuk ke antrian stage pertama. Output stage
+    terakhir dibuang (stage terakhir biasanya menyimpan hasil).
+    Error di stage manapun membatalkan seluruh pipeline lalu di-raise.
+    """
+
+    def __init__(self, stages: List[Stage], name: str = "pipeline"):
+        """
+        Inisialisasi pipeline.
+
+        Args:
+            stages: Stage berurutan (minimal satu).
+            name: Nama pipeline (untuk log).
+
+        Raises:
+            ValueError: Jika stages kosong.
+        """
+        if not stages:
+            raise ValueError("Pipeline butuh minimal satu stage")
+
+        self.stages = stages
+        self.name = name
+        self.emitted = 0
+        self.source_blocked = 0.0
+
+    async def run(self, source: Callable[[Callable[[Any], Awaitable[None]]], Awaitable[None]]) -> None:
+        """
+        Jalankan pipeline sampai source selesai dan semua item diproses.
+
+        Args:
+            source: Coroutine function source(emit).
+
+        Raises:
+            Exception: Error pertama dari source atau stage manapun.
+        """
+        queues = [asyncio.Queue(maxsize=stage.queue_size) for stage in self.stages]
+        first = queues[0]
+
+        async def emit(item: Any) -> None:
+            waited = time.perf_counter()
+            await first.put(item)
+            self.source_blocked += time.perf_counter() - waited
+            self.emitted += 1
+
+        async def run_source() -> None:
+            await source(emit)
+            for _ in range(self.stages[0].workers):
+                await first.put(_DONE)
+
+        async def run_stage(index: int) -> None:
+            stage = self.stages[index]
+            inbox = queues[index]
+            outbox = queues[index + 1] if index + 1 < len(queues) else None
+            workers = [
+                asyncio.ensure_future(self._worker(stage, inbox, outbox))
+                for _ in range(stage.workers)
+            ]
+            try:
+                await asyncio.gather(*workers)
+            finally:
+                # Worker lain ikut dihentikan kalau satu worker error
+                for worker in workers:
+                    worker.cancel()
+                stage.finished_at = time.perf_counter()
+            if outbox is not None:
+                for _ in range(self.stages[index + 1].workers):
+                    await outbox.put(_DONE)
+
+        tasks = [asyncio.ensure_future(run_source())]
+        tasks.extend(asyncio.ensure_future(run_stage(i)) for i in range(len(self.stages)))
+
+        try:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            for task in done:
+                if task.exception() is not None:
+                    raise task.exception()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _worker(self, stage: Stage, inbox: asyncio.Queue, outbox: Optional[asyncio.Queue]) -> None:
+        """Ambil item dari inbox, proses, taruh output ke outbox."""
+        while True:
+            waited = time.perf_counter()
+            item = await inbox.get()
+            now = time.perf_counter()
+            if item is _DONE:
+                return
+
+            if stage.started_at is None:
+                stage.started_at = waited
+            else:
+                stage.starved += now - waited
+            stage.items_in += 1
+
+            outputs = await stage.process(item)
+            stage.busy += time.perf_counter() - now
+
+            for output in outputs or ():
+                stage.items_out += 1
+                if outbox is None:
+                    continue
+                waited = time.perf_counter()
+                await outbox.put(output)
+                stage.blocked += time.perf_counter() - waited
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """
+        Statistik semua stage, sesuai urutan.
+
+        Returns:
+            List dict dari Stage.stats().
+        """
+        return [stage.stats() for stage in self.stages]
+
+    def log_stats(self) -> None:
+        """Log throughput per stage."""
+        logger.info(f"Pipeline {self.name}: {self.emitted} item dari source, tertahan {self.source_blocked:.2f}s")
+        for stats in self.stats():
+            logger.info(
+                f"  Stage {stats['name']} (x{stats['workers']}): "
+                f"{stats['items_in']} masuk, {stats['items_out']} keluar, "
+                f"{stats['throughput']} item/s, kerja {stats['busy']}s, "
+                f"tunggu input {stats['starved']}s, tertahan {stats['blocked']}s, "
+                f"utilisasi {stats['utilization']:.0%}"
+            )
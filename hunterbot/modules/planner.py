@@ -0,0 +1,304 @@
+"""
+Hunt Planner - Estimasi biaya quota dan waktu sebelum scraping.
+
+Module ini menghitung berapa quota unit dan wall time yang dibutuhkan
+scrape_videos untuk target_count + buffer_factor tertentu, lalu
+membandingkannya dengan sisa quota hari ini dari ledger. Buffer factor
+bisa dipelajari dari pass rate setiap query di run-run sebelumnya.
+"""
+
+import math
+from typing import Dict, Any, List, Optional, Tuple
+
+from hunterbot.api.youtube_api import YouTubeAPI
+from hunterbot.config import Config
+from hunterbot.database.models import Run
+from hunterbot.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class HuntPlanner:
+    """
+    Planner pre-flight untuk hunt.
+
+    Estimasi memakai skenario terburuk: setiap kandidat video berasal
+    dari channel berbeda, dan setiap halaman search berisi 50 video.
+    """
+
+    def __init__(self, youtube_api: YouTubeAPI):
+        """
+        Inisialisasi planner.
+
+        Args:
+            youtube_api: Client yang akan dipakai hunt (sumber sisa quota).
+        """
+        self.youtube_api = youtube_api
+
+    def estimate_cost(
+        self,
+        target_count: int,
+        buffer_factor: float = None,
+        searches: int = 1
+    ) -> Dict[str, Any]:
+        """
+        Hitung kebutuhan request, unit, dan waktu untuk satu hunt.
+
+        Args:
+            target_count: Target jumlah video.
+            buffer_factor: Kelipatan kandidat yang difetch. Default dari Config.
+            searches: Jumlah sub-search (batch hunt query x region).
+                Kandidat dibagi rata dan setiap sub-search minimal satu halaman.
+
+        Returns:
+            Dict berisi candidates, search_pages, video_batches,
+            channel_batches, requests, units, est_seconds.
+        """
+        if buffer_factor is None:
+            buffer_factor = Config.SEARCH_BUFFER_FACTOR
+
+        batch_size = YouTubeAPI.BATCH_SIZE
+        candidates = math.ceil(target_count * buffer_factor)
+
+        # Kandidat setiap sub-search dibagi ke slice date range (lihat
+        # HunterModule._hunt_pipeline); setiap slice punya halaman sendiri
+        searches = max(1, searches)
+        per_search = math.ceil(candidates / searches)
+        slices = max(1, math.ceil(per_search / Config.SEARCH_SLICE_CAPACITY))
+        pages_per_search = slices * math.ceil(math.ceil(per_search / slices) / Config.MAX_RESULTS_PER_REQUEST)
+        search_pages = searches * pages_per_search
+        video_batches = math.ceil(candidates / batch_size)
+        channel_batches = math.ceil(candidates / batch_size)
+        requests = search_pages + video_batches + channel_batches
+
+        costs = Config.YOUTUBE_QUOTA_COSTS
+        units = (
+            search_pages * costs.get("search", 100) +
+            video_batches * costs.get("videos", 1) +
+            channel_batches * costs.get("channels", 1)
+        )
+
+        # Search berurutan (page token) per sub-search, sub-search dan
+        # detail berjalan concurrent
+        latency = Config.YOUTUBE_EST_REQUEST_LATENCY
+        concurrency = max(1, Config.YOUTUBE_MAX_CONCURRENCY)
+        latency_bound = (
+            math.ceil(pages_per_search / slices) * math.ceil(searches * slices / concurrency) * latency +
+            math.ceil(video_batches / concurrency) * latency +
+            math.ceil(channel_batches / concurrency) * latency
+        )
+        rate_bound = requests / Config.YOUTUBE_REQUESTS_PER_SECOND
+        est_seconds = max(latency_bound, rate_bound)
+
+        return {
+            "target_count": target_count,
+            "buffer_factor": buffer_factor,
+            "searches": searches,
+            "candidates": candidates,
+            "search_pages": search_pages,
+            "video_batches": video_batches,
+            "channel_batches": channel_batches,
+            "requests": requests,
+            "units": units,
+            "est_seconds": round(est_seconds, 1),
+        }
+
+    def plan(
+        self,
+        target_count: int,
+        buffer_factor: float = None,
+        searches: int = 1
+    ) -> Dict[str, Any]:
+        """
+        Buat rencana hunt dan cek apakah cukup quota hari ini.
+
+        Args:
+            target_count: Target jumlah video.
+            buffer_factor: Kelipatan kandidat yang difetch. Default dari Config.
+            searches: Jumlah sub-search (batch hunt).
+
+        Returns:
+            Dict estimate_cost ditambah remaining_units, feasible, dan
+            max_target_count (target terbesar yang masih muat di sisa quota).
+        """
+        plan = self.estimate_cost(target_count, buffer_factor, searches)
+        remaining_units = self.youtube_api.remaining_quota()
+
+        plan["remaining_units"] = remaining_units
+        plan["feasible"] = plan["units"] <= remaining_units
+        plan["max_target_count"] = (
+            target_count if plan["feasible"]
+            else self._max_affordable_target(
+                target_count, plan["buffer_factor"], remaining_units, plan["searches"]
+            )
+        )
+
+        logger.info(
+            f"Rencana hunt: target={target_count}, {plan['requests']} request, "
+            f"{plan['units']} unit, ~{plan['est_seconds']}s, sisa quota {remaining_units}"
+        )
+
+        return plan
+
+    def learned_buffer_factor(self, searches: List[Tuple[str, Optional[str]]]) -> float:
+        """
+        Buffer factor dari pass rate Tier 1 run-run sebelumnya.
+
+        Args:
+            searches: List (query, region_code). region_code None = Config.
+
+        Returns:
+            Buffer factor (SEARCH_BUFFER_SAFETY / pass_rate()), dibatasi
+            SEARCH_BUFFER_MIN..SEARCH_BUFFER_MAX. SEARCH_BUFFER_FACTOR jika
+            SEARCH_BUFFER_ADAPTIVE mati.
+        """
+        if not Config.SEARCH_BUFFER_ADAPTIVE or not searches:
+            return Config.SEARCH_BUFFER_FACTOR
+
+        rate, samples = self.pass_rate(searches)
+        factor = self._buffer_for_rate(rate)
+        logger.info(
+            f"Buffer factor dari histori: {factor} (pass rate ~{rate:.1%}, {samples} kandidat)"
+        )
+        return factor
+
+    def pass_rate(
+        self,
+        searches: List[Tuple[str, Optional[str]]],
+        history: Dict[Tuple[str, str], Tuple[int, int]] = None
+    ) -> Tuple[float, int]:
+        """
+        Estimasi pass rate Tier 1 untuk sekumpulan sub-search.
+
+        Pass rate setiap (query, region) dihitung dari statistik per
+        sub-search run yang selesai, ditarik ke arah pass rate default
+        (SEARCH_BUFFER_SAFETY / SEARCH_BUFFER_FACTOR) dengan bobot
+        SEARCH_BUFFER_PRIOR_WEIGHT kandidat, jadi query tanpa histori
+        memakai pass rate default dan histori kecil hanya menggeser sedikit.
+        Kandidat dibagi rata antar sub-search, jadi pass rate batch adalah
+        rata-rata pass rate sub-search.
+
+        Args:
+            searches: List (query, region_code).
+            history: Hasil pass_history() (opsional, untuk banyak estimasi
+                sekaligus).
+
+        Returns:
+            Tuple (pass rate, jumlah kandidat histori). Pass rate default
+            jika SEARCH_BUFFER_ADAPTIVE mati.
+        """
+        prior_rate = min(1.0, Config.SEARCH_BUFFER_SAFETY / Config.SEARCH_BUFFER_FACTOR)
+        if not Config.SEARCH_BUFFER_ADAPTIVE or not searches:
+            return prior_rate, 0
+
+        if history is None:
+            history = self.pass_history()
+        weight = Config.SEARCH_BUFFER_PRIOR_WEIGHT
+
+        rates = []
+        samples = 0
+        for query, region_code in searches:
+            scraped, passed = history.get(self._search_key(query, region_code), (0, 0))
+            samples += scraped
+            rates.append((passed + prior_rate * weight) / (scraped + weight))
+        return sum(rates) / len(rates), samples
+
+    def expected_yield(
+        self,
+        searches: List[Tuple[str, Optional[str]]],
+        target_count: int,
+        history: Dict[Tuple[str, str], Tuple[int, int]] = None
+    ) -> Dict[str, Any]:
+        """
+        Estimasi hasil hunt per unit quota (prioritas scheduler).
+
+        Biaya dihitung estimate_cost dengan buffer hasil belajar; video
+        yang diharapkan adalah kandidat x pass rate, maksimal target. Query
+        dengan pass rate rendah butuh lebih banyak halaman search (100
+        unit) per video, jadi yield per unit-nya lebih kecil.
+
+        Args:
+            searches: List (query, region_code).
+            target_count: Target jumlah video.
+            history: Hasil pass_history() (opsional).
+
+        Returns:
+            Dict pass_rate, buffer_factor, units, expected_videos,
+            yield_per_unit.
+        """
+        rate, _ = self.pass_rate(searches, history)
+        buffer_factor = (
+            self._buffer_for_rate(rate) if Config.SEARCH_BUFFER_ADAPTIVE
+            else Config.SEARCH_BUFFER_FACTOR
+        )
+        cost = self.estimate_cost(target_count, buffer_factor, len(searches))
+        expected_videos = min(target_count, cost["candidates"] * rate)
+
+        return {
+            "pass_rate": round(rate, 4),
+            "buffer_factor": buffer_factor,
+            "units": cost["units"],
+            "expected_videos": round(expected_videos, 1),
+            "yield_per_unit": expected_videos / cost["units"] if cost["units"] else 0.0,
+        }
+
+    @staticmethod
+    def _buffer_for_rate(rate: float) -> float:
+        """Buffer factor untuk pass rate, dibatasi SEARCH_BUFFER_MIN..MAX."""
+        factor = Config.SEARCH_BUFFER_SAFETY / rate if rate > 0 else Config.SEARCH_BUFFER_MAX
+        return round(min(max(factor, Config.SEARCH_BUFFER_MIN), Config.SEARCH_BUFFER_MAX), 2)
+
+    def pass_history(self) -> Dict[Tuple[str, str], Tuple[int, int]]:
+        """
+        Total kandidat dan yang lulus Tier 1 per (query, region).
+
+        Dihitung dari stats["per_search"] SEARCH_BUFFER_HISTORY_RUNS run
+        terakhir yang selesai.
+
+        Returns:
+            Dict (query lowercase, region) -> (scraped, tier1_passed).
+        """
+        history: Dict[Tuple[str, str], Tuple[int, int]] = {}
+        runs = Run.recent(Run.STATUS_COMPLETED, Config.SEARCH_BUFFER_HISTORY_RUNS)
+        for run in runs:
+            for yield_stats in run["stats"].get("per_search") or []:
+                key = self._search_key(yield_stats["query"], yield_stats["region_code"])
+                scraped, passed = history.get(key, (0, 0))
+                history[key] = (
+                    scraped + yield_stats.get("scraped", 0),
+                    passed + yield_stats.get("tier1_passed", 0)
+                )
+        return history
+
+    @staticmethod
+    def _search_key(query: str, region_code: Optional[str]) -> Tuple[str, str]:
+        """Kunci histori sub-search (query tidak case-sensitive)."""
+        return query.strip().lower(), region_code or Config.REGION_CODE
+
+    def _max_affordable_target(
+        self,
+        target_count: int,
+        buffer_factor: float,
+        remaining_units: int,
+        searches: int = 1
+    ) -> int:
+        """
+        Binary search target terbesar yang biayanya <= sisa quota.
+
+        Args:
+            target_count: Target awal (batas atas).
+            buffer_factor: Kelipatan kandidat.
+            remaining_units: Sisa quota unit.
+            searches: Jumlah sub-search.
+
+        Returns:
+            Target terbesar yang muat (0 jika tidak ada).
+        """
+        low, high = 0, target_count
+        while low < high:
+            mid = (low + high + 1) // 2
+            if self.estimate_cost(mid, buffer_factor, searches)["units"] <= remaining_units:
+                low = mid
+            else:
+                high = mid - 1
+        return low
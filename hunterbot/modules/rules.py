@@ -0,0 +1,239 @@
+"""
+Rule Engine - Filter video deklaratif yang dievaluasi dari data termurah.
+
+Setiap rule membandingkan satu field dengan nilai batas, misalnya
+{"name": "passed_min_views", "field": "views", "op": ">=", "value": 50000}.
+Field menentukan data yang dibutuhkan rule:
+- video: views, likes, days_ago (dari videos.list, sudah diambil)
+- channel: subscribers (butuh channels.list, quota)
+- text: tier1_score (Tier 1, langdetect + regex, CPU)
+
+Hunt mengevaluasi rule per fase sesuai urutan PHASES: video yang gagal
+rule video tidak diambil data channel-nya, dan yang gagal rule channel
+tidak divalidasi Tier 1. Rule set disimpan di params run (to_list) supaya
+run yang dilanjutkan memakai rule yang sama.
+"""
+
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+# Fase evaluasi, urut dari data termurah
+VIDEO = "video"
+CHANNEL = "channel"
+TEXT = "text"
+PHASES = (VIDEO, CHANNEL, TEXT)
+
+# Field yang bisa dipakai rule -> fase (data yang dibutuhkan)
+FIELDS = {
+    "views": VIDEO,
+    "likes": VIDEO,
+    "days_ago": VIDEO,
+    "subscribers": CHANNEL,
+    "tier1_score": TEXT,
+}
+
+OPERATORS = {
+    ">=": np.greater_equal,
+    "<=": np.less_equal,
+    ">": np.greater,
+    "<": np.less,
+    "==": np.equal,
+    "!=": np.not_equal,
+}
+
+
+class FilterRule:
+    """
+    Satu rule filter: field op value.
+    """
+
+    def __init__(self, name: str, field: str, op: str, value: float):
+        """
+        Inisialisasi rule.
+
+        Args:
+            name: Nama rule (juga kunci statistik jumlah video yang lulus).
+            field: Field yang dibandingkan (lihat FIELDS).
+            op: Operator perbandingan (lihat OPERATORS).
+            value: Nilai batas.
+
+        Raises:
+            ValueError: Jika field, operator, atau nilai tidak valid.
+        """
+        if not name:
+            raise ValueError("Nama rule tidak boleh kosong")
+        if field not in FIELDS:
+            raise ValueError(f"Field rule tidak dikenal: {field}")
+        if op not in OPERATORS:
+            raise ValueError(f"Operator rule tidak dikenal: {op}")
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError(f"Nilai rule {name} harus angka: {value!r}")
+
+        self.name = name
+        self.field = field
+        self.op = op
+        self.value = value
+        self.phase = FIELDS[field]
+
+    def evaluate(self, columns: Dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Evaluasi rule untuk satu batch.
+
+        Args:
+            columns: Dict field -> array nilai per video.
+
+        Returns:
+            Mask boolean video yang lulus.
+        """
+        return OPERATORS[self.op](columns[self.field], self.value)
+
+    def describe(self) -> str:
+        """Rule dalam bentuk teks, contoh: views >= 50000."""
+        return f"{self.field} {self.op} {self.value}"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Rule sebagai dict (format from_dict)."""
+        return {"name": self.name, "field": self.field, "op": self.op, "value": self.value}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FilterRule":
+        """
+        Buat rule dari dict {name, field, op, value}.
+
+        Raises:
+            ValueError: Jika ada kunci yang kurang atau nilainya tidak valid.
+        """
+        try:
+            return cls(data["name"], data["field"], data["op"], data["value"])
+        except KeyError as e:
+            raise ValueError(f"Rule tidak lengkap, kunci {e} tidak ada: {data}")
+
+
+class RuleSet:
+    """
+    Kumpulan rule satu run, diurutkan per fase.
+
+    Urutan rule (setelah diurutkan per fase) menentukan bit di bitmask
+    flags: bit i = rule ke-i lulus. Rule yang tidak dievaluasi (video
+    sudah gagal di fase sebelumnya) bernilai 0.
+    """
+
+    def __init__(self, rules: List[FilterRule]):
+        """
+        Inisialisasi rule set.
+
+        Args:
+            rules: List FilterRule.
+
+        Raises:
+            ValueError: Jika ada nama rule yang sama.
+        """
+        names = [rule.name for rule in rules]
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            raise ValueError(f"Nama rule duplikat: {', '.join(duplicates)}")
+
+        # Stabil: urutan dalam satu fase tetap sesuai input
+        self.rules = sorted(rules, key=lambda rule: PHASES.index(rule.phase))
+
+    def __iter__(self):
+        return iter(self.rules)
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def phase_mask(self, *phases: str) -> int:
+        """
+        Bitmask semua rule di fase tertentu.
+
+        Args:
+            phases: Satu atau lebih fase (VIDEO, CHANNEL, TEXT).
+
+        Returns:
+            Bitmask; tanpa argumen = semua rule.
+        """
+        return sum(
+            1 << bit for bit, rule in enumerate(self.rules)
+            if not phases or rule.phase in phases
+        )
+
+    @property
+    def hard_mask(self) -> int:
+        """Bitmask rule yang dievaluasi sebelum Tier 1 (video + channel)."""
+        return self.phase_mask(VIDEO, CHANNEL)
+
+    def has_phase(self, phase: str) -> bool:
+        """True jika ada rule di fase ini."""
+        return any(rule.phase == phase for rule in self.rules)
+
+    def evaluate(self, phase: str, columns: Dict[str, np.ndarray]) -> Dict[str, Any]:
+        """
+        Evaluasi semua rule satu fase untuk satu batch.
+
+        Args:
+            phase: Fase yang dievaluasi.
+            columns: Dict field -> array nilai per video (field fase ini).
+
+        Returns:
+            Dict passed (mask lulus semua rule fase ini), flags (bitmask
+            rule fase ini yang lulus per video, int64) dan masks (nama
+            rule -> mask).
+        """
+        count = len(next(iter(columns.values()))) if columns else 0
+        passed = np.ones(count, dtype=bool)
+        flags = np.zeros(count, dtype=np.int64)
+        masks = {}
+
+        for bit, rule in enumerate(self.rules):
+            if rule.phase != phase:
+                continue
+            mask = np.asarray(rule.evaluate(columns), dtype=bool)
+            masks[rule.name] = mask
+            passed &= mask
+            flags |= mask.astype(np.int64) << bit
+
+        return {"passed": passed, "flags": flags, "masks": masks}
+
+    def passed_rules(self, flags: int) -> Dict[str, bool]:
+        """
+        Hasil setiap rule dari bitmask flags satu video.
+
+        Args:
+            flags: Bitmask rule yang lulus (lihat evaluate).
+
+        Returns:
+            Dict nama rule -> True jika lulus.
+        """
+        return {rule.name: bool(flags >> bit & 1) for bit, rule in enumerate(self.rules)}
+
+    def upper_bound(self, field: str) -> Optional[float]:
+        """
+        Batas atas terketat untuk field (dari rule <= atau <).
+
+        Args:
+            field: Nama field.
+
+        Returns:
+            Nilai batas, atau None jika tidak ada rule batas atas.
+        """
+        bounds = [rule.value for rule in self.rules if rule.field == field and rule.op in ("<=", "<")]
+        return min(bounds) if bounds else None
+
+    def describe(self) -> str:
+        """Semua rule dalam bentuk teks, urut evaluasi."""
+        return ", ".join(f"{rule.name} ({rule.describe()})" for rule in self.rules)
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        """Rule set sebagai list dict (bisa di-serialize ke JSON)."""
+        return [rule.to_dict() for rule in self.rules]
+
+    @classmethod
+    def from_list(cls, rules: List[Dict[str, Any]]) -> "RuleSet":
+        """
+        Buat rule set dari list dict.
+
+        Raises:
+            ValueError: Jika ada rule yang tidak valid.
+        """
+        return cls([FilterRule.from_dict(rule) for rule in rules])
@@ -0,0 +1,562 @@
+"""
+Hunt Scheduler - Hunt berkala dari jadwal cron dengan antrian persisten.
+
+Jadwal (tabel schedules) berisi argumen scrape_batch dan ekspresi cron.
+Setiap jadwal yang jatuh tempo memasukkan satu job ke antrian (tabel
+jobs); worker thread menjalankan job lewat HunterModule. Antrian ada di
+database, jadi job yang belum jalan tetap ada setelah restart.
+
+Urutan job: bobot prioritas x estimasi video lulus per unit quota
+(HuntPlanner.expected_yield). Job diterima berurutan selama estimasi
+biayanya masih muat di sisa quota harian (dikurangi SCHEDULER_RESERVE_UNITS
+dan estimasi job yang sedang berjalan); job bernilai rendah yang tidak
+muat ditandai deferred dan dicek lagi di tick berikutnya, misalnya
+setelah quota di-reset.
+
+Beberapa proses scheduler (misalnya `python -m hunterbot scheduler
+--processes N`, atau host lain dengan database yang sama) boleh melayani
+antrian yang sama. Setiap proses punya worker_id; job diambil lewat
+Job.claim (atomic lintas proses) dengan lease yang diperpanjang thread
+heartbeat selama job berjalan. Proses yang mati berhenti mengirim
+heartbeat, dan job-nya dikembalikan ke antrian setelah lease habis, lalu
+run-nya dilanjutkan dari checkpoint oleh worker lain. Satu hunt tetap
+berjalan di satu proses (pipeline-nya in-process); paralelisme CPU dan
+I/O lintas core didapat dari beberapa job sekaligus.
+"""
+
+import os
+import socket
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from hunterbot.api.rate_limiter import next_quota_reset
+from hunterbot.api.youtube_api import YouTubeAPI, QuotaExceededException
+from hunterbot.config import Config
+from hunterbot.database.models import Job, Run, Schedule
+from hunterbot.modules.hunter import HunterModule
+from hunterbot.modules.planner import HuntPlanner
+from hunterbot.modules.rules import RuleSet
+from hunterbot.utils.cron import CronSchedule
+from hunterbot.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def hunt_params(
+    queries: List[str],
+    regions: List[str] = None,
+    target_count: int = None,
+    rules: List[dict] = None
+) -> Dict[str, Any]:
+    """
+    Validasi dan susun argumen scrape_batch untuk jadwal/job.
+
+    Args:
+        queries: List kata kunci pencarian.
+        regions: List region code. Default Config.REGION_CODE.
+        target_count: Target jumlah video. Default dari Config.
+        rules: Rule filter (list dict). Default DEFAULT_RULES.
+
+    Returns:
+        Dict params (bisa di-serialize ke JSON).
+
+    Raises:
+        ValueError: Jika query kosong, target tidak valid, atau rule tidak valid.
+    """
+    queries = list(dict.fromkeys(q.strip() for q in queries if q and q.strip()))
+    if not queries:
+        raise ValueError("queries tidak boleh kosong")
+    if target_count is not None and target_count <= 0:
+        raise ValueError("target_count harus lebih dari 0")
+    if rules is not None:
+        RuleSet.from_list(rules)
+
+    return {"queries": queries, "regions": regions, "target_count": target_count, "rules": rules}
+
+
+def job_searches(params: Dict[str, Any]) -> List[Tuple[str, Optional[str]]]:
+    """Sub-search (query, region) job, sama seperti scrape_batch."""
+    regions = list(dict.fromkeys(params.get("regions") or [None]))
+    return [(query, region) for query in params["queries"] for region in regions]
+
+
+class HuntScheduler:
+    """
+    Scheduler hunt berkala (background thread + worker pool).
+
+    Setiap tick (SCHEDULER_POLL_INTERVAL detik) scheduler memasukkan job
+    dari jadwal yang jatuh tempo, lalu memilih job yang dijalankan sesuai
+    prioritas dan sisa quota.
+    """
+
+    def __init__(
+        self,
+        workers: int = None,
+        poll_interval: float = None,
+        youtube_api: YouTubeAPI = None
+    ):
+        """
+        Inisialisasi scheduler.
+
+        Args:
+            workers: Jumlah job paralel. Default dari Config.
+            poll_interval: Detik antar tick. Default dari Config.
+            youtube_api: Client untuk sisa quota dan estimasi. Default
+                client baru dari Config.
+        """
+        self.workers = workers or Config.SCHEDULER_WORKERS
+        self.poll_interval = poll_interval if poll_interval is not None else Config.SCHEDULER_POLL_INTERVAL
+        self.youtube_api = youtube_api or YouTubeAPI()
+        self.planner = HuntPlanner(self.youtube_api)
+
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self.lease_seconds = Config.SCHEDULER_LEASE_SECONDS
+        self.heartbeat_interval = min(Config.SCHEDULER_HEARTBEAT_INTERVAL, self.lease_seconds / 3)
+
+        self._lock = threading.Lock()
+        # Hasil job dicatat dan job dilepas dari _running dalam satu langkah
+        # terhadap heartbeat, supaya job yang baru selesai tidak dianggap
+        # kehilangan lease
+        self._lease_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._beat = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._heartbeat_thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # job_id -> HunterModule job yang sedang berjalan di proses ini
+        # (None sampai worker thread membuatnya)
+        self._running: Dict[str, Optional[HunterModule]] = {}
+
+        logger.info(
+            f"Scheduler {self.worker_id} diinisialisasi "
+            f"({self.workers} worker, tick {self.poll_interval}s, lease {self.lease_seconds}s)"
+        )
+
+    def add_schedule(
+        self,
+        name: str,
+        cron: str,
+        queries: List[str],
+        regions: List[str] = None,
+        target_count: int = None,
+        rules: List[dict] = None,
+        priority: float = 1.0
+    ) -> Dict[str, Any]:
+        """
+        Simpan jadwal hunt baru.
+
+        Args:
+            name: Nama unik jadwal.
+            cron: Ekspresi cron (lihat utils.cron).
+            queries: List kata kunci pencarian.
+            regions: List region code (opsional).
+            target_count: Target jumlah video per hunt (opsional).
+            rules: Rule filter (opsional).
+            priority: Bobot prioritas (> 0).
+
+        Returns:
+            Dict jadwal (format Schedule.get).
+
+        Raises:
+            ValueError: Jika parameter tidak valid atau nama sudah dipakai.
+        """
+        if not name or not name.strip():
+            raise ValueError("Nama jadwal tidak boleh kosong")
+        if priority <= 0:
+            raise ValueError("priority harus lebih dari 0")
+
+        schedule = CronSchedule(cron)
+        params = hunt_params(queries, regions, target_count, rules)
+        next_run_at = schedule.next_timestamp(time.time())
+
+        if not Schedule.create(uuid.uuid4().hex[:12], name.strip(), str(schedule), params, next_run_at, priority):
+            raise ValueError(f"Jadwal {name} gagal disimpan (nama sudah dipakai?)")
+
+        logger.info(f"Jadwal {name} ({schedule}) disimpan, pertama {time.ctime(next_run_at)}")
+        return Schedule.get(name.strip())
+
+    def set_enabled(self, name: str, enabled: bool) -> Dict[str, Any]:
+        """
+        Aktifkan/nonaktifkan jadwal.
+
+        Jadwal yang diaktifkan lagi mulai dari jadwal berikutnya setelah
+        sekarang (jadwal yang terlewat tidak dikejar).
+
+        Args:
+            name: Nama atau ID jadwal.
+            enabled: Status baru.
+
+        Returns:
+            Dict jadwal terbaru.
+
+        Raises:
+            ValueError: Jika jadwal tidak ditemukan.
+        """
+        schedule = Schedule.get(name)
+        if schedule is None:
+            raise ValueError(f"Jadwal tidak ditemukan: {name}")
+
+        next_run_at = CronSchedule(schedule["cron"]).next_timestamp(time.time()) if enabled else None
+        Schedule.set_enabled(schedule["schedule_id"], enabled, next_run_at)
+        return Schedule.get(schedule["schedule_id"])
+
+    def remove_schedule(self, name: str) -> bool:
+        """
+        Hapus jadwal dan job-nya yang belum berjalan.
+
+        Args:
+            name: Nama atau ID jadwal.
+
+        Returns:
+            True jika terhapus.
+        """
+        schedule = Schedule.get(name)
+        return schedule is not None and Schedule.delete(schedule["schedule_id"])
+
+    def submit(
+        self,
+        queries: List[str],
+        regions: List[str] = None,
+        target_count: int = None,
+        rules: List[dict] = None,
+        priority: float = 1.0,
+        due_at: float = None
+    ) -> str:
+        """
+        Masukkan job sekali jalan ke antrian.
+
+        Args:
+            queries: List kata kunci pencarian.
+            regions: List region code (opsional).
+            target_count: Target jumlah video (opsional).
+            rules: Rule filter (opsional).
+            priority: Bobot prioritas.
+            due_at: Unix timestamp paling awal job jalan. Default sekarang.
+
+        Returns:
+            ID job.
+
+        Raises:
+            ValueError: Jika parameter tidak valid.
+        """
+        job_id = uuid.uuid4().hex[:12]
+        if not Job.create(job_id, hunt_params(queries, regions, target_count, rules), priority, due_at):
+            raise ValueError("Job gagal disimpan")
+        self._wake.set()
+        return job_id
+
+    def enqueue_due(self, now: float = None) -> List[str]:
+        """
+        Masukkan job dari jadwal yang jatuh tempo.
+
+        Args:
+            now: Unix timestamp acuan. Default sekarang.
+
+        Returns:
+            List ID job yang dimasukkan.
+        """
+        now = time.time() if now is None else now
+        job_ids = []
+        for schedule in Schedule.get_all(due_before=now):
+            try:
+                next_run_at = CronSchedule(schedule["cron"]).next_timestamp(now)
+            except ValueError as e:
+                logger.error(f"Jadwal {schedule['name']} tidak valid, dinonaktifkan: {e}")
+                Schedule.set_enabled(schedule["schedule_id"], False)
+                continue
+
+            job_id = Job.enqueue_scheduled(schedule, uuid.uuid4().hex[:12], next_run_at)
+            if job_id:
+                job_ids.append(job_id)
+                logger.info(f"Jadwal {schedule['name']}: job {job_id} masuk antrian")
+            else:
+                logger.info(f"Jadwal {schedule['name']}: job sebelumnya belum selesai, dilewati")
+        return job_ids
+
+    def prioritize(self, jobs: List[Dict[str, Any]], budget: int) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Urutkan job sesuai nilai dan pilih yang muat di budget quota.
+
+        Args:
+            jobs: Job yang menunggu (format Job.get).
+            budget: Unit quota yang boleh dipakai job baru.
+
+        Returns:
+            Tuple (admitted, deferred). admitted urut prioritas; setiap job
+            berisi tambahan estimate (HuntPlanner.expected_yield) dan score.
+        """
+        history = self.planner.pass_history()
+        for job in jobs:
+            params = job["params"]
+            job["estimate"] = self.planner.expected_yield(
+                job_searches(params), params.get("target_count") or Config.TARGET_VIDEO_COUNT, history
+            )
+            job["score"] = job["priority"] * job["estimate"]["yield_per_unit"]
+
+        admitted, deferred = [], []
+        for job in sorted(jobs, key=lambda job: (-job["score"], job["due_at"])):
+            if job["estimate"]["units"] <= budget:
+                admitted.append(job)
+                budget -= job["estimate"]["units"]
+            else:
+                deferred.append(job)
+        return admitted, deferred
+
+    def dispatch(self, now: float = None) -> Dict[str, int]:
+        """
+        Jalankan job yang menunggu sesuai prioritas dan sisa quota.
+
+        Args:
+            now: Unix timestamp acuan. Default sekarang.
+
+        Returns:
+            Dict pending, started, deferred.
+        """
+        expired = Job.expire_leases(Config.SCHEDULER_MAX_ATTEMPTS, now)
+        if expired["requeued"] or expired["failed"]:
+            logger.warning(
+                f"Lease habis: {expired['requeued']} job dikembalikan ke antrian, "
+                f"{expired['failed']} job gagal (batas percobaan)"
+            )
+
+        jobs = Job.pending(now)
+        if not jobs:
+            return {"pending": 0, "started": 0, "deferred": 0}
+
+        with self._lock:
+            free = self.workers - len(self._running)
+        # Estimasi job yang sedang berjalan di semua worker ikut dipesan
+        reserved = Job.running_units(now)
+        budget = self.youtube_api.remaining_quota() - Config.SCHEDULER_RESERVE_UNITS - reserved
+        admitted, deferred = self.prioritize(jobs, budget)
+
+        # Estimasi disimpan untuk semua job; job yang dijalankan tetap queued
+        # sampai diambil worker
+        Job.update_estimates(
+            [(Job.STATUS_QUEUED, job["estimate"]["units"], job["estimate"]["yield_per_unit"], job["job_id"])
+             for job in admitted] +
+            [(Job.STATUS_DEFERRED, job["estimate"]["units"], job["estimate"]["yield_per_unit"], job["job_id"])
+             for job in deferred]
+        )
+        newly_deferred = [job for job in deferred if job["status"] != Job.STATUS_DEFERRED]
+        if newly_deferred:
+            logger.info(
+                f"{len(newly_deferred)} job ditunda (budget quota {max(0, budget)} unit): "
+                + ", ".join(f"{job['job_id']} (~{job['estimate']['units']} unit)" for job in newly_deferred)
+            )
+
+        started = 0
+        for job in admitted[:max(0, free)]:
+            if self._start_job(job):
+                started += 1
+        return {"pending": len(jobs), "started": started, "deferred": len(deferred)}
+
+    def tick(self, now: float = None) -> Dict[str, int]:
+        """
+        Satu putaran scheduler: masukkan job jatuh tempo lalu dispatch.
+
+        Args:
+            now: Unix timestamp acuan. Default sekarang.
+
+        Returns:
+            Dict enqueued ditambah hasil dispatch().
+        """
+        enqueued = self.enqueue_due(now)
+        return {"enqueued": len(enqueued), **self.dispatch(now)}
+
+    def _start_job(self, job: Dict[str, Any]) -> bool:
+        """Ambil job dari antrian (lease) dan jalankan di worker pool."""
+        if not Job.claim(job["job_id"], self.worker_id, self.lease_seconds):
+            return False
+
+        with self._lock:
+            self._running[job["job_id"]] = None
+            executor = self._executor
+        logger.info(
+            f"Job {job['job_id']} dimulai: {', '.join(job['params']['queries'])} "
+            f"(~{job['estimate']['units']} unit, {job['estimate']['yield_per_unit']:.3f} video/unit)"
+        )
+
+        if executor is None:
+            # Tanpa start(): jalankan langsung tanpa heartbeat (testing);
+            # job lebih lama dari lease bisa diambil worker lain
+            self._run_job(job)
+        else:
+            executor.submit(self._run_job, job)
+        return True
+
+    def _run_job(self, job: Dict[str, Any]) -> None:
+        """
+        Jalankan satu job (di worker thread) dan catat hasilnya.
+
+        Job yang sudah punya run interrupted (atau run dari worker yang
+        mati) melanjutkan run itu. Quota habis menunda job sampai quota
+        di-reset; error lain dicoba lagi sampai SCHEDULER_MAX_ATTEMPTS.
+        Hasil hanya dicatat jika worker ini masih memegang lease job.
+        """
+        job_id = job["job_id"]
+        hunter = None
+
+        def finish(status: str, error: str = None, due_at: float = None) -> None:
+            run_id = hunter.run_id if hunter else None
+            with self._lease_lock:
+                recorded = Job.finish(job_id, status, run_id, error, due_at, self.worker_id)
+                with self._lock:
+                    self._running.pop(job_id, None)
+            if not recorded:
+                logger.warning(f"Job {job_id}: lease sudah diambil worker lain, hasil ({status}) tidak dicatat")
+
+        try:
+            hunter = HunterModule()
+            with self._lock:
+                self._running[job_id] = hunter
+
+            run = Run.get(job["run_id"]) if job["run_id"] else None
+            if run and run["status"] in Run.RESUMABLE:
+                hunter.resume_run(run["run_id"])
+            else:
+                hunter.scrape_batch(**job["params"])
+            finish(Job.STATUS_COMPLETED)
+            logger.info(
+                f"Job {job_id} selesai: run {hunter.run_id}, "
+                f"{hunter.stats.get('saved', {}).get('inserted', 0)} video baru"
+            )
+
+        except QuotaExceededException as e:
+            retry_at = next_quota_reset().timestamp()
+            finish(Job.STATUS_DEFERRED, str(e), retry_at)
+            logger.warning(f"Job {job_id} ditunda sampai quota di-reset ({time.ctime(retry_at)}): {e}")
+
+        except ValueError as e:
+            finish(Job.STATUS_FAILED, str(e))
+            logger.error(f"Job {job_id} gagal (parameter tidak valid): {e}")
+
+        except Exception as e:
+            if job["attempts"] + 1 >= Config.SCHEDULER_MAX_ATTEMPTS:
+                finish(Job.STATUS_FAILED, str(e))
+                logger.error(f"Job {job_id} gagal setelah {job['attempts'] + 1} percobaan: {e}")
+            else:
+                retry_at = time.time() + Config.SCHEDULER_RETRY_DELAY * (job["attempts"] + 1)
+                finish(Job.STATUS_QUEUED, str(e), retry_at)
+                logger.warning(f"Job {job_id} error, dicoba lagi {time.ctime(retry_at)}: {e}")
+
+        finally:
+            with self._lock:
+                self._running.pop(job_id, None)
+            self._wake.set()
+            self._beat.set()
+
+    def heartbeat(self) -> List[str]:
+        """
+        Perpanjang lease semua job yang berjalan di proses ini.
+
+        run_id setiap job ikut dicatat begitu run-nya dibuat, supaya worker
+        yang mengambil alih job melanjutkan run yang sama.
+
+        Returns:
+            List ID job yang lease-nya sudah hilang (diambil worker lain).
+        """
+        with self._lease_lock:
+            with self._lock:
+                jobs = [(job_id, hunter.run_id if hunter else None) for job_id, hunter in self._running.items()]
+            if not jobs:
+                return []
+            lost = Job.heartbeat(self.worker_id, jobs, self.lease_seconds)
+        for job_id in lost:
+            logger.warning(f"Lease job {job_id} hilang (heartbeat terlambat?), hasilnya tidak akan dicatat")
+        return lost
+
+    @property
+    def running(self) -> bool:
+        """True jika thread scheduler sedang berjalan."""
+        with self._lock:
+            return self._thread is not None and self._thread.is_alive()
+
+    def running_jobs(self) -> List[str]:
+        """ID job yang sedang berjalan di proses ini."""
+        with self._lock:
+            return list(self._running)
+
+    def start(self) -> None:
+        """Jalankan scheduler dan heartbeat di background thread (idempotent)."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="hunt-job")
+            self._thread = threading.Thread(target=self._run, name="hunt-scheduler", daemon=True)
+            self._thread.start()
+            if self._heartbeat_thread is None or not self._heartbeat_thread.is_alive():
+                self._heartbeat_thread = threading.Thread(
+                    target=self._heartbeat_loop, name="hunt-heartbeat", daemon=True
+                )
+                self._heartbeat_thread.start()
+        logger.info(f"Scheduler {self.worker_id} dimulai")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """
+        Hentikan scheduler.
+
+        Tidak ada job baru yang diambil. Job yang sedang berjalan tidak
+        dihentikan paksa: lease-nya tetap diperpanjang sampai job selesai
+        (proses menunggu worker thread sebelum keluar). Kalau proses
+        dimatikan paksa, lease habis dan job diambil worker lain.
+
+        Args:
+            timeout: Detik menunggu thread scheduler berhenti.
+        """
+        self._stop.set()
+        self._wake.set()
+        self._beat.set()
+        with self._lock:
+            thread, executor = self._thread, self._executor
+            self._executor = None
+        if thread is not None:
+            thread.join(timeout)
+        if executor is not None:
+            executor.shutdown(wait=False)
+        logger.info("Scheduler dihentikan")
+
+    def _run(self) -> None:
+        """Loop background: tick, tunggu interval (atau job selesai), ulangi."""
+        while not self._stop.is_set():
+            self._wake.clear()
+            try:
+                self.tick()
+            except Exception as e:
+                logger.error(f"Tick scheduler gagal: {e}")
+
+            self._wake.wait(self.poll_interval)
+
+    def _heartbeat_loop(self) -> None:
+        """Loop heartbeat: jalan sampai scheduler berhenti dan semua job selesai."""
+        while True:
+            with self._lock:
+                idle = not self._running
+            if self._stop.is_set() and idle:
+                return
+
+            self._beat.clear()
+            try:
+                self.heartbeat()
+            except Exception as e:
+                logger.error(f"Heartbeat gagal: {e}")
+            self._beat.wait(self.heartbeat_interval)
+
+
+# Singleton instance
+_scheduler_instance: Optional[HuntScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler() -> HuntScheduler:
+    """Get or create HuntScheduler singleton instance."""
+    global _scheduler_instance
+    with _scheduler_lock:
+        if _scheduler_instance is None:
+            _scheduler_instance = HuntScheduler()
+        return _scheduler_instance
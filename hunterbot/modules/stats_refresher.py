@@ -0,0 +1,283 @@
+"""
+Stats Refresher - Refresh statistik video berkala dan VPH dari time series.
+
+Video yang sudah tersimpan dipoll ulang lewat videos.list part=statistics
+(1 unit per 50 video) secara berkala. Setiap poll menambah snapshot
+(video_id, ts, views, likes) ke tabel video_stats, lalu VPH sesaat dan
+akselerasinya dihitung dari selisih antar snapshot (numpy, vectorized).
+Breakout bisa diranking dari poll murah ini tanpa search 100 unit.
+"""
+
+import asyncio
+import threading
+import time
+import uuid
+from datetime import datetime, timezone, timedelta
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+
+from hunterbot.api.youtube_api import YouTubeAPI
+from hunterbot.config import Config
+from hunterbot.database.models import Video, VideoStat
+from hunterbot.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def compute_velocity(rows: List[tuple]) -> Dict[str, Dict[str, Any]]:
+    """
+    Hitung VPH dan akselerasi per video dari snapshot.
+
+    VPH = selisih views / selisih jam antara dua snapshot terakhir.
+    Akselerasi = perubahan VPH dua interval terakhir per jam (views/jam²),
+    diukur antar titik tengah interval. Semua video dihitung sekaligus
+    dengan operasi array (tanpa loop per video).
+
+    Args:
+        rows: List (video_id, ts, views, likes), urut per video lalu ts
+            (format VideoStat.series).
+
+    Returns:
+        Dict video_id -> {vph, acceleration, views, likes, snapshots,
+        last_ts}. vph None jika snapshot < 2, acceleration None jika < 3.
+    """
+    if not rows:
+        return {}
+
+    count = len(rows)
+    ids = np.array([row[0] for row in rows], dtype=object)
+    ts = np.fromiter((row[1] for row in rows), dtype=np.float64, count=count)
+    views = np.fromiter((row[2] for row in rows), dtype=np.float64, count=count)
+    likes = np.fromiter((row[3] for row in rows), dtype=np.int64, count=count)
+    hours = ts / 3600.0
+
+    # Batas grup per video (rows sudah urut video_id)
+    same = ids[1:] == ids[:-1]
+    starts = np.flatnonzero(np.r_[True, ~same])
+    ends = np.r_[starts[1:], count] - 1
+    snapshots = ends - starts + 1
+
+    # Rate antar snapshot berurutan; pasangan lintas video di-mask NaN
+    delta_hours = np.diff(hours)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rate = np.where(same & (delta_hours > 0), np.diff(views) / delta_hours, np.nan)
+
+    vph = np.full(len(starts), np.nan)
+    has_two = snapshots >= 2
+    vph[has_two] = rate[ends[has_two] - 1]
+
+    acceleration = np.full(len(starts), np.nan)
+    has_three = snapshots >= 3
+    last, prev = ends[has_three], ends[has_three] - 2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        acceleration[has_three] = (
+            (rate[last - 1] - rate[last - 2]) / ((hours[last] - hours[prev]) / 2)
+        )
+
+    return {
+        ids[start]: {
+            "vph": None if np.isnan(vph[i]) else round(float(vph[i]), 2),
+            "acceleration": None if np.isnan(acceleration[i]) else round(float(acceleration[i]), 2),
+            "views": int(views[end]),
+            "likes": int(likes[end]),
+            "snapshots": int(snapshots[i]),
+            "last_ts": float(ts[end]),
+        }
+        for i, (start, end) in enumerate(zip(starts, ends))
+    }
+
+
+class StatsRefresher:
+    """
+    Job refresh statistik video berkala (background thread).
+
+    Poll berikutnya dijadwalkan STATS_REFRESH_INTERVAL detik setelah
+    snapshot terakhir di database, jadi restart app tidak memicu poll
+    ekstra.
+    """
+
+    def __init__(
+        self,
+        youtube_api: YouTubeAPI = None,
+        interval: float = None,
+        track_days: int = None
+    ):
+        """
+        Inisialisasi refresher.
+
+        Args:
+            youtube_api: Client YouTube. Default client baru dari Config.
+            interval: Detik antar poll. Default dari Config.
+            track_days: Umur upload maksimal video yang dipoll. Default dari Config.
+        """
+        self.youtube_api = youtube_api or YouTubeAPI()
+        self.interval = interval if interval is not None else Config.STATS_REFRESH_INTERVAL
+        self.track_days = track_days if track_days is not None else Config.STATS_TRACK_DAYS
+
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        logger.info(f"Stats refresher diinisialisasi (interval {self.interval}s)")
+
+    def tracked_video_ids(self) -> List[str]:
+        """
+        Video yang dipoll: yang diupload dalam track_days hari terakhir.
+
+        Returns:
+            List video ID.
+        """
+        since = datetime.now(timezone.utc) - timedelta(days=self.track_days)
+        return Video.ids_uploaded_since(since.strftime("%Y-%m-%dT%H:%M:%SZ"))
+
+    def refresh(self, video_ids: List[str] = None) -> Dict[str, int]:
+        """
+        Poll statistik sekali dan simpan snapshot-nya.
+
+        Args:
+            video_ids: Video yang dipoll. Default tracked_video_ids().
+
+        Returns:
+            Dict tracked, recorded, failed, missing (video hilang/privat).
+
+        Raises:
+            QuotaExceededException: Jika quota habis.
+        """
+        if video_ids is None:
+            video_ids = self.tracked_video_ids()
+
+        result = {"tracked": len(video_ids), "recorded": 0, "failed": 0, "missing": 0}
+        if not video_ids:
+            logger.info("Refresh statistik: tidak ada video yang dilacak")
+            return result
+
+        self.youtube_api.run_id = f"stats-{uuid.uuid4().hex[:8]}"
+        ts = time.time()
+        snapshots, failed_ids = asyncio.run(self._poll(video_ids))
+
+        result["recorded"] = VideoStat.record_many(snapshots, ts)
+        result["failed"] = len(failed_ids)
+        result["missing"] = len(video_ids) - len(snapshots) - len(failed_ids)
+
+        VideoStat.prune(ts - Config.STATS_RETENTION_DAYS * 86400)
+
+        logger.info(
+            f"Refresh statistik: {result['recorded']}/{len(video_ids)} video, "
+            f"{result['failed']} gagal, {result['missing']} hilang"
+        )
+        return result
+
+    async def _poll(self, video_ids: List[str]) -> Tuple[List[tuple], List[str]]:
+        """Ambil statistik semua video (batch concurrent)."""
+        snapshots: List[tuple] = []
+        failed_ids: List[str] = []
+
+        async for batch in self.youtube_api.iter_video_statistics_async(video_ids):
+            snapshots.extend(batch)
+            failed_ids.extend(batch.failed_ids)
+
+        return snapshots, failed_ids
+
+    def velocity(
+        self,
+        video_ids: List[str] = None,
+        window_hours: float = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        VPH dan akselerasi dari snapshot dalam window terakhir.
+
+        Args:
+            video_ids: Filter video ID. Default semua video.
+            window_hours: Umur snapshot yang dipakai. Default dari Config.
+
+        Returns:
+            Dict dari compute_velocity().
+        """
+        if window_hours is None:
+            window_hours = Config.STATS_VELOCITY_WINDOW_HOURS
+        since = time.time() - window_hours * 3600
+        return compute_velocity(VideoStat.series(video_ids, since))
+
+    def breakouts(self, limit: int = 20, by: str = "acceleration") -> List[Dict[str, Any]]:
+        """
+        Ranking video yang paling cepat naik.
+
+        Args:
+            limit: Jumlah video.
+            by: Kunci ranking: acceleration (default) atau vph. Video tanpa
+                nilai kunci itu ditaruh paling bawah.
+
+        Returns:
+            List dict compute_velocity() ditambah video_id.
+
+        Raises:
+            ValueError: Jika by tidak dikenal.
+        """
+        if by not in ("acceleration", "vph"):
+            raise ValueError(f"Kunci ranking tidak dikenal: {by}")
+
+        rows = [{"video_id": video_id, **data} for video_id, data in self.velocity().items()]
+        rows.sort(key=lambda row: (row[by] is not None, row[by] or 0, row["vph"] or 0), reverse=True)
+        return rows[:limit]
+
+    @property
+    def running(self) -> bool:
+        """True jika thread refresh sedang berjalan."""
+        with self._lock:
+            return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Jalankan refresh berkala di background thread (idempotent)."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="stats-refresher", daemon=True)
+            self._thread.start()
+        logger.info("Stats refresher dimulai")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """
+        Hentikan thread refresh.
+
+        Args:
+            timeout: Detik menunggu poll yang sedang berjalan selesai.
+        """
+        self._stop.set()
+        with self._lock:
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        logger.info("Stats refresher dihentikan")
+
+    def _run(self) -> None:
+        """Loop background: tunggu jadwal, poll, ulangi."""
+        # Percobaan terakhir ikut dihitung: poll yang gagal atau tanpa video
+        # tidak menambah snapshot, tapi tetap harus menunggu satu interval
+        last_attempt = 0.0
+        while True:
+            last_poll = max(VideoStat.last_poll_at() or 0.0, last_attempt)
+            wait = max(0.0, last_poll + self.interval - time.time())
+            if self._stop.wait(wait):
+                return
+
+            last_attempt = time.time()
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.error(f"Refresh statistik gagal: {e}")
+
+
+# Singleton instance
+_refresher_instance: Optional[StatsRefresher] = None
+_refresher_lock = threading.Lock()
+
+
+def get_stats_refresher() -> StatsRefresher:
+    """Get or create StatsRefresher singleton instance."""
+    global _refresher_instance
+    with _refresher_lock:
+        if _refresher_instance is None:
+            _refresher_instance = StatsRefresher()
+        return _refresher_instance
@@ -381,8 +381,8 @@ class HunterbotWindow(ctk.CTk):
             # Jalankan scraping dengan target 100 videos (sesuai MVP)
             stats = hunter.scrape_videos(query, target_count=100)
 
-            # Tampilkan hasil
-            self._display_results()
+            # Tampilkan hasil run ini saja (database menyimpan semua run)
+            self._display_results(stats.get("run_id"))
 
             passed_count = stats.get("passed_all", 0)
             total_scraped = stats.get("total_scraped", 0)
@@ -425,9 +425,14 @@ class HunterbotWindow(ctk.CTk):
             self.log_viewer.insert("end", "Logs telah di-reset. Siap untuk logging baru.\n\n")
             logger.info("Log viewer di-reset oleh user")
 
-    def _display_results(self) -> None:
-        """Tampilkan hasil scraping ke text widget."""
-        videos = Video.get_all(limit=100)  # UPDATED: Tampilkan sampai 100 video
+    def _display_results(self, run_id: Optional[str] = None) -> None:
+        """
+        Tampilkan hasil scraping ke text widget.
+
+        Args:
+            run_id: Tampilkan hanya video hasil run ini. Default semua video.
+        """
+        videos = Video.get_all(limit=100, run_id=run_id)  # UPDATED: Tampilkan sampai 100 video
 
         if not videos:
             self.results_text.delete("1.0", "end")
@@ -0,0 +1,148 @@
+"""
+Ekspresi cron sederhana untuk jadwal hunt.
+
+Format 5 field: menit jam tanggal bulan hari-minggu, dengan waktu lokal
+mesin. Setiap field mendukung *, angka, range (a-b), list (a,b) dan step
+(*/n, a-b/n). Hari minggu 0-6 dimulai Minggu (7 juga Minggu). Alias:
+@hourly, @daily, @weekly, @monthly.
+
+Seperti cron, jika tanggal dan hari-minggu sama-sama dibatasi, jadwal
+jalan kalau salah satunya cocok.
+"""
+
+from datetime import datetime, timedelta
+from typing import FrozenSet
+
+ALIASES = {
+    "@hourly": "0 * * * *",
+    "@daily": "0 0 * * *",
+    "@weekly": "0 0 * * 0",
+    "@monthly": "0 0 1 * *",
+}
+
+# (nama, minimal, maksimal) setiap field
+FIELDS = (
+    ("menit", 0, 59),
+    ("jam", 0, 23),
+    ("tanggal", 1, 31),
+    ("bulan", 1, 12),
+    ("hari", 0, 7),
+)
+
+# Batas pencarian jadwal berikutnya (ekspresi seperti 30 Februari tidak pernah cocok)
+MAX_SEARCH_YEARS = 5
+
+
+class CronSchedule:
+    """
+    Jadwal dari ekspresi cron.
+    """
+
+    def __init__(self, expression: str):
+        """
+        Parse ekspresi cron.
+
+        Args:
+            expression: Ekspresi 5 field atau alias.
+
+        Raises:
+            ValueError: Jika ekspresi tidak valid.
+        """
+        self.expression = expression.strip()
+        fields = ALIASES.get(self.expression, self.expression).split()
+        if len(fields) != len(FIELDS):
+            raise ValueError(f"Ekspresi cron harus {len(FIELDS)} field: {expression!r}")
+
+        minutes, hours, days, months, weekdays = (
+            self._parse_field(text, name, low, high)
+            for text, (name, low, high) in zip(fields, FIELDS)
+        )
+        self.minutes = minutes
+        self.hours = hours
+        self.days = days
+        self.months = months
+        self.weekdays = frozenset(day % 7 for day in weekdays)
+        self._any_day = fields[2] == "*"
+        self._any_weekday = fields[4] == "*"
+
+    @staticmethod
+    def _parse_field(text: str, name: str, low: int, high: int) -> FrozenSet[int]:
+        """
+        Parse satu field cron.
+
+        Raises:
+            ValueError: Jika field tidak valid atau di luar range.
+        """
+        values = set()
+        for part in text.split(","):
+            base, _, step_text = part.partition("/")
+            try:
+                step = int(step_text) if step_text else 1
+                if base == "*":
+                    start, end = low, high
+                elif "-" in base:
+                    start, end = (int(value) for value in base.split("-", 1))
+                else:
+                    start = int(base)
+                    end = high if step_text else start
+            except ValueError:
+                raise ValueError(f"Field {name} cron tidak valid: {text!r}")
+
+            if step < 1 or start < low or end > high or start > end:
+                raise ValueError(f"Field {name} cron di luar range {low}-{high}: {text!r}")
+            values.update(range(start, end + 1, step))
+        return frozenset(values)
+
+    def _day_matches(self, moment: datetime) -> bool:
+        """True jika tanggal/hari-minggu cocok (aturan OR cron)."""
+        day = moment.day in self.days
+        weekday = (moment.weekday() + 1) % 7 in self.weekdays
+        if self._any_day or self._any_weekday:
+            return day and weekday
+        return day or weekday
+
+    def next_after(self, moment: datetime) -> datetime:
+        """
+        Waktu jadwal berikutnya setelah moment.
+
+        Args:
+            moment: Waktu acuan (waktu lokal, naive).
+
+        Returns:
+            Menit pertama setelah moment yang cocok dengan jadwal.
+
+        Raises:
+            ValueError: Jika jadwal tidak pernah cocok.
+        """
+        candidate = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = candidate.year + MAX_SEARCH_YEARS
+
+        while candidate.year <= limit:
+            if candidate.month not in self.months:
+                year, month = divmod(candidate.month, 12)
+                candidate = candidate.replace(year=candidate.year + year, month=month + 1, day=1, hour=0, minute=0)
+            elif not self._day_matches(candidate):
+                candidate = candidate.replace(hour=0, minute=0) + timedelta(days=1)
+            elif candidate.hour not in self.hours:
+                candidate = candidate.replace(minute=0) + timedelta(hours=1)
+            elif candidate.minute not in self.minutes:
+                candidate += timedelta(minutes=1)
+            else:
+                return candidate
+
+        raise ValueError(f"Jadwal cron tidak pernah cocok: {self.expression!r}")
+
+    def next_timestamp(self, after: float) -> float:
+        """
+        Seperti next_after, dengan Unix timestamp.
+
+        Args:
+            after: Unix timestamp acuan.
+
+        Returns:
+            Unix timestamp jadwal berikutnya.
+        """
+        return self.next_after(datetime.fromtimestamp(after)).timestamp()
+
+    def __str__(self) -> str:
+        return self.expression
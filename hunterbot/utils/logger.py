@@ -8,6 +8,7 @@ import logging
 import sys
 from pathlib import Path
 from datetime import datetime
+from typing import TextIO
 from hunterbot.config import Config
 from hunterbot import config as config_module
 
@@ -34,13 +35,15 @@ class IndonesianFormatter(logging.Formatter):
         return super().format(record)
 
 
-def setup_logging(log_level: str = None) -> None:
+def setup_logging(log_level: str = None, stream: TextIO = None) -> None:
     """
     Setup logging untuk seluruh aplikasi.
 
     Args:
         log_level: Level logging (DEBUG, INFO, WARNING, ERROR, CRITICAL).
                    Default dari Config.LOG_LEVEL.
+        stream: Stream log console. Default sys.stdout (CLI memakai
+                sys.stderr supaya stdout bersih untuk output JSONL).
     """
     if log_level is None:
         log_level = Config.LOG_LEVEL
@@ -59,7 +62,7 @@ def setup_logging(log_level: str = None) -> None:
     file_handler.setFormatter(IndonesianFormatter())
 
     # Buat console handler
-    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler = logging.StreamHandler(stream or sys.stdout)
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(IndonesianFormatter())
 
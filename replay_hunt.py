@@ -0,0 +1,112 @@
+"""
+Rekam atau putar ulang hunt lengkap (scrape_videos) lewat cassette.
+
+Mode record menjalankan hunt ke YouTube asli (butuh API key) dan
+merekam setiap response ke cassette. Mode replay menjalankan hunt yang
+sama secara offline dari cassette, tanpa API key dan network, sehingga
+bisa dipakai untuk profiling dan membandingkan performa sebelum/sesudah
+perubahan kode.
+
+Hunt selalu memakai database sementara (data video di database utama
+tidak tersentuh) dan response cache dimatikan supaya semua request
+lewat transport. Early stop juga dimatikan karena keputusannya
+bergantung timing, sehingga request replay bisa berbeda dari rekaman.
+
+Contoh:
+    python replay_hunt.py record --query "american truck" --target 50
+    python replay_hunt.py replay --query "american truck" --target 50
+    python replay_hunt.py replay --latency 0.2 --error-rate 0.05
+    python replay_hunt.py replay --profile
+"""
+
+import argparse
+import cProfile
+import pstats
+import tempfile
+import time
+from pathlib import Path
+
+
+def main():
+    """Jalankan hunt dalam mode record atau replay."""
+    parser = argparse.ArgumentParser(description="Record/replay hunt YouTube")
+    parser.add_argument("mode", choices=["record", "replay"], help="Mode transport")
+    parser.add_argument("--query", default="american", help="Kata kunci hunt")
+    parser.add_argument("--target", type=int, default=50, help="Target jumlah video")
+    parser.add_argument("--cassette", default=None, help="Path cassette (.jsonl.gz)")
+    parser.add_argument("--latency", type=float, default=0.0, help="Latency replay per request (detik)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Peluang error 503 saat replay (0-1)")
+    parser.add_argument("--seed", type=int, default=1, help="Seed injeksi error")
+    parser.add_argument("--profile", action="store_true", help="Tampilkan profil cProfile")
+    args = parser.parse_args()
+
+    from hunterbot.config import Config
+
+    workdir = tempfile.mkdtemp(prefix="hunterbot_replay_")
+    Config.DATABASE_PATH = str(Path(workdir) / "hunterbot.db")
+    Config.YOUTUBE_CACHE_ENABLED = False
+    # Early stop bergantung timing: request replay harus sama persis dengan rekaman
+    Config.SEARCH_EARLY_STOP = False
+    cassette_path = args.cassette or Config.YOUTUBE_CASSETTE_PATH
+
+    from hunterbot.api.transport import Cassette, RecordingAdapter, ReplayAdapter
+    from hunterbot.api.youtube_api import YouTubeAPI
+    from hunterbot.database.schema import init_database
+    from hunterbot.modules.hunter import HunterModule
+    from hunterbot.modules.planner import HuntPlanner
+
+    init_database().close()
+
+    if args.mode == "record":
+        if Path(cassette_path).exists():
+            Path(cassette_path).unlink()
+        transport = RecordingAdapter(Cassette(cassette_path))
+        api_key = None
+    else:
+        transport = ReplayAdapter(
+            Cassette(cassette_path),
+            latency=args.latency,
+            error_rate=args.error_rate,
+            seed=args.seed
+        )
+        api_key = "replay"
+        # Replay tidak dibatasi rate limit asli
+        Config.YOUTUBE_REQUESTS_PER_SECOND = 1000.0
+
+    hunter = HunterModule(api_key)
+    hunter.youtube_api = YouTubeAPI(api_key, transport=transport)
+    hunter.planner = HuntPlanner(hunter.youtube_api)
+
+    print("=" * 50)
+    print(f"HUNT {args.mode.upper()}: query='{args.query}', target={args.target}")
+    print(f"Cassette: {cassette_path}")
+    print("=" * 50)
+
+    profiler = cProfile.Profile() if args.profile else None
+    start = time.perf_counter()
+    if profiler:
+        profiler.enable()
+
+    stats = hunter.scrape_videos(args.query, target_count=args.target)
+
+    if profiler:
+        profiler.disable()
+    elapsed = time.perf_counter() - start
+
+    print(f"Waktu: {elapsed:.2f}s")
+    print(f"Discraping: {stats['total_scraped']}, lulus filter: {stats['passed_all']}")
+    print(f"Quota: {stats['quota_units']} unit, gagal: {len(stats.get('failed_ids', []))} video")
+
+    if args.mode == "record":
+        transport.close()
+        print(f"Direkam: {transport.cassette.recorded} interaksi")
+    else:
+        print(f"Replay: {transport.stats()}")
+
+    if profiler:
+        print()
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(25)
+
+
+if __name__ == "__main__":
+    main()